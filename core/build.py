@@ -0,0 +1,372 @@
+"""
+Headless mod builder - build .bsproject files without the GUI
+
+Command line:
+    python -m core.build project.bsproject --out dir --jobs 8
+
+Progress and results are written to stdout as JSON lines, one object per
+line with an "event" field (start, progress, done, error). Everything else
+the build prints goes to stderr. The exit code tells how the build ended
+(see the EXIT_* constants).
+
+With --watch the project is built once and then rebuilt whenever one of
+its DDS, .pc or .jpg files (or the project file) changes, until Ctrl+C.
+With --plan nothing is built; a "plan" event gives the estimated size,
+entry count and build time and lists problems in the project (exit code
+EXIT_INVALID_PROJECT when there are any).
+With --reproducible the ZIP depends only on the project's content, a
+manifest of entry hashes is saved as <mod>.zip.manifest.json and a ZIP
+that would not change is left in place ("unchanged" in the done event).
+
+Python API:
+    from core.build import build_project, watch_project
+    zip_path = build_project("project.bsproject", output_dir="out", jobs=8)
+    watch_project("project.bsproject", output_dir="out")
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+from core.compression import PRESETS, DEFAULT_PRESET
+from core.build_report import BuildReport
+from core.cancel import BuildCancelled
+from core.watch import FileWatcher, project_watch_paths, affected_skins, DEFAULT_DEBOUNCE
+from core.file_ops import (
+    generate_multi_skin_mod, get_beamng_mods_path, WORKER_LOG_TO_STDERR_ENV
+)
+
+EXIT_OK = 0
+EXIT_BUILD_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INVALID_PROJECT = 3
+EXIT_OUTPUT_EXISTS = 4
+EXIT_MISSING_FILES = 5
+EXIT_INTERRUPTED = 130
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class InvalidProjectError(ValueError):
+    """Raised when a project file cannot be read or has no cars"""
+
+def load_project(project_path):
+    """Read a .bsproject file and return its project data"""
+    try:
+        with open(project_path, "r", encoding="utf-8") as f:
+            project_data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise InvalidProjectError(f"Cannot read project {project_path}: {e}") from e
+
+    if not isinstance(project_data, dict) or "cars" not in project_data:
+        raise InvalidProjectError(f"Invalid project file: {project_path}")
+
+    if not project_data.get("mod_name"):
+        project_data["mod_name"] = os.path.splitext(os.path.basename(project_path))[0]
+
+    return project_data
+
+def default_vehicles_root():
+    """vehicles/ in the working directory, else the one next to the app"""
+    cwd_vehicles = os.path.join(os.getcwd(), "vehicles")
+    if os.path.isdir(cwd_vehicles):
+        return cwd_vehicles
+    return os.path.join(APP_ROOT, "vehicles")
+
+def build_project(
+    project,
+    output_dir=None,
+    jobs=1,
+    compression_preset=DEFAULT_PRESET,
+    streaming=True,
+    use_cache=True,
+    cache_dir=None,
+    cache_size_mb=None,
+    vehicles_root=None,
+    overwrite=False,
+    progress_callback=None,
+    report=None,
+    build_cache=None,
+    unpacked=False,
+    cancel_token=None,
+    reproducible=False
+):
+    """Build a mod from a project file path or project data dict
+
+    Returns the path of the written ZIP, or of the synced folder under
+    <output>/unpacked/ when unpacked is True. Raises InvalidProjectError,
+    FileExistsError (output exists and overwrite is False),
+    FileNotFoundError (missing vehicle template) or whatever the build
+    itself raises. Pass a BuildReport as report to get the build's
+    timings and size breakdown back, and a BuildCache as build_cache to
+    share one cache between several builds. Cancelling cancel_token stops
+    the build with BuildCancelled. A reproducible build gives the same ZIP
+    for the same inputs and keeps an existing identical ZIP untouched
+    (see core.manifest).
+    """
+    project_data = load_project(project) if isinstance(project, str) else project
+
+    if not project_data.get("cars"):
+        raise InvalidProjectError("Project has no cars")
+
+    output_dir = output_dir or get_beamng_mods_path()
+    os.makedirs(output_dir, exist_ok=True)
+
+    if not use_cache or not streaming:
+        build_cache = None
+    elif build_cache is None:
+        from core.build_cache import BuildCache, DEFAULT_MAX_BYTES
+        max_bytes = cache_size_mb * 1024 * 1024 if cache_size_mb else DEFAULT_MAX_BYTES
+        build_cache = BuildCache(cache_dir, max_bytes=max_bytes)
+
+    return generate_multi_skin_mod(
+        project_data,
+        output_path=output_dir,
+        progress_callback=progress_callback,
+        jobs=jobs,
+        streaming=streaming,
+        compression_preset=compression_preset,
+        build_cache=build_cache,
+        vehicles_root=vehicles_root or default_vehicles_root(),
+        report=report,
+        overwrite=overwrite,
+        unpacked=unpacked,
+        cancel_token=cancel_token,
+        reproducible=reproducible
+    )
+
+def _output_size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root_dir, file))
+        for root_dir, _, files in os.walk(path)
+        for file in files
+    )
+
+def watch_project(project_path, debounce=DEFAULT_DEBOUNCE, event_callback=None, **build_options):
+    """Build a project, then rebuild it whenever its source files change
+
+    Blocks until interrupted with Ctrl+C. build_options go to build_project;
+    watch builds always stream through the build cache and replace the
+    previous ZIP, so a rebuild only renders the skins whose files changed.
+    event_callback(event, **fields) is called with "done", "change" and
+    "error" events. Failed rebuilds are reported and watching continues.
+    """
+    emit = event_callback or (lambda event, **fields: None)
+    project_path = os.path.abspath(project_path)
+    project = {"data": load_project(project_path)}
+
+    from core.build_cache import BuildCache, DEFAULT_MAX_BYTES
+    cache_size_mb = build_options.pop("cache_size_mb", None)
+    build_cache = BuildCache(
+        build_options.pop("cache_dir", None),
+        max_bytes=cache_size_mb * 1024 * 1024 if cache_size_mb else DEFAULT_MAX_BYTES
+    )
+    build_options.update(streaming=True, use_cache=True, overwrite=True, build_cache=build_cache)
+
+    def rebuild(changed_paths, cancel_token=None):
+        if project_path in changed_paths:
+            try:
+                project["data"] = load_project(project_path)
+            except InvalidProjectError as e:
+                emit("error", error="invalid_project", message=str(e))
+                return
+
+        if changed_paths:
+            emit(
+                "change",
+                paths=list(changed_paths),
+                skins=len(affected_skins(project["data"], changed_paths))
+            )
+
+        started = time.time()
+        report = BuildReport()
+        try:
+            zip_path = build_project(project["data"], report=report, cancel_token=cancel_token, **build_options)
+        except BuildCancelled:
+            print(f"[DEBUG] Watch build cancelled")
+            return
+        except Exception as e:
+            print(f"[ERROR] Watch build failed: {e}")
+            emit("error", error="build_failed", message=str(e))
+            return
+
+        emit(
+            "done",
+            zip_path=os.path.abspath(zip_path),
+            size=_output_size(zip_path),
+            seconds=round(time.time() - started, 3),
+            cache_hits=report.info.get("cache_hits"),
+            report_path=report.report_path
+        )
+
+    watcher = FileWatcher(
+        lambda: project_watch_paths(project["data"]) | {project_path},
+        rebuild,
+        debounce=debounce
+    )
+
+    rebuild([])
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m core.build",
+        description="Build a BeamSkin Studio project into a mod ZIP without the GUI."
+    )
+    parser.add_argument("project", help="Path to the .bsproject file")
+    parser.add_argument("--out", help="Output folder (default: configured BeamNG mods folder)")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of worker processes (default: 1)")
+    parser.add_argument(
+        "--compression",
+        choices=list(PRESETS.keys()),
+        default=DEFAULT_PRESET,
+        help=f"Compression preset (default: {DEFAULT_PRESET})"
+    )
+    parser.add_argument("--vehicles", help="Vehicle templates folder (default: ./vehicles)")
+    parser.add_argument("--staging", action="store_true", help="Build through a temporary folder instead of streaming")
+    parser.add_argument("--no-cache", action="store_true", help="Do not use or update the build cache")
+    parser.add_argument("--cache-dir", help="Build cache folder (default: per-user cache folder)")
+    parser.add_argument("--cache-size-mb", type=int, help="Build cache size limit in MB")
+    parser.add_argument("--overwrite", action="store_true", help="Replace an existing ZIP with the same name")
+    parser.add_argument(
+        "--unpacked",
+        action="store_true",
+        help="Sync an uncompressed mod folder into <out>/unpacked/ instead of writing a ZIP"
+    )
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Fixed timestamps and permissions plus a content manifest; an unchanged ZIP is kept as it is"
+    )
+    parser.add_argument("--watch", action="store_true", help="Rebuild whenever the project's source files change")
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Estimate output size and build time and check the project, without building"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f"Seconds to wait for saves to settle before a watch rebuild (default: {DEFAULT_DEBOUNCE})"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    try:
+        args = _parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    # Keep the real stdout for JSON events and send every print from the
+    # build, including worker processes, to stderr
+    sys.stdout.flush()
+    events = os.fdopen(os.dup(sys.stdout.fileno()), "w", buffering=1, encoding="utf-8")
+    os.environ[WORKER_LOG_TO_STDERR_ENV] = "1"
+
+    def emit(event, **fields):
+        events.write(json.dumps({"event": event, **fields}) + "\n")
+
+    started = time.time()
+    exit_code = EXIT_OK
+
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            project_data = load_project(args.project)
+            total_skins = sum(len(car_info.get("skins", [])) for car_info in project_data["cars"].values())
+            emit(
+                "start",
+                project=os.path.abspath(args.project),
+                mod_name=project_data["mod_name"],
+                cars=len(project_data["cars"]),
+                skins=total_skins
+            )
+
+            if args.plan:
+                from core.build_plan import plan_build
+                plan = plan_build(
+                    project_data,
+                    args.compression,
+                    vehicles_root=args.vehicles or default_vehicles_root(),
+                    output_path=None if args.unpacked or args.overwrite else (args.out or get_beamng_mods_path())
+                )
+                emit("plan", **plan.to_dict())
+                if not plan.ok:
+                    exit_code = EXIT_INVALID_PROJECT
+            elif args.watch:
+                watch_project(
+                    args.project,
+                    debounce=args.debounce,
+                    event_callback=emit,
+                    output_dir=args.out,
+                    jobs=max(1, args.jobs),
+                    compression_preset=args.compression,
+                    cache_dir=args.cache_dir,
+                    cache_size_mb=args.cache_size_mb,
+                    vehicles_root=args.vehicles,
+                    unpacked=args.unpacked,
+                    reproducible=args.reproducible,
+                    progress_callback=lambda value: emit("progress", progress=round(value, 4))
+                )
+                emit("stopped")
+            else:
+                report = BuildReport()
+                zip_path = build_project(
+                    project_data,
+                    output_dir=args.out,
+                    jobs=max(1, args.jobs),
+                    compression_preset=args.compression,
+                    streaming=not args.staging,
+                    use_cache=not args.no_cache,
+                    cache_dir=args.cache_dir,
+                    cache_size_mb=args.cache_size_mb,
+                    vehicles_root=args.vehicles,
+                    overwrite=args.overwrite,
+                    progress_callback=lambda value: emit("progress", progress=round(value, 4)),
+                    report=report,
+                    unpacked=args.unpacked,
+                    reproducible=args.reproducible
+                )
+
+                emit(
+                    "done",
+                    zip_path=os.path.abspath(zip_path),
+                    size=_output_size(zip_path),
+                    seconds=round(time.time() - started, 3),
+                    report_path=report.report_path,
+                    unchanged=report.info.get("unchanged", False),
+                    manifest_digest=report.info.get("manifest_digest")
+                )
+
+        except InvalidProjectError as e:
+            exit_code = EXIT_INVALID_PROJECT
+            emit("error", error="invalid_project", message=str(e), exit_code=exit_code)
+        except FileExistsError as e:
+            exit_code = EXIT_OUTPUT_EXISTS
+            emit("error", error="output_exists", message=str(e), exit_code=exit_code)
+        except FileNotFoundError as e:
+            exit_code = EXIT_MISSING_FILES
+            emit("error", error="missing_files", message=str(e), exit_code=exit_code)
+        except (KeyboardInterrupt, BuildCancelled):
+            exit_code = EXIT_INTERRUPTED
+            emit("error", error="interrupted", message="Build interrupted", exit_code=exit_code)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            exit_code = EXIT_BUILD_FAILED
+            emit("error", error="build_failed", message=str(e), exit_code=exit_code)
+
+    events.close()
+    return exit_code
+
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,341 @@
+"""
+Build cache - keeps each skin's compressed entries between builds
+
+Every skin is rendered and compressed into a small artifact archive named
+after a hash of everything that goes into it. When nothing about a skin has
+changed, the next build copies its entries straight from the artifact
+instead of rendering and compressing them again.
+
+Several processes may use one cache directory at once (queue workers,
+the GUI's build worker, watch mode). They take turns through a lock file,
+and a build leases the keys it uses before looking them up, so eviction
+in another process never removes an artifact that is still to be merged.
+"""
+import os
+import json
+import time
+import hashlib
+import itertools
+import contextlib
+
+from utils.config_helper import get_cache_dir
+
+# Bump when the rendered output of a skin changes for the same inputs
+CACHE_FORMAT_VERSION = 2
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+ARTIFACT_EXTENSION = ".zip"
+DIGESTS_FILE = "digests.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+LOCK_FILE = "cache.lock"
+LEASES_DIR = "in_use"
+# A lease this old belongs to a build that died without releasing it
+STALE_LEASE_SECONDS = 6 * 60 * 60
+LOCK_POLL_INTERVAL = 0.05
+
+_lease_ids = itertools.count(1)
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(f):
+        # LK_LOCK gives up after ten seconds; a build may hold the lock longer
+        while True:
+            f.seek(0)
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                time.sleep(LOCK_POLL_INTERVAL)
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+class BuildCache:
+    """On-disk cache of per-skin artifacts with a size cap and LRU eviction
+
+    Artifacts are plain files, and their modification time doubles as the
+    last-used time. Builds in several processes may share the cache
+    directory: see hold(), and locked() for everything that rewrites it.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or get_cache_dir("builds")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._digests = self._load_digests()
+        self._digests_changed = False
+        self._template_digests = {}
+
+    def _load_digests(self):
+        digests_path = os.path.join(self.cache_dir, DIGESTS_FILE)
+        try:
+            with open(digests_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold the cache's lock file, which every process using the directory shares"""
+        with open(os.path.join(self.cache_dir, LOCK_FILE), "a+b") as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
+
+    def save(self):
+        """Merge the file digest memo into the one on disk and write it back"""
+        if not self._digests_changed:
+            return
+
+        digests_path = os.path.join(self.cache_dir, DIGESTS_FILE)
+        temp_path = f"{digests_path}.{os.getpid()}.tmp"
+
+        with self.locked():
+            # Keep what other processes saved since this memo was loaded
+            digests = self._load_digests()
+            digests.update(self._digests)
+
+            # Forget files that no longer exist so the memo does not grow forever
+            self._digests = {path: value for path, value in digests.items() if os.path.exists(path)}
+
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._digests, f)
+                os.replace(temp_path, digests_path)
+                self._digests_changed = False
+            except OSError as e:
+                print(f"[WARNING] Could not save build cache digests: {e}")
+
+    def file_digest(self, path):
+        """SHA-256 of a file's content, memoized by path, size and mtime"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+
+        cached = self._digests.get(path)
+        if cached and cached[:2] == signature:
+            return cached[2]
+
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                sha.update(chunk)
+
+        digest = sha.hexdigest()
+        self._digests[path] = signature + [digest]
+        self._digests_changed = True
+        return digest
+
+    def _template_files(self, vehicle_root):
+        """(rel_path, full_path, size, mtime_ns) of the template files, in a stable order"""
+        files = []
+        for root_dir, dirs, names in os.walk(vehicle_root):
+            dirs.sort()
+            for name in sorted(names):
+                if name.lower().endswith(".dds"):
+                    continue
+                full_path = os.path.join(root_dir, name)
+                stat = os.stat(full_path)
+                rel_path = os.path.relpath(full_path, vehicle_root).replace(os.sep, "/")
+                files.append((rel_path, full_path, stat.st_size, stat.st_mtime_ns))
+        return files
+
+    def template_digest(self, template_path):
+        """Digest of the vehicle template folder (SKINNAME and info templates)
+
+        Template .dds files are never packaged, so they are left out. The
+        digest is remembered together with the files' paths, sizes and
+        mtimes, so an edited template gets a new digest even when this cache
+        is kept between builds.
+        """
+        vehicle_root = os.path.dirname(os.path.abspath(template_path))
+        files = self._template_files(vehicle_root)
+        signature = [(rel_path, size, mtime_ns) for rel_path, _, size, mtime_ns in files]
+
+        cached = self._template_digests.get(vehicle_root)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        sha = hashlib.sha256()
+        for rel_path, full_path, _, _ in files:
+            sha.update(rel_path.encode("utf-8"))
+            sha.update(self.file_digest(full_path).encode("ascii"))
+
+        digest = sha.hexdigest()
+        self._template_digests[vehicle_root] = (signature, digest)
+        return digest
+
+    def skin_key(self, job, compression_preset):
+        """Hash of every input that affects a skin's archive entries"""
+        skin = job["skin"]
+        config_data = skin.get("config_data")
+
+        config_files = {}
+        if config_data:
+            for field in ("pc_file_path", "jpg_file_path"):
+                path = config_data.get(field)
+                if path and os.path.exists(path):
+                    config_files[field] = self.file_digest(path)
+
+        key_data = {
+            "version": CACHE_FORMAT_VERSION,
+            "base_carid": job["base_carid"],
+            "skin_folder": job.get("skin_folder"),
+            "template": self.template_digest(job["template_path"]),
+            "name": skin["name"],
+            "author": job["author"],
+            "dds_filename": job["dds_filename"],
+            "dds": self.file_digest(skin["dds_path"]),
+            "config_data": config_data,
+            "config_files": config_files,
+            "material_properties": skin.get("material_properties"),
+            "shared_dds": job.get("shared_dds"),
+            "compression": compression_preset
+        }
+
+        encoded = json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def artifact_path(self, key):
+        return os.path.join(self.cache_dir, key + ARTIFACT_EXTENSION)
+
+    def hold(self, keys):
+        """Keep the artifacts of keys from being evicted until release(lease)
+
+        Call before looking the keys up: an artifact found afterwards stays
+        in the cache until this build has merged it, whatever other
+        processes evict meanwhile. Returns the lease.
+        """
+        leases_dir = os.path.join(self.cache_dir, LEASES_DIR)
+        lease = os.path.join(leases_dir, f"{os.getpid()}-{next(_lease_ids)}.json")
+        with self.locked():
+            os.makedirs(leases_dir, exist_ok=True)
+            with open(lease, "w", encoding="utf-8") as f:
+                json.dump(sorted(set(keys)), f)
+        return lease
+
+    def release(self, lease):
+        """Let the artifacts of a lease from hold() be evicted again"""
+        with self.locked():
+            try:
+                os.remove(lease)
+            except OSError:
+                pass
+
+    def _held_keys(self):
+        """Keys leased by running builds; call with the lock held"""
+        leases_dir = os.path.join(self.cache_dir, LEASES_DIR)
+        try:
+            names = os.listdir(leases_dir)
+        except OSError:
+            return set()
+
+        keys = set()
+        for name in names:
+            path = os.path.join(leases_dir, name)
+            try:
+                if time.time() - os.path.getmtime(path) > STALE_LEASE_SECONDS:
+                    os.remove(path)
+                    continue
+                with open(path, "r", encoding="utf-8") as f:
+                    keys.update(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return keys
+
+    def lookup(self, key):
+        """Return the artifact path for key and mark it as used, or None"""
+        path = self.artifact_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def _artifacts(self):
+        artifacts = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(ARTIFACT_EXTENSION):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            artifacts.append((stat.st_mtime, stat.st_size, path))
+        return artifacts
+
+    def size(self):
+        """Total size of all cached artifacts in bytes"""
+        return sum(size for _, size, _ in self._artifacts())
+
+    def evict(self, keep=()):
+        """Remove least recently used artifacts until the cache fits its cap
+
+        Artifacts whose keys are in keep (the current build) or leased by a
+        running build are never removed. Returns the number of bytes freed.
+        """
+        freed = 0
+
+        with self.locked():
+            keep_paths = {self.artifact_path(key) for key in set(keep) | self._held_keys()}
+            artifacts = sorted(self._artifacts())
+            total = sum(size for _, size, _ in artifacts)
+
+            for _, size, path in artifacts:
+                if total <= self.max_bytes:
+                    break
+                if path in keep_paths:
+                    continue
+                try:
+                    os.remove(path)
+                    total -= size
+                    freed += size
+                except OSError as e:
+                    print(f"[WARNING] Could not evict cached skin {path}: {e}")
+
+        if freed:
+            print(f"[DEBUG] Build cache evicted {freed / (1024 * 1024):.1f} MB")
+        return freed
+
+    def clear(self):
+        """Remove every cached artifact and digest; returns the bytes freed
+
+        Artifacts leased by a running build are left for it.
+        """
+        freed = 0
+
+        with self.locked():
+            held_paths = {self.artifact_path(key) for key in self._held_keys()}
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                if name == LOCK_FILE or path in held_paths or not os.path.isfile(path):
+                    continue
+                try:
+                    size = os.path.getsize(path)
+                    os.remove(path)
+                    freed += size
+                except OSError as e:
+                    print(f"[WARNING] Could not remove {path}: {e}")
+
+        self._digests = {}
+        self._digests_changed = False
+        self._template_digests = {}
+        print(f"[DEBUG] Build cache cleared ({freed / (1024 * 1024):.1f} MB)")
+        return freed
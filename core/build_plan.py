@@ -0,0 +1,321 @@
+"""
+Build planner - what a build will produce and cost, without building it
+
+plan_build() walks the project, stats every input file, samples how well
+each DDS compresses and applies the compression preset's store/deflate
+rules to estimate the archive size and entry count, per car and in total.
+The build time is estimated from the throughput of earlier builds on this
+machine, read from their saved build reports. Missing files, duplicate
+skin folders and other problems that would break or silently change the
+build are listed before anything is copied.
+"""
+import os
+import json
+import zlib
+import statistics
+
+from core.compression import (
+    DEFAULT_PRESET, COMPRESSED_EXTENSIONS, SAMPLED_EXTENSIONS, get_preset, sample_compressibility
+)
+from core.file_ops import (
+    sanitize_folder_name, sanitize_mod_name, get_fixed_dds_filename, canonical_dds_filename,
+    find_info_template, dedupe_skin_textures
+)
+from core.build_report import format_size
+from utils.config_helper import get_cache_dir
+
+# Local header and central directory record; the name is stored in both
+ZIP_ENTRY_OVERHEAD = 30 + 46
+ZIP_END_OVERHEAD = 22
+
+# Used when no earlier build report can be read
+DEFAULT_THROUGHPUT = 40 * 1024 * 1024
+REPORTS_FOR_THROUGHPUT = 20
+
+# Files up to this size are deflated whole to estimate their ratio
+FULL_SAMPLE_LIMIT = 1024 * 1024
+
+class BuildPlan:
+    """Estimated output of a build and the problems found in its inputs"""
+
+    def __init__(self, mod_name="", compression_preset=DEFAULT_PRESET):
+        self.mod_name = mod_name
+        self.compression_preset = compression_preset
+        self.cars = {}
+        self.problems = []
+        self.warnings = []
+        self.entry_count = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.shared_textures = 0
+        self.dedup_bytes_saved = 0
+        self.throughput = DEFAULT_THROUGHPUT
+        self.throughput_recorded = False
+
+    @property
+    def ok(self):
+        return not self.problems
+
+    @property
+    def estimated_seconds(self):
+        return self.bytes_in / self.throughput if self.throughput else 0.0
+
+    def add_entry(self, car_instance_id, arcname, bytes_in, bytes_out):
+        car = self.cars[car_instance_id]
+        car["entries"] += 1
+        car["bytes_in"] += bytes_in
+        car["bytes_out"] += bytes_out + ZIP_ENTRY_OVERHEAD + 2 * len(arcname.encode("utf-8"))
+
+    def to_dict(self):
+        return {
+            "mod_name": self.mod_name,
+            "compression": self.compression_preset,
+            "ok": self.ok,
+            "problems": self.problems,
+            "warnings": self.warnings,
+            "entries": self.entry_count,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "shared_textures": self.shared_textures,
+            "dedup_bytes_saved": self.dedup_bytes_saved,
+            "estimated_seconds": round(self.estimated_seconds, 2),
+            "throughput": round(self.throughput),
+            "throughput_recorded": self.throughput_recorded,
+            "cars": self.cars
+        }
+
+    def summary(self):
+        """Multi-line summary for the UI"""
+        lines = [
+            f"Plan for '{self.mod_name}' ({get_preset(self.compression_preset)['label']} compression)",
+            f"~{format_size(self.bytes_out)} archive, {self.entry_count} entries, "
+            f"{format_size(self.bytes_in)} of input",
+            f"Estimated build time: ~{self.estimated_seconds:.1f}s "
+            + (f"(at {format_size(self.throughput)}/s from earlier builds)" if self.throughput_recorded
+               else "(no earlier builds recorded, rough guess)")
+        ]
+
+        if self.shared_textures:
+            lines.append(
+                f"{self.shared_textures} duplicate texture(s) stored once, "
+                f"saves {format_size(self.dedup_bytes_saved)}"
+            )
+
+        lines.append("")
+        for car_instance_id, car in self.cars.items():
+            lines.append(
+                f"  {car_instance_id}: {car['skins']} skin(s), {car['entries']} entries, "
+                f"~{format_size(car['bytes_out'])}"
+            )
+
+        if self.problems:
+            lines.append("")
+            lines.append(f"Problems ({len(self.problems)}):")
+            lines.extend(f"  ✗ {problem}" for problem in self.problems)
+
+        if self.warnings:
+            lines.append("")
+            lines.append(f"Warnings ({len(self.warnings)}):")
+            lines.extend(f"  ! {warning}" for warning in self.warnings)
+
+        return "\n".join(lines)
+
+def recorded_throughput(reports_dir=None):
+    """Median input bytes per second of recent uncached builds, or None"""
+    reports_dir = reports_dir or get_cache_dir("reports")
+    try:
+        names = sorted(name for name in os.listdir(reports_dir) if name.endswith(".json"))
+    except OSError:
+        return None
+
+    rates = []
+    for name in reversed(names):
+        try:
+            with open(os.path.join(reports_dir, name), "r", encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+        # Cache hits, unpacked syncs and unchanged archives skip most of the work
+        info = report.get("info", {})
+        if info.get("cache_hits") or info.get("unchanged") or report.get("mode") == "unpacked":
+            continue
+        if report.get("wall_time", 0) > 0 and report.get("bytes_in", 0) > 0:
+            rates.append(report["bytes_in"] / report["wall_time"])
+        if len(rates) >= REPORTS_FOR_THROUGHPUT:
+            break
+
+    return statistics.median(rates) if rates else None
+
+class _RatioEstimator:
+    """Compressed/raw ratio of input files under a preset, memoized per path"""
+
+    def __init__(self, compression_preset):
+        self.preset = get_preset(compression_preset)
+        self._ratios = {}
+
+    def ratio(self, path, size):
+        if path in self._ratios:
+            return self._ratios[path]
+
+        ext = os.path.splitext(path)[1].lower()
+        if ext in COMPRESSED_EXTENSIONS or ext in self.preset["store_extensions"]:
+            ratio = 1.0
+        elif ext in SAMPLED_EXTENSIONS:
+            ratio = sample_compressibility(path, size)
+            if self.preset["store_ratio"] is not None and ratio > self.preset["store_ratio"]:
+                ratio = 1.0
+        elif size <= FULL_SAMPLE_LIMIT:
+            with open(path, "rb") as f:
+                data = f.read()
+            ratio = len(zlib.compress(data, self.preset["level"])) / len(data) if data else 1.0
+        else:
+            ratio = sample_compressibility(path, size)
+
+        self._ratios[path] = ratio
+        return ratio
+
+    def compressed_size(self, path, size):
+        return int(size * self.ratio(path, size))
+
+def _template_files(template_path):
+    files = []
+    for root_dir, _, names in os.walk(template_path):
+        for name in names:
+            if name.lower().endswith(".dds"):
+                continue
+            path = os.path.join(root_dir, name)
+            files.append((os.path.relpath(path, template_path).replace(os.sep, "/"), path, os.path.getsize(path)))
+    return files
+
+def plan_build(project_data, compression_preset=DEFAULT_PRESET, vehicles_root=None, output_path=None,
+               reports_dir=None):
+    """Estimate the build of project_data without writing anything
+
+    output_path is the folder the mod would be written to; when given, an
+    existing mod of the same name is reported as a warning.
+    """
+    mod_name = sanitize_mod_name(project_data.get("mod_name", ""))
+    plan = BuildPlan(mod_name, compression_preset)
+    vehicles_root = vehicles_root or os.path.join(os.getcwd(), "vehicles")
+    estimator = _RatioEstimator(compression_preset)
+
+    throughput = recorded_throughput(reports_dir)
+    if throughput:
+        plan.throughput = throughput
+        plan.throughput_recorded = True
+
+    if not mod_name:
+        plan.problems.append("The mod has no name")
+    if not project_data.get("cars"):
+        plan.problems.append("The project has no cars")
+    if output_path and mod_name and os.path.exists(os.path.join(output_path, f"{mod_name}.zip")):
+        plan.warnings.append(f"{mod_name}.zip already exists in {output_path} and would have to be replaced")
+
+    template_cache = {}
+    skin_folders = {}
+    dds_jobs = []
+
+    for car_instance_id, car_info in project_data.get("cars", {}).items():
+        base_carid = car_info.get("base_carid", car_instance_id)
+        skins = car_info.get("skins", [])
+        plan.cars[car_instance_id] = {
+            "base_carid": base_carid,
+            "skins": len(skins),
+            "entries": 0,
+            "bytes_in": 0,
+            "bytes_out": 0
+        }
+
+        template_path = os.path.join(vehicles_root, base_carid, "SKINNAME")
+        if not os.path.isdir(template_path):
+            plan.problems.append(f"{car_instance_id}: no template for vehicle '{base_carid}' ({template_path})")
+            template_files = []
+        else:
+            if template_path not in template_cache:
+                template_cache[template_path] = _template_files(template_path)
+            template_files = template_cache[template_path]
+
+        for skin in skins:
+            skin_name = skin.get("name", "")
+            skin_folder = sanitize_folder_name(skin_name)
+            label = f"{car_instance_id} / {skin_name or '(unnamed skin)'}"
+
+            folder_key = (base_carid, skin_folder.lower())
+            if folder_key in skin_folders:
+                plan.problems.append(
+                    f"{label}: skin folder 'vehicles/{base_carid}/{skin_folder}' is also used by "
+                    f"{skin_folders[folder_key]}; one skin would overwrite the other"
+                )
+            else:
+                skin_folders[folder_key] = label
+
+            skin_arc = f"vehicles/{base_carid}/{skin_folder}"
+            for rel_path, path, size in template_files:
+                plan.add_entry(car_instance_id, f"{skin_arc}/{rel_path}", size, estimator.compressed_size(path, size))
+
+            dds_path = skin.get("dds_path")
+            if not dds_path:
+                plan.problems.append(f"{label}: no DDS file selected")
+            elif not os.path.isfile(dds_path):
+                plan.problems.append(f"{label}: DDS file not found ({dds_path})")
+            else:
+                if get_fixed_dds_filename(os.path.basename(dds_path), base_carid) is None:
+                    plan.warnings.append(f"{label}: no skin name in DDS filename '{os.path.basename(dds_path)}'")
+                dds_filename = canonical_dds_filename(dds_path, base_carid)
+                dds_jobs.append({
+                    "arcname": f"{skin_arc}/{dds_filename}",
+                    "car_instance_id": car_instance_id,
+                    "base_carid": base_carid,
+                    "skin": skin,
+                    "label": label,
+                    "dds_filename": dds_filename
+                })
+
+            config_data = skin.get("config_data")
+            if config_data:
+                vehicle_arc = f"vehicles/{base_carid}"
+                for field, ext in (("pc_file_path", ".pc"), ("jpg_file_path", ".jpg")):
+                    path = config_data.get(field)
+                    if not path:
+                        continue
+                    if not os.path.isfile(path):
+                        # The build leaves out the whole configuration then
+                        plan.problems.append(f"{label}: {ext} file not found ({path})")
+                        continue
+                    size = os.path.getsize(path)
+                    plan.add_entry(
+                        car_instance_id, f"{vehicle_arc}/{skin_folder}{ext}", size, estimator.compressed_size(path, size)
+                    )
+
+                if os.path.isdir(os.path.dirname(template_path)):
+                    info_path = find_info_template(os.path.dirname(template_path))
+                    if info_path:
+                        size = os.path.getsize(info_path)
+                        plan.add_entry(
+                            car_instance_id, f"{vehicle_arc}/info_{skin_folder}.json",
+                            size, estimator.compressed_size(info_path, size)
+                        )
+                    else:
+                        plan.warnings.append(f"{label}: no info.json template, the configuration gets no info file")
+
+    # Skins with identical textures share one stored copy, as in the build
+    plan.shared_textures, plan.dedup_bytes_saved = dedupe_skin_textures(dds_jobs)
+    for job in dds_jobs:
+        if job.get("shared_dds"):
+            continue
+        path = job["skin"]["dds_path"]
+        size = os.path.getsize(path)
+        plan.add_entry(job["car_instance_id"], job["arcname"], size, estimator.compressed_size(path, size))
+
+    for car in plan.cars.values():
+        plan.entry_count += car["entries"]
+        plan.bytes_in += car["bytes_in"]
+        plan.bytes_out += car["bytes_out"]
+    plan.bytes_out += ZIP_END_OVERHEAD
+
+    print(
+        f"[DEBUG] Build plan: {plan.entry_count} entries, ~{format_size(plan.bytes_out)}, "
+        f"{len(plan.problems)} problem(s), {len(plan.warnings)} warning(s)"
+    )
+    return plan
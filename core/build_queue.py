@@ -0,0 +1,206 @@
+"""
+Build queue - builds many project files one after another, a few at a time
+
+Each QueueJob is a .bsproject file plus where its mod should go. start()
+runs the queued jobs on a bounded number of BuildWorker processes, each
+building one project at a time with generate_multi_skin_mod, and keeps
+per-job progress, log lines and the build report. on_update(job) is
+called from the queue's threads whenever a job changes, and
+on_finished() once the last worker is done.
+"""
+import os
+import itertools
+import threading
+import collections
+
+from core.build import load_project
+from core.build_worker import BuildWorker
+from core.cancel import CancelToken, BuildCancelled
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+MAX_LOG_LINES = 2000
+DEFAULT_MAX_WORKERS = 2
+
+_job_ids = itertools.count(1)
+
+class QueueJob:
+    """One project in the build queue"""
+
+    def __init__(self, project_path, output_mode="steam", output_dir=None):
+        self.id = next(_job_ids)
+        self.project_path = os.path.abspath(project_path)
+        self.output_mode = output_mode
+        self.output_dir = output_dir
+        self.status = QUEUED
+        self.progress = 0.0
+        self._log = collections.deque(maxlen=MAX_LOG_LINES)
+        self._log_lock = threading.Lock()
+        self.report = None
+        self.result_path = None
+        self.error = None
+        self.cancel_token = None
+
+        project_data = load_project(self.project_path)
+        self.mod_name = project_data["mod_name"]
+        self.skin_count = sum(len(car_info.get("skins", [])) for car_info in project_data["cars"].values())
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    def output_path(self, mods_path):
+        """Folder the mod is written to (unpacked mods go in its unpacked/ subfolder)"""
+        if self.output_mode == "custom":
+            return self.output_dir
+        return mods_path
+
+    def add_log(self, line):
+        with self._log_lock:
+            self._log.append(line)
+
+    def log_lines(self):
+        """The last MAX_LOG_LINES log lines of the build"""
+        with self._log_lock:
+            return list(self._log)
+
+class BuildQueue:
+    """Queued build jobs and the worker processes that run them"""
+
+    def __init__(self, on_update=None, on_finished=None, max_workers=DEFAULT_MAX_WORKERS):
+        self.jobs = []
+        self.on_update = on_update
+        self.on_finished = on_finished
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._active_workers = 0
+
+    @property
+    def is_running(self):
+        with self._lock:
+            return self._active_workers > 0
+
+    def add(self, project_path, output_mode="steam", output_dir=None):
+        """Queue a project file; raises InvalidProjectError for unreadable projects"""
+        job = QueueJob(project_path, output_mode, output_dir)
+        with self._lock:
+            self.jobs.append(job)
+        return job
+
+    def remove(self, job):
+        """Remove a job that is not being built"""
+        with self._lock:
+            if job.status == RUNNING:
+                return False
+            self.jobs.remove(job)
+        return True
+
+    def clear_finished(self):
+        with self._lock:
+            self.jobs = [job for job in self.jobs if not job.finished]
+
+    def cancel(self, job):
+        """Cancel a running job, or drop a queued one from this run"""
+        with self._lock:
+            if job.status == QUEUED:
+                job.status = CANCELLED
+            elif job.status == RUNNING and job.cancel_token is not None:
+                job.cancel_token.cancel()
+        self._notify(job)
+
+    def cancel_all(self):
+        for job in list(self.jobs):
+            if not job.finished:
+                self.cancel(job)
+
+    def start(self, mods_path, build_options):
+        """Build every queued job
+
+        build_options are BuildWorker.build() keyword arguments shared by
+        all jobs (jobs, streaming, compression_preset, cache_size_mb,
+        overwrite). Does nothing if the queue is already running.
+        """
+        with self._lock:
+            if self._active_workers:
+                return
+            queued = sum(1 for job in self.jobs if job.status == QUEUED)
+            workers = max(1, min(self.max_workers, queued))
+            self._active_workers = workers
+
+        for _ in range(workers):
+            threading.Thread(target=self._run, args=(mods_path, build_options), daemon=True).start()
+        print(f"[DEBUG] Build queue started: {queued} job(s), {workers} worker(s)")
+
+    def _next_job(self):
+        with self._lock:
+            for job in self.jobs:
+                if job.status == QUEUED:
+                    job.status = RUNNING
+                    job.cancel_token = CancelToken()
+                    return job
+        return None
+
+    def _notify(self, job):
+        if self.on_update:
+            try:
+                self.on_update(job)
+            except Exception as e:
+                print(f"[ERROR] Build queue update failed: {e}")
+
+    def _run(self, mods_path, build_options):
+        worker = BuildWorker()
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    break
+                self._build(worker, job, mods_path, build_options)
+        finally:
+            worker.stop()
+            with self._lock:
+                self._active_workers -= 1
+                last = self._active_workers == 0
+            if last and self.on_finished:
+                self.on_finished()
+
+    def _build(self, worker, job, mods_path, build_options):
+        self._notify(job)
+
+        def on_progress(value):
+            job.progress = value
+            self._notify(job)
+
+        try:
+            output_path = job.output_path(mods_path)
+            if not output_path:
+                raise ValueError("No output folder set")
+
+            # Read the project again so edits made after queueing are built
+            project_data = load_project(job.project_path)
+            job.mod_name = project_data["mod_name"]
+
+            job.result_path, job.report = worker.build(
+                project_data,
+                progress_callback=on_progress,
+                log_callback=job.add_log,
+                cancel_token=job.cancel_token,
+                output_path=output_path,
+                unpacked=job.output_mode == "unpacked",
+                **build_options
+            )
+            job.status = DONE
+            job.progress = 1.0
+        except BuildCancelled:
+            job.status = CANCELLED
+            job.add_log("Build cancelled")
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+            job.add_log(f"[ERROR] {type(e).__name__}: {e}")
+            print(f"[ERROR] Queued build of {job.project_path} failed: {e}")
+
+        self._notify(job)
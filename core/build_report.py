@@ -0,0 +1,246 @@
+"""
+Build report - where the time and bytes of a mod build go
+
+Stages are timed with stage("name") blocks. Timings collect per thread,
+so skin tasks running in worker processes hand theirs back with their
+result (see take_stage_times) and the parent merges them into the report.
+The build's CPU time is this process's own plus that of the skins that
+ran in worker processes, which process_time() cannot see.
+"""
+import os
+import re
+import json
+import time
+import itertools
+import zipfile
+import threading
+import contextlib
+
+from utils.config_helper import get_cache_dir
+
+REPORTS_TO_KEEP = 50
+SLOWEST_SKINS = 10
+
+# Stage timings of the current thread: name -> [wall, cpu, calls]
+_local = threading.local()
+
+def _stage_times():
+    if not hasattr(_local, "times"):
+        _local.times = {}
+    return _local.times
+
+@contextlib.contextmanager
+def stage(name):
+    """Time a block of work under a stage name"""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        entry = _stage_times().setdefault(name, [0.0, 0.0, 0])
+        entry[0] += time.perf_counter() - wall_start
+        entry[1] += time.process_time() - cpu_start
+        entry[2] += 1
+
+def take_stage_times():
+    """Return and reset the stage timings collected in this thread"""
+    times = _stage_times()
+    _local.times = {}
+    return times
+
+@contextlib.contextmanager
+def collect_stage_times():
+    """Collect the stages timed inside the block into the yielded dict
+
+    Timings recorded before the block are kept aside and restored after it,
+    so a skin task run in the build thread does not mix with the build's
+    own stages.
+    """
+    outer = take_stage_times()
+    collected = {}
+    try:
+        yield collected
+    finally:
+        collected.update(take_stage_times())
+        _local.times = outer
+
+class BuildReport:
+    """Timings and size breakdown of one build, saved as JSON"""
+
+    def __init__(self, mod_name="", mode=""):
+        self.mod_name = mod_name
+        self.mode = mode
+        self.started = time.time()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.stages = {}
+        self.skins = []
+        self.entries = []
+        self.info = {}
+        self.zip_path = None
+        self.report_path = None
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+    def merge_stage_times(self, times):
+        for name, (wall, cpu, calls) in times.items():
+            entry = self.stages.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+            entry["wall"] += wall
+            entry["cpu"] += cpu
+            entry["calls"] += calls
+
+    def add_skin(self, label, name, wall, cpu, pid=None):
+        """Record a skin's timings; pid is the process it was built in, if not this one"""
+        self.skins.append({"label": label, "name": name, "wall": wall, "cpu": cpu, "pid": pid or os.getpid()})
+
+    def worker_cpu_time(self):
+        """CPU time of the skins built in other processes"""
+        return sum(skin["cpu"] for skin in self.skins if skin["pid"] != os.getpid())
+
+    def add_archive(self, zip_path):
+        """Record bytes in and out of every entry of the finished archive"""
+        self.zip_path = zip_path
+        with zipfile.ZipFile(zip_path, "r") as zipf:
+            for info in zipf.infolist():
+                self.entries.append({
+                    "name": info.filename,
+                    "bytes_in": info.file_size,
+                    "bytes_out": info.compress_size,
+                    "stored": info.compress_type == zipfile.ZIP_STORED
+                })
+
+    def add_folder(self, folder_path):
+        """Record the files of an unpacked mod folder (stored, uncompressed)"""
+        self.zip_path = folder_path
+        for root_dir, _, files in os.walk(folder_path):
+            for file in files:
+                if file.startswith("."):
+                    continue
+                size = os.path.getsize(os.path.join(root_dir, file))
+                self.entries.append({
+                    "name": os.path.relpath(os.path.join(root_dir, file), folder_path).replace(os.sep, "/"),
+                    "bytes_in": size,
+                    "bytes_out": size,
+                    "stored": True
+                })
+
+    def finish(self):
+        # Stages timed in this thread that were not merged yet
+        self.merge_stage_times(take_stage_times())
+        self.wall_time = time.perf_counter() - self.wall_start
+        self.cpu_time = time.process_time() - self.cpu_start + self.worker_cpu_time()
+
+    def by_type(self):
+        types = {}
+        for entry in self.entries:
+            ext = os.path.splitext(entry["name"])[1].lower() or "(none)"
+            totals = types.setdefault(ext, {"count": 0, "bytes_in": 0, "bytes_out": 0})
+            totals["count"] += 1
+            totals["bytes_in"] += entry["bytes_in"]
+            totals["bytes_out"] += entry["bytes_out"]
+
+        for totals in types.values():
+            totals["ratio"] = round(totals["bytes_out"] / totals["bytes_in"], 4) if totals["bytes_in"] else 1.0
+        return types
+
+    def to_dict(self):
+        bytes_in = sum(entry["bytes_in"] for entry in self.entries)
+        bytes_out = sum(entry["bytes_out"] for entry in self.entries)
+
+        return {
+            "mod_name": self.mod_name,
+            "mode": self.mode,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "zip_path": self.zip_path,
+            "wall_time": round(self.wall_time, 4),
+            "cpu_time": round(self.cpu_time, 4),
+            "info": self.info,
+            "stages": {
+                name: {"wall": round(entry["wall"], 4), "cpu": round(entry["cpu"], 4), "calls": entry["calls"]}
+                for name, entry in sorted(self.stages.items(), key=lambda item: -item[1]["wall"])
+            },
+            "bytes_in": bytes_in,
+            "bytes_out": bytes_out,
+            "ratio": round(bytes_out / bytes_in, 4) if bytes_in else 1.0,
+            "by_type": self.by_type(),
+            "slowest_skins": [
+                {key: value for key, value in skin.items() if key != "pid"}
+                for skin in sorted(self.skins, key=lambda skin: -skin["wall"])[:SLOWEST_SKINS]
+            ],
+            "entries": self.entries
+        }
+
+    def save(self, reports_dir=None):
+        """Write the report as JSON and prune old reports; returns its path
+
+        Reports are named after the start time down to the millisecond, and
+        a report never replaces another one: builds of the same mod started
+        at the same moment, as in watch mode or a queue, get numbered names.
+        """
+        reports_dir = reports_dir or get_cache_dir("reports")
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        stamp += f"-{int(self.started * 1000) % 1000:03d}"
+        safe_name = re.sub(r"[^\w.-]", "_", self.mod_name or "build")
+
+        try:
+            for number in itertools.count(1):
+                suffix = f"-{number}" if number > 1 else ""
+                self.report_path = os.path.join(reports_dir, f"{stamp}_{safe_name}{suffix}.json")
+                try:
+                    f = open(self.report_path, "x", encoding="utf-8")
+                except FileExistsError:
+                    continue
+                break
+            with f:
+                json.dump(self.to_dict(), f, indent=2)
+            print(f"[DEBUG] Build report written to: {self.report_path}")
+        except OSError as e:
+            print(f"[WARNING] Could not write build report: {e}")
+            self.report_path = None
+            return None
+
+        reports = sorted(name for name in os.listdir(reports_dir) if name.endswith(".json"))
+        for name in reports[:-REPORTS_TO_KEEP]:
+            try:
+                os.remove(os.path.join(reports_dir, name))
+            except OSError:
+                pass
+
+        return self.report_path
+
+    def summary(self):
+        """Compact multi-line summary for the UI"""
+        data = self.to_dict()
+        lines = [
+            f"Built in {data['wall_time']:.2f}s (CPU {data['cpu_time']:.2f}s) - "
+            f"{format_size(data['bytes_in'])} → {format_size(data['bytes_out'])}"
+        ]
+
+        if self.info.get("unchanged"):
+            lines.append("Nothing changed since the last build, the existing ZIP was kept")
+
+        top_stages = list(data["stages"].items())[:3]
+        if top_stages:
+            lines.append("Slowest stages: " + ", ".join(
+                f"{name} {entry['wall']:.2f}s" for name, entry in top_stages
+            ))
+
+        if self.info.get("dedup_bytes_saved"):
+            lines.append(
+                f"Shared {self.info['shared_textures']} duplicate texture(s), "
+                f"saved {format_size(self.info['dedup_bytes_saved'])}"
+            )
+
+        if data["slowest_skins"]:
+            skin = data["slowest_skins"][0]
+            lines.append(f"Slowest skin: {skin['name']} ({skin['wall']:.2f}s)")
+
+        return "\n".join(lines)
+
+def format_size(size):
+    """Human readable size (B, KB, MB, GB)"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GB"
@@ -0,0 +1,251 @@
+"""
+Build worker - runs mod builds in a separate process
+
+The GUI hands a snapshot of the project to a long-lived worker process
+over a pipe and gets progress values, log lines and the finished build
+report back. Regex and JSON work in the build no longer competes with
+Tk for the GIL, and a crash or runaway memory use ends the worker
+instead of the app. The worker stays alive between builds, so modules,
+template plans and the build cache index are already loaded when the
+next build starts; a worker that died is replaced on the next build.
+
+Messages to the worker:     ("build", project_data, options), ("cancel",), ("stop",)
+Messages from the worker:   ("progress", value), ("log", line),
+                            ("done", path, report), ("error", exception)
+"""
+import os
+import sys
+import threading
+import multiprocessing
+import multiprocessing.util
+
+from core.cancel import CancelToken
+
+POLL_INTERVAL = 0.1
+STOP_TIMEOUT = 5
+
+class _PipeWriter:
+    """sys.stdout replacement that sends complete lines as log messages"""
+
+    def __init__(self, send):
+        self._send = send
+        self._buffer = ""
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        with self._lock:
+            self._buffer += text
+            *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._send("log", line)
+        return len(text)
+
+    def flush(self):
+        pass
+
+def _run_build(send, project_data, options, cancel_token, build_caches):
+    from core.file_ops import generate_multi_skin_mod
+    from core.build_report import BuildReport
+
+    options = dict(options)
+    cache_size_mb = options.pop("cache_size_mb", None)
+
+    build_cache = None
+    if cache_size_mb and options.get("streaming", True):
+        # One cache per size limit, kept between builds with its digests loaded
+        build_cache = build_caches.get(cache_size_mb)
+        if build_cache is None:
+            from core.build_cache import BuildCache
+            build_cache = build_caches[cache_size_mb] = BuildCache(max_bytes=cache_size_mb * 1024 * 1024)
+
+    report = BuildReport()
+    try:
+        path = generate_multi_skin_mod(
+            project_data,
+            progress_callback=lambda value: send("progress", value),
+            build_cache=build_cache,
+            report=report,
+            cancel_token=cancel_token,
+            **options
+        )
+    except BaseException as e:
+        import traceback
+        traceback.print_exc()
+        sys.stdout.flush()
+        try:
+            send("error", e)
+        except Exception:
+            # The exception itself could not be pickled
+            send("error", RuntimeError(f"{type(e).__name__}: {e}"))
+        return
+
+    sys.stdout.flush()
+    send("done", path, report)
+
+def _worker_main(conn):
+    from core.file_ops import WORKER_LOG_TO_STDERR_ENV
+
+    send_lock = threading.Lock()
+
+    def send(*message):
+        with send_lock:
+            conn.send(message)
+
+    # Skin pool processes forked from here log to stderr, not to the pipe
+    os.environ[WORKER_LOG_TO_STDERR_ENV] = "1"
+    sys.stdout = _PipeWriter(send)
+
+    build_caches = {}
+    build_thread = None
+    cancel_token = None
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        kind = message[0]
+        if kind == "build":
+            if build_thread is not None:
+                build_thread.join()
+            cancel_token = CancelToken()
+            build_thread = threading.Thread(
+                target=_run_build,
+                args=(send, message[1], message[2], cancel_token, build_caches)
+            )
+            build_thread.start()
+        elif kind == "cancel":
+            if cancel_token is not None:
+                cancel_token.cancel()
+        elif kind == "stop":
+            break
+
+    if cancel_token is not None:
+        cancel_token.cancel()
+    if build_thread is not None:
+        build_thread.join()
+
+class BuildWorkerCrashed(RuntimeError):
+    """The worker process exited in the middle of a build"""
+
+class BuildWorker:
+    """Parent side of the worker process
+
+    build() blocks until the build finishes, so call it from a background
+    thread. Builds are run one at a time.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._conn = None
+        self._build_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._exit_hook = None
+
+    @property
+    def is_running(self):
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """Start the worker now if it is not running, so the next build starts warm"""
+        with self._start_lock:
+            if self.is_running:
+                return
+
+            # A fresh interpreter: forking the GUI process would copy Tk state
+            context = multiprocessing.get_context("spawn")
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker_main, args=(child_conn,), name="BeamSkinBuildWorker")
+            # Not a daemon: the worker starts its own skin process pool
+            process.daemon = False
+            process.start()
+            child_conn.close()
+
+            self._process = process
+            self._conn = parent_conn
+
+            # multiprocessing joins non-daemon children at exit; run stop()
+            # before that, or the exit would wait for a worker that waits
+            # for its next build
+            if self._exit_hook is None:
+                self._exit_hook = multiprocessing.util.Finalize(None, self.stop, exitpriority=10)
+            print(f"[DEBUG] Build worker started (pid {process.pid})")
+
+    def stop(self):
+        """Cancel any running build and end the worker"""
+        with self._start_lock:
+            process, conn = self._process, self._conn
+            self._process = self._conn = None
+            if self._exit_hook is not None:
+                self._exit_hook.cancel()
+                self._exit_hook = None
+
+        if process is None:
+            return
+
+        try:
+            conn.send(("stop",))
+        except (OSError, ValueError):
+            pass
+        conn.close()
+
+        process.join(STOP_TIMEOUT)
+        if process.is_alive():
+            print(f"[WARNING] Build worker did not stop, terminating it")
+            process.terminate()
+            process.join(STOP_TIMEOUT)
+
+    def build(self, project_data, progress_callback=None, log_callback=None, cancel_token=None, **options):
+        """Build project_data in the worker; returns (output path, BuildReport)
+
+        options are generate_multi_skin_mod keyword arguments, except that
+        the build cache is given as cache_size_mb (None for no cache).
+        Exceptions raised by the build are raised here again; a worker that
+        dies mid-build raises BuildWorkerCrashed.
+        """
+        with self._build_lock:
+            self.start()
+            process, conn = self._process, self._conn
+            conn.send(("build", project_data, options))
+            cancel_sent = False
+
+            while True:
+                if cancel_token is not None and cancel_token.cancelled and not cancel_sent:
+                    conn.send(("cancel",))
+                    cancel_sent = True
+
+                try:
+                    if not conn.poll(POLL_INTERVAL):
+                        if not process.is_alive():
+                            raise EOFError
+                        continue
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    self._discard(process)
+                    raise BuildWorkerCrashed(
+                        f"Build worker exited unexpectedly (exit code {process.exitcode})"
+                    ) from None
+
+                kind = message[0]
+                if kind == "progress":
+                    if progress_callback:
+                        progress_callback(message[1])
+                elif kind == "log":
+                    if log_callback:
+                        log_callback(message[1])
+                    else:
+                        print(message[1])
+                elif kind == "done":
+                    return message[1], message[2]
+                elif kind == "error":
+                    raise message[1]
+
+    def _discard(self, process):
+        with self._start_lock:
+            if self._process is process:
+                self._conn.close()
+                self._process = self._conn = None
+        process.join(STOP_TIMEOUT)
+
+build_worker = BuildWorker()
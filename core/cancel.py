@@ -0,0 +1,34 @@
+"""
+Build cancellation - a token the UI sets and the build checks cooperatively
+
+The build checks the token between skins and between archive entries and
+raises BuildCancelled, so the usual cleanup (removing the partial archive,
+the staging folder and the process pool) runs on the way out.
+"""
+import threading
+
+class BuildCancelled(Exception):
+    """Raised inside a build whose CancelToken was cancelled"""
+
+class CancelToken:
+    """Thread-safe flag shared between the UI and a running build"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        """Raise BuildCancelled if cancel() has been called"""
+        if self._event.is_set():
+            raise BuildCancelled("Build cancelled")
+
+def check_cancelled(cancel_token):
+    """token.check() that accepts None for builds that cannot be cancelled"""
+    if cancel_token is not None:
+        cancel_token.check()
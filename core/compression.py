@@ -0,0 +1,95 @@
+"""
+Compression policy - decides per archive entry whether to store or deflate
+"""
+import os
+import zlib
+import zipfile
+
+DEFAULT_PRESET = "balanced"
+
+# store_ratio: entries whose sampled compressed/raw ratio is above this are
+# stored instead of deflated (None = always deflate sampled entries)
+PRESETS = {
+    "fast": {
+        "label": "Fast",
+        "level": 1,
+        "store_extensions": {".dds"},
+        "store_ratio": 0.80
+    },
+    "balanced": {
+        "label": "Balanced",
+        "level": 6,
+        "store_extensions": set(),
+        "store_ratio": 0.90
+    },
+    "smallest": {
+        "label": "Smallest",
+        "level": 9,
+        "store_extensions": set(),
+        "store_ratio": None
+    }
+}
+
+# Formats that are already compressed and never shrink meaningfully
+COMPRESSED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".zip", ".ogg", ".mp3", ".7z"}
+
+# Formats whose compressibility depends on content (BC-compressed vs raw DDS)
+SAMPLED_EXTENSIONS = {".dds"}
+
+SAMPLE_BLOCK_SIZE = 64 * 1024
+SAMPLE_BLOCKS = 4
+DDS_HEADER_SIZE = 128
+
+def get_preset(name):
+    """Get preset settings by name, falling back to the default preset"""
+    return PRESETS.get(name) or PRESETS[DEFAULT_PRESET]
+
+def sample_compressibility(path, size=None):
+    """Estimate compressed/raw ratio of a file by deflating a few blocks
+
+    Blocks are spread evenly over the file (after the DDS header) so the
+    estimate covers the top mip as well as the smaller mip levels.
+    """
+    if size is None:
+        size = os.path.getsize(path)
+
+    start = DDS_HEADER_SIZE if size > DDS_HEADER_SIZE + SAMPLE_BLOCK_SIZE else 0
+    span = max(size - start - SAMPLE_BLOCK_SIZE, 0)
+    offsets = sorted({start + span * i // max(SAMPLE_BLOCKS - 1, 1) for i in range(SAMPLE_BLOCKS)})
+
+    raw_bytes = 0
+    compressed_bytes = 0
+
+    with open(path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            block = f.read(SAMPLE_BLOCK_SIZE)
+            if not block:
+                continue
+            raw_bytes += len(block)
+            compressed_bytes += len(zlib.compress(block, 1))
+
+    if raw_bytes == 0:
+        return 1.0
+
+    return compressed_bytes / raw_bytes
+
+def choose_file_compression(path, preset_name=DEFAULT_PRESET, size=None):
+    """Pick (compress_type, compresslevel) for a file entry"""
+    preset = get_preset(preset_name)
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext in COMPRESSED_EXTENSIONS or ext in preset["store_extensions"]:
+        return zipfile.ZIP_STORED, None
+
+    if ext in SAMPLED_EXTENSIONS and preset["store_ratio"] is not None:
+        ratio = sample_compressibility(path, size)
+        if ratio > preset["store_ratio"]:
+            print(f"[DEBUG] Storing {os.path.basename(path)} uncompressed (sampled ratio {ratio:.2f})")
+            return zipfile.ZIP_STORED, None
+
+    return zipfile.ZIP_DEFLATED, preset["level"]
+
+def choose_data_compression(preset_name=DEFAULT_PRESET):
+    """Pick (compress_type, compresslevel) for rendered text entries"""
+    return zipfile.ZIP_DEFLATED, get_preset(preset_name)["level"]
@@ -0,0 +1,141 @@
+"""
+DDS preview reader - decodes only the mip level a preview needs
+
+Skin textures are usually block-compressed DDS files with a full mip chain,
+so a level close to the preview size is already stored in the file. The
+header is parsed, the smallest level that still covers the preview is
+sliced out of a memory map and wrapped in a one-level DDS header for Pillow
+to decode. Decoding a 512 px level instead of a 4096 px top level is about
+64 times less work, and the downscale that follows is just as much cheaper.
+Uncompressed textures, files without mips and anything this reader does
+not understand are opened with Pillow as a whole.
+"""
+import io
+import mmap
+import struct
+
+from PIL import Image
+
+DDS_MAGIC = b"DDS "
+HEADER_SIZE = 4 + 124
+DX10_HEADER_SIZE = 20
+
+DDSD_MIPMAPCOUNT = 0x20000
+DDPF_FOURCC = 0x4
+DDSCAPS2_VOLUME = 0x200000
+
+# Bytes per 4x4 block of the block-compressed formats Pillow decodes
+FOURCC_BLOCK_SIZES = {
+    b"DXT1": 8,
+    b"DXT3": 16,
+    b"DXT5": 16,
+    b"ATI1": 8,
+    b"BC4U": 8,
+    b"BC4S": 8,
+    b"ATI2": 16,
+    b"BC5U": 16,
+    b"BC5S": 16,
+}
+DXGI_BLOCK_SIZES = {}
+for _formats, _block_size in (
+    ((70, 71, 72), 8),          # BC1
+    ((73, 74, 75), 16),         # BC2
+    ((76, 77, 78), 16),         # BC3
+    ((79, 80, 81), 8),          # BC4
+    ((82, 83, 84), 16),         # BC5
+    ((94, 95, 96), 16),         # BC6H
+    ((97, 98, 99), 16),         # BC7
+):
+    DXGI_BLOCK_SIZES.update(dict.fromkeys(_formats, _block_size))
+
+def _level_size(width, height, block_size):
+    return max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * block_size
+
+def mip_levels(header):
+    """[(width, height, offset, length)] of the mip levels in a DDS header
+
+    header holds at least the first HEADER_SIZE + DX10_HEADER_SIZE bytes of
+    the file. Returns None for files whose levels cannot be located
+    (uncompressed, volume textures, no mip chain, unknown formats).
+    """
+    if len(header) < HEADER_SIZE or header[:4] != DDS_MAGIC:
+        return None
+
+    flags, height, width = struct.unpack_from("<3I", header, 8)
+    mip_count = struct.unpack_from("<I", header, 28)[0]
+    pf_flags, fourcc = struct.unpack_from("<I4s", header, 80)
+    caps2 = struct.unpack_from("<I", header, 112)[0]
+
+    if not flags & DDSD_MIPMAPCOUNT or mip_count <= 1 or caps2 & DDSCAPS2_VOLUME:
+        return None
+    if not pf_flags & DDPF_FOURCC:
+        return None
+
+    offset = HEADER_SIZE
+    if fourcc == b"DX10":
+        if len(header) < HEADER_SIZE + DX10_HEADER_SIZE:
+            return None
+        block_size = DXGI_BLOCK_SIZES.get(struct.unpack_from("<I", header, HEADER_SIZE)[0])
+        offset += DX10_HEADER_SIZE
+    else:
+        block_size = FOURCC_BLOCK_SIZES.get(fourcc)
+    if block_size is None or not width or not height:
+        return None
+
+    # Cube faces and array slices each store a full chain; the first one comes first
+    levels = []
+    for level in range(mip_count):
+        level_width, level_height = max(1, width >> level), max(1, height >> level)
+        length = _level_size(level_width, level_height, block_size)
+        levels.append((level_width, level_height, offset, length))
+        offset += length
+    return levels
+
+def pick_level(levels, size):
+    """Index of the smallest level whose longer edge is still at least size"""
+    chosen = 0
+    for index, (width, height, _, _) in enumerate(levels):
+        if max(width, height) < size:
+            break
+        chosen = index
+    return chosen
+
+def _single_level_header(header, width, height, length):
+    """The file's header rewritten to describe one level of width x height"""
+    data_offset = HEADER_SIZE
+    if header[84:88] == b"DX10":
+        data_offset += DX10_HEADER_SIZE
+    single = bytearray(header[:data_offset])
+    struct.pack_into("<3I", single, 12, height, width, length)
+    struct.pack_into("<I", single, 28, 1)
+    struct.pack_into("<I", single, 8, struct.unpack_from("<I", single, 8)[0] & ~DDSD_MIPMAPCOUNT)
+    if data_offset > HEADER_SIZE:
+        # One texture, not an array
+        struct.pack_into("<I", single, HEADER_SIZE + 12, 1)
+    return bytes(single)
+
+def open_preview(path, size):
+    """Loaded PIL image of path with its longer edge at least size where possible
+
+    The result is the smallest stored mip level that covers size, or the
+    whole texture when the mips cannot be used. Raises OSError if the file
+    cannot be read.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            header = data[:HEADER_SIZE + DX10_HEADER_SIZE]
+            levels = mip_levels(header)
+            if levels:
+                width, height, offset, length = levels[pick_level(levels, size)]
+                if offset + length <= len(data):
+                    single = _single_level_header(header, width, height, length) + data[offset:offset + length]
+                    img = Image.open(io.BytesIO(single))
+                    img.load()
+                    return img
+    except (OSError, ValueError, struct.error) as e:
+        # Empty files cannot be mapped; let Pillow report what is wrong
+        print(f"[DEBUG] Mip preview of {path} failed, decoding it whole: {e}")
+
+    with Image.open(path) as img:
+        img.load()
+        return img
@@ -3,12 +3,30 @@
 
 
 import os
+import sys
 import shutil
 import tempfile
 import zipfile
 import getpass
 import re
 import json
+import concurrent.futures
+import functools
+import contextlib
+import hashlib
+import time
+
+from core.packager import ModPackager, DEFAULT_THREADS
+from core.compression import DEFAULT_PRESET, choose_file_compression
+from core.templates import render_template_file, render_template_edit, JBEAM, JSON
+from core.jbeam import JBeamDocument, JBeamDecodeError
+from core.build_report import BuildReport, stage, collect_stage_times
+from core.unpacked import FolderSync, unpacked_mod_path, is_synced_folder
+from core.cancel import check_cancelled
+from core.manifest import (
+    entry_records, folder_records, archive_records, records_comment, build_manifest,
+    digest_comment, read_archive_digest, manifest_path, save_manifest
+)
 
 def sanitize_skin_id(name):
     return name.replace(" ", "")
@@ -45,136 +63,77 @@ def get_beamng_mods_path():
     print(f"[DEBUG] Using default mods path: {default_path}")
     return default_path
 
-def zip_folder(source_dir, zip_path):
+def zip_folder(
+    source_dir, zip_path, compression_preset=DEFAULT_PRESET, cancel_token=None, threads=DEFAULT_THREADS,
+    reproducible=False, comment=b""
+):
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for root_dir, _, files in os.walk(source_dir):
-            for file in files:
+    with ModPackager(zip_path, compression_preset, cancel_token, threads, reproducible, comment) as packager:
+        for root_dir, dirs, files in os.walk(source_dir):
+            dirs.sort()
+            for file in sorted(files):
+                check_cancelled(cancel_token)
                 full_path = os.path.join(root_dir, file)
-                relative_path = os.path.relpath(full_path, source_dir)
-                zipf.write(full_path, relative_path)
-
-def validate_and_fix_dds_filenames(skin_folder_path, car_id):
+                packager.add_file(os.path.relpath(full_path, source_dir), full_path)
 
-    results = {
-        'renamed': [],
-        'already_correct': [],
-        'errors': []
-    }
-
-    if not os.path.exists(skin_folder_path):
-        results['errors'].append((skin_folder_path, "Folder does not exist"))
-        return results
+def get_fixed_dds_filename(filename, car_id):
+    """Return the <car_id>_skin_<name>.dds form of a DDS filename.
 
+    Returns the filename unchanged when it already matches, or None when no
+    skin name can be extracted from it.
+    """
     correct_pattern = re.compile(rf'^{re.escape(car_id)}_skin_.*\.dds$', re.IGNORECASE)
 
-    for filename in os.listdir(skin_folder_path):
-        if not filename.lower().endswith('.dds'):
-            continue
-
-        file_path = os.path.join(skin_folder_path, filename)
-
-        if correct_pattern.match(filename):
-            print(f"[DEBUG] DDS file already correct: {filename}")
-            results['already_correct'].append(filename)
-            continue
-
-        print(f"[DEBUG] DDS file needs correction: {filename}")
+    if correct_pattern.match(filename):
+        return filename
 
-        skin_name = None
+    skin_name = None
 
-        if '_skin_' in filename.lower():
-            parts = filename.split('_skin_')
-            if len(parts) >= 2:
+    if '_skin_' in filename.lower():
+        parts = filename.split('_skin_')
+        if len(parts) >= 2:
 
-                skin_name = parts[-1].replace('.dds', '').replace('.DDS', '')
+            skin_name = parts[-1].replace('.dds', '').replace('.DDS', '')
 
-        elif filename.lower().startswith('skin_'):
-            skin_name = filename[5:].replace('.dds', '').replace('.DDS', '')
+    elif filename.lower().startswith('skin_'):
+        skin_name = filename[5:].replace('.dds', '').replace('.DDS', '')
 
-        elif 'skin' in filename.lower():
-            skin_index = filename.lower().find('skin')
-            skin_name = filename[skin_index + 4:].replace('.dds', '').replace('.DDS', '')
+    elif 'skin' in filename.lower():
+        skin_index = filename.lower().find('skin')
+        skin_name = filename[skin_index + 4:].replace('.dds', '').replace('.DDS', '')
 
-            skin_name = skin_name.lstrip('_')
+        skin_name = skin_name.lstrip('_')
 
-        else:
-            skin_name = filename.replace('.dds', '').replace('.DDS', '')
-
-        if not skin_name:
-            results['errors'].append((filename, "Could not extract skin name"))
-            continue
-
-        new_filename = f"{car_id}_skin_{skin_name}.dds"
-        new_file_path = os.path.join(skin_folder_path, new_filename)
-
-        if os.path.exists(new_file_path) and new_file_path != file_path:
-            results['errors'].append((filename, f"Target file already exists: {new_filename}"))
-            continue
+    else:
+        skin_name = filename.replace('.dds', '').replace('.DDS', '')
 
-        try:
-            os.rename(file_path, new_file_path)
-            print(f"[DEBUG] Renamed: {filename} -> {new_filename}")
-            results['renamed'].append((filename, new_filename))
-        except Exception as e:
-            results['errors'].append((filename, f"Rename failed: {str(e)}"))
+    if not skin_name:
+        return None
 
-    return results
+    return f"{car_id}_skin_{skin_name}.dds"
 
-def process_dds_files_in_mod(temp_mod_root):
+def canonical_dds_filename(dds_path, car_id):
+    """Name a skin's DDS gets in the mod, worked out before anything is rendered"""
+    filename = os.path.basename(dds_path)
+    return get_fixed_dds_filename(filename, car_id) or filename
 
-    total_results = {
-        'renamed': [],
-        'already_correct': [],
-        'errors': [],
-        'skins_processed': 0
-    }
+def render_info_json_text(content, config_type, config_name):
 
-    vehicles_path = os.path.join(temp_mod_root, "vehicles")
+    config_type_pattern = r'("Config Type"\s*:\s*")[^"]*(")'
+    if re.search(config_type_pattern, content):
+        content = re.sub(config_type_pattern, rf'\g<1>{config_type}\g<2>', content)
+        print(f"[DEBUG]   ✓ Set Config Type to: {config_type}")
+    else:
+        print(f"[WARNING]   'Config Type' key not found")
 
-    if not os.path.exists(vehicles_path):
-        print("[WARNING] No vehicles folder found in mod")
-        return total_results
+    configuration_pattern = r'("Configuration"\s*:\s*")[^"]*(")'
+    if re.search(configuration_pattern, content):
+        content = re.sub(configuration_pattern, rf'\g<1>{config_name}\g<2>', content)
+        print(f"[DEBUG]   ✓ Set Configuration to: {config_name}")
+    else:
+        print(f"[WARNING]   'Configuration' key not found")
 
-    for car_id in os.listdir(vehicles_path):
-        car_path = os.path.join(vehicles_path, car_id)
-
-        if not os.path.isdir(car_path):
-            continue
-
-        print(f"[DEBUG] Processing DDS files for car: {car_id}")
-
-        for item in os.listdir(car_path):
-            item_path = os.path.join(car_path, item)
-
-            if not os.path.isdir(item_path):
-                continue
-
-            print(f"[DEBUG]   Processing skin folder: {item}")
-            results = validate_and_fix_dds_filenames(item_path, car_id)
-
-            total_results['renamed'].extend([(car_id, item, old, new) for old, new in results['renamed']])
-            total_results['already_correct'].extend([(car_id, item, f) for f in results['already_correct']])
-            total_results['errors'].extend([(car_id, item, f, err) for f, err in results['errors']])
-            total_results['skins_processed'] += 1
-
-    print(f"\n[DEBUG] DDS File Processing Summary:")
-    print(f"[DEBUG]   Skins processed: {total_results['skins_processed']}")
-    print(f"[DEBUG]   Files renamed: {len(total_results['renamed'])}")
-    print(f"[DEBUG]   Files already correct: {len(total_results['already_correct'])}")
-    print(f"[DEBUG]   Errors: {len(total_results['errors'])}")
-
-    if total_results['renamed']:
-        print(f"[DEBUG] Renamed files:")
-        for car_id, skin, old, new in total_results['renamed']:
-            print(f"[DEBUG]   {car_id}/{skin}: {old} -> {new}")
-
-    if total_results['errors']:
-        print(f"[DEBUG] Errors:")
-        for car_id, skin, filename, error in total_results['errors']:
-            print(f"[DEBUG]   {car_id}/{skin}/{filename}: {error}")
-
-    return total_results
+    return content
 
 def update_info_json_fields(json_path, config_type, config_name):
 
@@ -184,19 +143,7 @@ def update_info_json_fields(json_path, config_type, config_name):
         with open(json_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        config_type_pattern = r'("Config Type"\s*:\s*")[^"]*(")'
-        if re.search(config_type_pattern, content):
-            content = re.sub(config_type_pattern, rf'\g<1>{config_type}\g<2>', content)
-            print(f"[DEBUG]   ✓ Set Config Type to: {config_type}")
-        else:
-            print(f"[WARNING]   'Config Type' key not found")
-
-        configuration_pattern = r'("Configuration"\s*:\s*")[^"]*(")'
-        if re.search(configuration_pattern, content):
-            content = re.sub(configuration_pattern, rf'\g<1>{config_name}\g<2>', content)
-            print(f"[DEBUG]   ✓ Set Configuration to: {config_name}")
-        else:
-            print(f"[WARNING]   'Configuration' key not found")
+        content = render_info_json_text(content, config_type, config_name)
 
         with open(json_path, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -207,6 +154,21 @@ def update_info_json_fields(json_path, config_type, config_name):
         print(f"[ERROR] Failed to update info JSON fields: {e}")
         return False
 
+def find_info_template(vehicle_template_root):
+
+    for filename in ["info.json", "info_template.json"]:
+        potential_path = os.path.join(vehicle_template_root, filename)
+        if os.path.exists(potential_path):
+            print(f"[DEBUG]   Found info file: {filename}")
+            return potential_path
+
+    for filename in os.listdir(vehicle_template_root):
+        if filename.startswith("info") and filename.endswith(".json"):
+            print(f"[DEBUG]   Found info file (wildcard): {filename}")
+            return os.path.join(vehicle_template_root, filename)
+
+    return None
+
 def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, template_path):
 
     if "config_data" not in skin_data:
@@ -258,8 +220,6 @@ def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, te
 
         vehicle_template_root = os.path.dirname(template_path)
 
-        source_info_file = None
-
         if not os.path.exists(vehicle_template_root):
             print(f"[ERROR]   Vehicle template root does not exist: {vehicle_template_root}")
             return False
@@ -270,19 +230,7 @@ def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, te
         for f in os.listdir(vehicle_template_root):
             print(f"[DEBUG]     - {f}")
 
-        for filename in ["info.json", "info_template.json"]:
-            potential_path = os.path.join(vehicle_template_root, filename)
-            if os.path.exists(potential_path):
-                source_info_file = potential_path
-                print(f"[DEBUG]   Found info file: {filename}")
-                break
-
-        if not source_info_file:
-            for filename in os.listdir(vehicle_template_root):
-                if filename.startswith("info") and filename.endswith(".json"):
-                    source_info_file = os.path.join(vehicle_template_root, filename)
-                    print(f"[DEBUG]   Found info file (wildcard): {filename}")
-                    break
+        source_info_file = find_info_template(vehicle_template_root)
 
         if source_info_file:
             dest_info = os.path.join(vehicle_root, f"info_{skin_name}.json")
@@ -317,147 +265,163 @@ def process_skin_config_data(skin_data, base_carid, skin_name, temp_mod_root, te
         traceback.print_exc()
         return False
 
-def process_material_properties(skin_data, base_carid, skin_id, dest_skin_folder):
-
-    if "material_properties" not in skin_data:
-        return True
-
-    material_props = skin_data["material_properties"]
-    print(f"[DEBUG] ===== Processing material properties for {skin_id} =====")
-    print(f"[DEBUG]   Materials to update: {len(material_props)}")
-    print(f"[DEBUG]   Destination folder: {dest_skin_folder}")
-
-    print(f"[DEBUG]   Material properties data structure (from skin_data):")
-    import json as json_module
-    print(f"[DEBUG]   {json_module.dumps(material_props, indent=4)}")
-    for mat_name, stages in material_props.items():
-        print(f"[DEBUG]     Material: {mat_name}")
-        for stage_key, props in stages.items():
-            print(f"[DEBUG]       Stage {stage_key} (type: {type(stage_key)}): {props}")
+def prepare_material_properties(material_props):
+    """Resolve a skin's material_properties once for all of its materials files
 
-    try:
+    Returns (base material name, [(stage number, properties)]) pairs. A
+    template name like "body.skin.x" applies to the first material whose
+    name starts with "body.skin.".
+    """
+    prepared = []
+    for material_name_template, stages in material_props.items():
+        base_material = material_name_template.split(".skin.")[0]
 
-        materials_files = []
-        for root, dirs, files in os.walk(dest_skin_folder):
-            for filename in files:
-                if filename.endswith('.materials.json') or filename == 'materials.json':
-                    materials_files.append(os.path.join(root, filename))
+        material_stages = []
+        for stage_num_str, properties in stages.items():
+            try:
+                material_stages.append((int(stage_num_str), properties))
+            except (ValueError, TypeError) as e:
+                print(f"[ERROR]     Cannot convert stage number '{stage_num_str}' to int: {e}")
+
+        prepared.append((base_material, material_stages))
+    return prepared
+
+def build_material_index(material_names):
+    """Map each base material name to the position of its first "<base>.skin.*" material"""
+    index = {}
+    for position, name in enumerate(material_names):
+        if ".skin." in name:
+            index.setdefault(name.split(".skin.")[0], position)
+    return index
+
+_material_indexes = {}
+
+def _template_material_index(template_file, material_names):
+    """Material index of a template materials file, built once per template
+
+    Rendering a skin only changes what follows ".skin." in material names,
+    so every skin's rendering of the file has the same index.
+    """
+    stat = os.stat(template_file)
+    key = (os.path.abspath(template_file), stat.st_size, stat.st_mtime_ns)
+    index = _material_indexes.get(key)
+    if index is None:
+        index = _material_indexes[key] = build_material_index(material_names)
+    return index
+
+def material_property_changes(materials_data, prepared_props, index=None):
+    """Resolve prepared material properties against a materials tree
+
+    Returns {(material, "Stages", stage number, property): value} for
+    JBeamDocument.set_values; materials_data is not changed.
+    """
+    material_names = list(materials_data)
+    if index is None:
+        index = build_material_index(material_names)
+
+    changes = {}
+
+    for base_material, stages in prepared_props:
+        position = index.get(base_material)
+        if position is not None and not (
+            position < len(material_names) and material_names[position].startswith(f"{base_material}.skin.")
+        ):
+            # Names no longer line up with the template's index
+            index = build_material_index(material_names)
+            position = index.get(base_material)
+
+        if position is None:
+            continue
 
-        if not materials_files:
-            print(f"[WARNING]   No .materials.json files found in {dest_skin_folder}")
-            return False
+        actual_material_name = material_names[position]
+        material = materials_data[actual_material_name]
+        if not isinstance(material, dict) or not isinstance(material.get("Stages"), list):
+            continue
 
-        print(f"[DEBUG]   Found {len(materials_files)} material file(s)")
-        for mf in materials_files:
-            print(f"[DEBUG]     - {mf}")
+        material_stages = material["Stages"]
+        for stage_num, properties in stages:
+            if not 0 <= stage_num < len(material_stages) or not isinstance(material_stages[stage_num], dict):
+                print(f"[WARNING]     Stage {stage_num} does not exist for {base_material}.skin.* (material has {len(material_stages)} stages)")
+                continue
 
-        for material_file in materials_files:
-            print(f"[DEBUG]   Processing: {os.path.basename(material_file)}")
+            for prop_name, prop_value in properties.items():
+                changes[(actual_material_name, "Stages", stage_num, prop_name)] = prop_value
 
-            with open(material_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+    return changes
 
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
+def apply_material_properties(materials_data, prepared_props, index=None):
+    """Merge prepared material properties into a materials tree; returns the number of values set"""
+    changes = material_property_changes(materials_data, prepared_props, index)
+    for (material_name, _, stage_num, prop_name), value in changes.items():
+        materials_data[material_name]["Stages"][stage_num][prop_name] = value
+    return len(changes)
 
-            try:
-                materials_data = json.loads(content)
-            except json.JSONDecodeError as e:
-                print(f"[ERROR]     JSON decode error in {os.path.basename(material_file)}: {e}")
-                print(f"[ERROR]     Line {e.lineno}, column {e.colno}")
-                continue
+def render_material_properties_text(content, prepared_props, filename, template_file=None):
+    """Return materials file text with prepared_props applied, or None if nothing changed.
 
-            print(f"[DEBUG]     Materials in file: {list(materials_data.keys())}")
+    Only the changed values are rewritten, so comments and formatting in
+    the template are kept. template_file is the template the text was
+    rendered from; its material index is reused across skins.
+    """
+    try:
+        document = JBeamDocument(content)
+    except JBeamDecodeError as e:
+        print(f"[ERROR]     JSON decode error in {filename}: {e}")
+        print(f"[ERROR]     Line {e.lineno}, column {e.colno}")
+        return None
+
+    materials_data = document.data
+    index = _template_material_index(template_file, materials_data) if template_file else None
+
+    changed = apply_material_properties(materials_data, prepared_props, index)
+    if not changed:
+        return None
+
+    print(f"[DEBUG]     Set {changed} material propert{'y' if changed == 1 else 'ies'} in {filename}")
+    return document.dumps()
+
+def is_materials_file(filename):
+    return filename.endswith(".materials.json") or filename == "materials.json"
+
+def render_skin_json(template_file, filename, job, skin_folder, dds_identifier, prepared_props=None):
+    """Render one of a skin's JSON files: template values, material properties and shared texture"""
+    values = {
+        "vehicle_id": job["base_carid"],
+        "skin_folder_name": skin_folder,
+        "dds_filename": job["dds_filename"],
+        "dds_identifier": dds_identifier
+    }
 
-            file_modified = False
+    content = None
+    tuned = bool(prepared_props) and is_materials_file(filename)
+
+    if tuned:
+        # Edits the template's cached parse, so no parse per skin
+        with stage("material properties"):
+            content = render_template_edit(
+                template_file,
+                JSON,
+                lambda data: material_property_changes(
+                    data, prepared_props, _template_material_index(template_file, data)
+                ),
+                **values
+            )
 
-            for material_name_template, stages in material_props.items():
+    if content is None:
+        with stage("json"):
+            content = render_template_file(template_file, JSON, **values)
 
-                if '.skin.' in material_name_template:
-                    base_material = material_name_template.split('.skin.')[0]
-                else:
-                    base_material = material_name_template
-
-                print(f"[DEBUG]     Looking for materials starting with: {base_material}.skin.")
-
-                actual_material_name = None
-                for mat_name in materials_data.keys():
-                    if mat_name.startswith(f"{base_material}.skin."):
-                        actual_material_name = mat_name
-                        print(f"[DEBUG]     Found match: {material_name_template} → {actual_material_name}")
-                        break
-
-                if actual_material_name is None:
-                    print(f"[DEBUG]     No material found matching '{base_material}.skin.*', skipping")
-                    continue
-
-                print(f"[DEBUG]     Found material '{actual_material_name}' in file")
-
-                if "Stages" not in materials_data[actual_material_name]:
-                    print(f"[DEBUG]     Material '{actual_material_name}' has no Stages, skipping")
-                    continue
-
-                material_stages = materials_data[actual_material_name]["Stages"]
-                print(f"[DEBUG]     Material has {len(material_stages)} stages")
-
-                for stage_num_str, properties in stages.items():
-                    print(f"[DEBUG]     Processing stage_num_str: '{stage_num_str}' (type: {type(stage_num_str).__name__})")
-
-                    try:
-                        stage_num = int(stage_num_str)
-                        print(f"[DEBUG]     Converted to stage_num: {stage_num} (type: int)")
-                    except (ValueError, TypeError) as e:
-                        print(f"[ERROR]     Cannot convert stage number '{stage_num_str}' to int: {e}")
-                        continue
-
-                    if stage_num >= len(material_stages):
-                        print(f"[WARNING]     Stage {stage_num} does not exist for {actual_material_name} (material has {len(material_stages)} stages)")
-                        continue
-
-                    stage = material_stages[stage_num]
-                    print(f"[DEBUG]     Updating stage {stage_num} with {len(properties)} properties")
-                    print(f"[DEBUG]     Stage {stage_num} current keys: {list(stage.keys())}")
-                    print(f"[DEBUG]     Properties to update: {properties}")
-
-                    for prop_name, prop_value in properties.items():
-                        old_value = stage.get(prop_name, "NOT_FOUND")
-                        stage[prop_name] = prop_value
-                        print(f"[DEBUG]       ✓ Set {actual_material_name}.Stages[{stage_num}].{prop_name}")
-                        print(f"[DEBUG]         Old: {old_value}")
-                        print(f"[DEBUG]         New: {prop_value}")
-                        file_modified = True
-
-            if file_modified:
-
-                print(f"[DEBUG]   Writing updated material data to file...")
-                print(f"[DEBUG]   Sample of updated materials (first material only):")
-                first_material = list(materials_data.keys())[0] if materials_data else None
-                if first_material and "Stages" in materials_data[first_material]:
-                    import json as json_module
-                    print(f"[DEBUG]   {first_material}:")
-                    print(f"[DEBUG]   {json_module.dumps(materials_data[first_material]['Stages'], indent=6)}")
-
-                with open(material_file, 'w', encoding='utf-8') as f:
-                    json.dump(materials_data, f, indent=2)
-                print(f"[DEBUG]   ✓ Updated {os.path.basename(material_file)}")
-
-                print(f"[DEBUG]   Verifying file was written correctly...")
-                with open(material_file, 'r', encoding='utf-8') as f:
-                    verify_content = f.read()
-                    if "0.69" in verify_content:
-                        print(f"[DEBUG]   ✓ Verification: Found '0.69' in saved file")
-                    else:
-                        print(f"[WARNING]   Verification: Did NOT find '0.69' in saved file")
-            else:
-                print(f"[DEBUG]   No changes needed for {os.path.basename(material_file)}")
+        if tuned:
+            with stage("material properties"):
+                updated = render_material_properties_text(content, prepared_props, filename, template_file)
+            if updated is not None:
+                content = updated
 
-        print(f"[DEBUG] ===== Material properties processing complete =====")
-        return True
+    if job.get("shared_dds"):
+        with stage("json"):
+            content = point_at_shared_texture(content, job)
 
-    except Exception as e:
-        print(f"[ERROR] process_material_properties: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    return content
 
 def generate_mod(
     mod_name,
@@ -466,7 +430,10 @@ def generate_mod(
     dds_path,
     output_path=None,
     progress_callback=None,
-    author=None
+    author=None,
+    streaming=False,
+    compression_preset=DEFAULT_PRESET,
+    report=None
 ):
 
     print(f"\n{'='*60}")
@@ -483,6 +450,48 @@ def generate_mod(
     if not os.path.exists(template_path):
         raise FileNotFoundError(f"No template found for vehicle '{vehicle_id}'")
 
+    if report is None:
+        report = BuildReport()
+    report.mod_name = mod_name
+    report.mode = "streaming" if streaming else "staging"
+    report.info.update({"cars": 1, "skins": 1, "jobs": 1, "compression": compression_preset})
+
+    if streaming:
+        job = {
+            "base_carid": vehicle_id,
+            "template_path": template_path,
+            "skin": {"name": skin_display_name, "dds_path": dds_path},
+            "author": author or "Unknown",
+            "label": "",
+            "skin_folder": mod_name,
+            "dds_filename": os.path.basename(dds_path)
+        }
+
+        skin_start = time.perf_counter()
+        skin_cpu_start = time.process_time()
+        entries = render_skin_entries(job)
+        report.add_skin(
+            vehicle_id,
+            skin_display_name,
+            time.perf_counter() - skin_start,
+            time.process_time() - skin_cpu_start
+        )
+
+        if progress_callback: progress_callback(0.6)
+
+        mods_path = output_path or get_beamng_mods_path()
+        os.makedirs(mods_path, exist_ok=True)
+        zip_path = os.path.join(mods_path, f"{mod_name}.zip")
+
+        with stage("zip"), ModPackager(zip_path, compression_preset) as packager:
+            packager.add_entries(entries)
+
+        _finish_report(report, zip_path)
+
+        if progress_callback: progress_callback(1.0)
+
+        return zip_path
+
     temp_dir = tempfile.mkdtemp()
 
     try:
@@ -491,21 +500,25 @@ def generate_mod(
         def ignore_dds_files(directory, files):
             return [f for f in files if f.lower().endswith(".dds")]
 
-        shutil.copytree(template_path, dest_skin_folder, ignore=ignore_dds_files)
+        with stage("template copy"):
+            shutil.copytree(template_path, dest_skin_folder, ignore=ignore_dds_files)
 
         if progress_callback: progress_callback(0.2)
 
         dds_filename = os.path.basename(dds_path)
-        shutil.copy(dds_path, os.path.join(dest_skin_folder, dds_filename))
+        with stage("dds copy"):
+            shutil.copy(dds_path, os.path.join(dest_skin_folder, dds_filename))
         dds_last = os.path.splitext(dds_filename)[0].split("_")[-1]
 
         if progress_callback: progress_callback(0.4)
 
-        process_jbeam_files(dest_skin_folder, dds_last, skin_display_name, author or "Unknown")
+        with stage("jbeam"):
+            process_jbeam_files(dest_skin_folder, dds_last, skin_display_name, author or "Unknown")
 
         if progress_callback: progress_callback(0.6)
 
-        process_json_files(dest_skin_folder, vehicle_id, mod_name, dds_filename, dds_last)
+        with stage("json"):
+            process_json_files(dest_skin_folder, vehicle_id, mod_name, dds_filename, dds_last)
 
         if progress_callback: progress_callback(0.8)
 
@@ -513,7 +526,10 @@ def generate_mod(
         os.makedirs(mods_path, exist_ok=True)
         zip_path = os.path.join(mods_path, f"{mod_name}.zip")
 
-        zip_folder(temp_dir, zip_path)
+        with stage("zip"):
+            zip_folder(temp_dir, zip_path, compression_preset)
+
+        _finish_report(report, zip_path)
 
         if progress_callback: progress_callback(1.0)
 
@@ -523,183 +539,768 @@ def generate_mod(
         if os.path.exists(temp_dir):
             shutil.rmtree(temp_dir)
 
-def generate_multi_skin_mod(
-    project_data,
-    output_path=None,
-    progress_callback=None
-):
-    print(f"\n{'='*60}")
-    print(f"MULTI-SKIN MOD GENERATION")
-    print(f"{'='*60}")
+def _is_rendered_json(filename):
+    return filename.endswith(".json") and not filename.startswith("info")
+
+def _ignore_skin_template_files(directory, files):
+    return [f for f in files if f.lower().endswith(".dds") or _is_rendered_json(f)]
+
+def collect_skin_jobs(project_data, vehicles_root=None):
 
-    mod_name = sanitize_mod_name(project_data["mod_name"])
     author = project_data.get("author", "Unknown")
-    cars = project_data["cars"]
+    vehicles_root = vehicles_root or os.path.join(os.getcwd(), "vehicles")
+    jobs = []
+    # The game and Windows ignore case, so "Red" and "red" are one folder
+    skin_folders = {}
+
+    for car_instance_id, car_info in project_data["cars"].items():
+        base_carid = car_info.get("base_carid", car_instance_id)
+        skins = car_info["skins"]
+
+        template_path = os.path.join(vehicles_root, base_carid, "SKINNAME")
+
+        if not os.path.exists(template_path):
+            raise FileNotFoundError(
+                f"No template found for vehicle '{base_carid}'.\n"
+                f"Expected location: {template_path}\n\n"
+                f"Please make sure the vehicle exists in the Developer tab."
+            )
 
-    total_cars = len(cars)
-    total_skins = sum(len(car_info['skins']) for car_info in cars.values())
+        for skin_idx, skin in enumerate(skins):
+            skin_folder = sanitize_folder_name(skin["name"])
+            folder_key = (base_carid, skin_folder.lower())
+            if folder_key in skin_folders:
+                raise FileExistsError(
+                    f"The skins '{skin_folders[folder_key]}' and '{skin['name']}' would both be stored in "
+                    f"'vehicles/{base_carid}/{skin_folder}'.\n"
+                    f"Please give every skin of a vehicle a different name."
+                )
+            skin_folders[folder_key] = skin["name"]
+
+            jobs.append({
+                "car_instance_id": car_instance_id,
+                "base_carid": base_carid,
+                "template_path": template_path,
+                "skin": skin,
+                "author": author,
+                "label": f"{base_carid} [{skin_idx + 1}/{len(skins)}]",
+                "dds_filename": canonical_dds_filename(skin["dds_path"], base_carid)
+            })
+
+    return jobs
+
+def _skin_dds_arcname(job):
+    """Archive path of a skin's DDS under its final filename"""
+    skin_folder = job.get("skin_folder") or sanitize_folder_name(job["skin"]["name"])
+    return f"vehicles/{job['base_carid']}/{skin_folder}/{job['dds_filename']}"
+
+def _file_sha256(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def dedupe_skin_textures(skin_jobs, file_digest=None):
+    """Store each distinct DDS once by pointing duplicates at the first copy.
+
+    Skins whose DDS has the same content as an earlier skin's get
+    job["shared_dds"], the archive path of that copy; they leave their own
+    DDS out and their materials reference the shared one instead. Only
+    files of equal size are hashed. Returns (duplicates, bytes_saved).
+    """
+    file_digest = file_digest or _file_sha256
+
+    by_size = {}
+    for job in skin_jobs:
+        try:
+            size = os.path.getsize(job["skin"]["dds_path"])
+        except OSError:
+            continue
+        by_size.setdefault(size, []).append(job)
 
-    print(f"Mod Name: {mod_name}")
-    print(f"Author: {author}")
-    print(f"Total Cars: {total_cars}")
-    print(f"Total Skins: {total_skins}")
+    duplicates = 0
+    bytes_saved = 0
 
-    temp_dir = tempfile.mkdtemp()
-    print(f"Temp directory: {temp_dir}")
+    for size, jobs_of_size in by_size.items():
+        if len(jobs_of_size) < 2:
+            continue
+
+        first_by_digest = {}
+        for job in jobs_of_size:
+            digest = file_digest(job["skin"]["dds_path"])
+            arcname = _skin_dds_arcname(job)
+            shared = first_by_digest.setdefault(digest, arcname)
+
+            if shared != arcname:
+                job["shared_dds"] = shared
+                duplicates += 1
+                bytes_saved += size
+                print(f"  {job['label']} Sharing texture with {shared}")
+
+    if duplicates:
+        print(f"Deduplicated {duplicates} DDS texture(s), {bytes_saved / (1024 * 1024):.1f} MB not stored twice")
+
+    return duplicates, bytes_saved
+
+def point_at_shared_texture(content, job):
+    """Rewrite references to a skin's own DDS to job["shared_dds"]"""
+    base_carid = job["base_carid"]
+    skin_arc = os.path.dirname(_skin_dds_arcname(job))
+    dds_filename = os.path.basename(job["skin"]["dds_path"])
+    dds_identifier = os.path.splitext(dds_filename)[0].split("_")[-1]
+
+    names = {
+        dds_filename,
+        os.path.basename(_skin_dds_arcname(job)),
+        f"{base_carid}_skin_{dds_identifier}.dds"
+    }
+    pattern = re.compile(
+        r'(["\']/?)' + re.escape(skin_arc) + "/(?:" + "|".join(map(re.escape, names)) + r')(?=["\'])',
+        re.IGNORECASE
+    )
+    return pattern.sub(lambda match: match.group(1) + job["shared_dds"], content)
+
+def build_skin(job, temp_mod_root):
+    """Build one skin into its own staging subtree under temp_mod_root.
+
+    Runs in the GUI process for serial builds and in a worker process
+    for parallel builds, so everything it needs comes in through job.
+    The archive comes out the same either way: entries carry the archive's
+    start time, not the staging files' (see core.packager).
+    """
+    skin = job["skin"]
+    base_carid = job["base_carid"]
+    template_path = job["template_path"]
+    author = job["author"]
+
+    skin_folder = sanitize_folder_name(skin["name"])
+    dds_path = skin["dds_path"]
+
+    print(f"  {job['label']} Processing: {skin['name']} -> {skin_folder}")
+
+    dest_skin_folder = os.path.join(
+        temp_mod_root,
+        "vehicles",
+        base_carid,
+        skin_folder
+    )
+
+    with stage("template copy"):
+        # The JSON files are rendered straight from the template below
+        shutil.copytree(template_path, dest_skin_folder, ignore=_ignore_skin_template_files)
+
+    # Copied under its final name, which the materials reference directly
+    dds_filename = job["dds_filename"]
+    if not job.get("shared_dds"):
+        with stage("dds copy"):
+            shutil.copy(dds_path, os.path.join(dest_skin_folder, dds_filename))
+
+    dds_identifier = os.path.splitext(os.path.basename(dds_path))[0].split("_")[-1]
+
+    with stage("jbeam"):
+        process_jbeam_files(
+            dest_skin_folder,
+            dds_identifier,
+            skin["name"],
+            author
+        )
+
+    material_props = skin.get("material_properties")
+    prepared_props = prepare_material_properties(material_props) if material_props else None
+
+    for root_dir, _, files in os.walk(template_path):
+        for file in files:
+            if not _is_rendered_json(file):
+                continue
+
+            template_file = os.path.join(root_dir, file)
+            dest_path = os.path.join(dest_skin_folder, os.path.relpath(template_file, template_path))
+
+            content = render_skin_json(template_file, file, job, skin_folder, dds_identifier, prepared_props)
+            with open(dest_path, "w", encoding="utf-8") as f:
+                f.write(content)
+
+    if "config_data" in skin:
+        print(f"  → Processing config data...")
+        with stage("config data"):
+            success = process_skin_config_data(
+                skin,
+                base_carid,
+                skin_folder,
+                temp_mod_root,
+                template_path
+            )
+        if not success:
+            print(f"  [WARNING] Config data processing failed for {skin_folder}")
+
+    return skin_folder
+
+def render_config_entries(skin_data, base_carid, skin_name, template_path):
+
+    config_data = skin_data["config_data"]
+    config_type = config_data.get("config_type", "Factory")
+    config_name = config_data.get("config_name", skin_data.get("name", skin_name))
+    pc_path = config_data.get("pc_file_path")
+    jpg_path = config_data.get("jpg_file_path")
+
+    print(f"[DEBUG] ===== Rendering config data for {skin_name} =====")
+
+    has_errors = False
+    if pc_path and not os.path.exists(pc_path):
+        print(f"[ERROR]   .pc file not found: {pc_path}")
+        has_errors = True
+    if jpg_path and not os.path.exists(jpg_path):
+        print(f"[ERROR]   .jpg file not found: {jpg_path}")
+        has_errors = True
+
+    if has_errors:
+        print(f"[ERROR] Config data validation failed for {skin_name}")
+        return []
+
+    vehicle_arc = f"vehicles/{base_carid}"
+    entries = []
+
+    if pc_path:
+        entries.append((f"{vehicle_arc}/{skin_name}.pc", "file", pc_path))
+
+    if jpg_path:
+        entries.append((f"{vehicle_arc}/{skin_name}.jpg", "file", jpg_path))
+
+    vehicle_template_root = os.path.dirname(template_path)
+    source_info_file = find_info_template(vehicle_template_root)
+
+    if not source_info_file:
+        print(f"[ERROR]   No info.json template found in {template_path}")
+        return entries
+
+    with open(source_info_file, 'r', encoding='utf-8') as f:
+        content = f.read()
 
     try:
-        processed_skins = 0
+        content = render_info_json_text(content, config_type, config_name)
+    except Exception as e:
+        print(f"[ERROR] Failed to update info JSON fields: {e}")
 
-        for car_instance_id, car_info in cars.items():
-            base_carid = car_info.get("base_carid", car_instance_id)
-            skins = car_info["skins"]
+    entries.append((f"{vehicle_arc}/info_{skin_name}.json", "text", content))
+    return entries
 
-            print(f"\n--- Processing {base_carid} ({len(skins)} skins) ---")
+def render_skin_entries(job):
+    """Render one skin to archive entries in memory, without a staging folder.
 
-            template_path = os.path.join(os.getcwd(), "vehicles", base_carid, "SKINNAME")
+    Returns (arcname, kind, payload) tuples for ModPackager.add_entries:
+    templated text is rendered here and the DDS and config files are
+    referenced by their original paths so they can be streamed later.
+    """
+    skin = job["skin"]
+    base_carid = job["base_carid"]
+    template_path = job["template_path"]
+    author = job["author"]
 
-            if not os.path.exists(template_path):
-                raise FileNotFoundError(
-                    f"No template found for vehicle '{base_carid}'.\n"
-                    f"Expected location: {template_path}\n\n"
-                    f"Please make sure the vehicle exists in the Developer tab."
-                )
+    skin_folder = job.get("skin_folder") or sanitize_folder_name(skin["name"])
+    dds_path = skin["dds_path"]
+    material_props = skin.get("material_properties")
+    prepared_props = prepare_material_properties(material_props) if material_props else None
 
-            for skin_idx, skin in enumerate(skins):
-                skin_id = sanitize_skin_id(skin["name"])
-                skin_folder = sanitize_folder_name(skin["name"])
-                dds_path = skin["dds_path"]
+    print(f"  {job['label']} Rendering: {skin['name']} -> {skin_folder}")
 
-                print(f"  [{skin_idx + 1}/{len(skins)}] Processing: {skin['name']} -> {skin_folder}")
+    skin_arc = f"vehicles/{base_carid}/{skin_folder}"
 
-                dest_skin_folder = os.path.join(
-                    temp_dir,
-                    "vehicles",
-                    base_carid,
-                    skin_folder
-                )
+    dds_filename = job["dds_filename"]
+    dds_identifier = os.path.splitext(os.path.basename(dds_path))[0].split("_")[-1]
 
-                def ignore_dds_files(directory, files):
-                    return [f for f in files if f.lower().endswith(".dds")]
+    entries = []
 
-                shutil.copytree(template_path, dest_skin_folder, ignore=ignore_dds_files)
+    for root_dir, _, files in os.walk(template_path):
+        for file in files:
+            if file.lower().endswith(".dds"):
+                continue
 
-                dds_filename = os.path.basename(dds_path)
-                dds_dest = os.path.join(dest_skin_folder, dds_filename)
-                shutil.copy(dds_path, dds_dest)
+            source_path = os.path.join(root_dir, file)
+            rel_path = os.path.relpath(source_path, template_path).replace(os.sep, "/")
+            arcname = f"{skin_arc}/{rel_path}"
+
+            if file.endswith(".jbeam"):
+                with stage("jbeam"):
+                    content = render_template_file(
+                        source_path,
+                        JBEAM,
+                        dds_identifier=dds_identifier,
+                        skin_display_name=skin["name"],
+                        author=author
+                    )
+
+            elif _is_rendered_json(file):
+                content = render_skin_json(source_path, file, job, skin_folder, dds_identifier, prepared_props)
 
-                dds_identifier = os.path.splitext(dds_filename)[0].split("_")[-1]
+            else:
+                entries.append((arcname, "file", source_path))
+                continue
 
-                process_jbeam_files(
-                    dest_skin_folder,
-                    dds_identifier,
-                    skin["name"],
-                    author
+            entries.append((arcname, "text", content))
+
+    if not job.get("shared_dds"):
+        entries.append((f"{skin_arc}/{dds_filename}", "file", dds_path))
+
+    if "config_data" in skin:
+        with stage("config data"):
+            entries.extend(render_config_entries(skin, base_carid, skin_folder, template_path))
+
+    return entries
+
+def build_skin_artifact(job, compression_preset=DEFAULT_PRESET, threads=1):
+    """Render one skin and compress its entries into job["artifact_path"].
+
+    Used by the build cache; runs in worker processes for parallel builds,
+    which compress on one thread each.
+    The artifact is written under a temporary name first so a failed build
+    never leaves a partial artifact behind under its final name.
+    """
+    artifact_path = job["artifact_path"]
+    temp_path = f"{artifact_path}.{os.getpid()}.{int(time.time() * 1000)}.tmp"
+
+    entries = render_skin_entries(job)
+
+    # Reproducible builds read the entry hashes from here instead of
+    # hashing the cached entries again
+    with stage("manifest"):
+        comment = records_comment(entry_records(entries))
+
+    with stage("compress"), ModPackager(temp_path, compression_preset, threads=threads, comment=comment) as packager:
+        packager.add_entries(entries)
+
+    os.replace(temp_path, artifact_path)
+    return artifact_path
+
+def _build_cached_artifacts(
+    skin_jobs, build_cache, compression_preset, jobs, progress_callback, report=None, cancel_token=None
+):
+    """Build artifacts for skins that changed and reuse the rest from the cache.
+
+    Returns the artifact paths in job order, the cache keys in use and the
+    cache lease that keeps them from being evicted; release it once the
+    artifacts are merged.
+    """
+    with stage("cache lookup"):
+        keys = [build_cache.skin_key(job, compression_preset) for job in skin_jobs]
+        build_cache.save()
+
+    lease = build_cache.hold(keys)
+    try:
+        artifact_paths = _build_leased_artifacts(
+            skin_jobs, keys, build_cache, compression_preset, jobs, progress_callback, report, cancel_token
+        )
+    except BaseException:
+        build_cache.release(lease)
+        raise
+
+    return artifact_paths, keys, lease
+
+def _build_leased_artifacts(
+    skin_jobs, keys, build_cache, compression_preset, jobs, progress_callback, report=None, cancel_token=None
+):
+    """Look up leased keys and build the artifacts that are missing; returns their paths in job order"""
+    artifact_paths = []
+    dirty_jobs = []
+
+    with stage("cache lookup"):
+        for job, key in zip(skin_jobs, keys):
+            artifact_paths.append(build_cache.artifact_path(key))
+
+            if build_cache.lookup(key) is None:
+                dirty_jobs.append(dict(job, artifact_path=build_cache.artifact_path(key)))
+
+    print(f"Build cache: {len(skin_jobs) - len(dirty_jobs)} unchanged, {len(dirty_jobs)} to build")
+
+    if report is not None:
+        report.info["cache_hits"] = len(skin_jobs) - len(dirty_jobs)
+        report.info["cache_misses"] = len(dirty_jobs)
+
+    if dirty_jobs:
+        # Skins built one at a time get the compression threads to themselves
+        threads = DEFAULT_THREADS if jobs <= 1 or len(dirty_jobs) <= 1 else 1
+        _run_skin_jobs(
+            dirty_jobs,
+            functools.partial(build_skin_artifact, compression_preset=compression_preset, threads=threads),
+            jobs,
+            progress_callback,
+            report,
+            cancel_token
+        )
+
+    return artifact_paths
+
+CANCEL_POLL_INTERVAL = 0.2
+
+# Set by headless callers that keep stdout for machine-readable output;
+# inherited by worker processes through the environment
+WORKER_LOG_TO_STDERR_ENV = "BEAMSKIN_LOG_TO_STDERR"
+
+def _init_skin_worker():
+    if os.environ.get(WORKER_LOG_TO_STDERR_ENV):
+        sys.stdout = sys.stderr
+
+def _timed_skin_task(task, job):
+    """Run task(job) and return its result with the skin's timings"""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    with collect_stage_times() as stage_times:
+        result = task(job)
+
+    timing = {
+        "label": job.get("label", ""),
+        "name": job["skin"]["name"],
+        "wall": time.perf_counter() - wall_start,
+        "cpu": time.process_time() - cpu_start,
+        "pid": os.getpid(),
+        "stages": stage_times
+    }
+    return result, timing
+
+def _run_skin_jobs(skin_jobs, task, jobs, progress_callback, report=None, cancel_token=None):
+    """Run task(job) for every skin job, serially or in a process pool.
+
+    Results come back in job order; progress is reported as jobs finish.
+    Per-skin and per-stage timings are added to report when given.
+    cancel_token is checked between skins; on cancel, skins not started
+    yet are dropped and the pool only waits for the ones already running.
+    """
+    total_skins = len(skin_jobs)
+    processed_skins = 0
+    results = [None] * total_skins
+    task = functools.partial(_timed_skin_task, task)
+
+    def record(index, outcome):
+        result, timing = outcome
+        results[index] = result
+        if report is not None:
+            report.add_skin(timing["label"], timing["name"], timing["wall"], timing["cpu"], timing["pid"])
+            report.merge_stage_times(timing["stages"])
+
+    def report_progress():
+        if progress_callback:
+            progress = 0.1 + (processed_skins / total_skins) * 0.75
+            progress_callback(progress)
+
+    if jobs <= 1 or total_skins <= 1:
+        for index, job in enumerate(skin_jobs):
+            check_cancelled(cancel_token)
+            record(index, task(job))
+            processed_skins += 1
+            report_progress()
+        return results
+
+    workers = min(jobs, total_skins)
+    print(f"Building {total_skins} skins with {workers} worker processes")
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_skin_worker) as pool:
+        futures = {pool.submit(task, job): index for index, job in enumerate(skin_jobs)}
+        pending = set(futures)
+
+        try:
+            while pending:
+                # Wake up regularly so a cancel is noticed between skins
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=CANCEL_POLL_INTERVAL, return_when=concurrent.futures.FIRST_COMPLETED
                 )
+                for future in done:
+                    record(futures[future], future.result())
+                    processed_skins += 1
+                    report_progress()
+                check_cancelled(cancel_token)
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    return results
+
+@contextlib.contextmanager
+def _output_zip(zip_path, overwrite):
+    """Yield the path to write the mod ZIP to.
+
+    When replacing an existing mod the archive is written under a temporary
+    name and moved into place once complete, so the game never loads a
+    half-written file.
+    """
+    if not overwrite:
+        yield zip_path
+        return
+
+    temp_path = f"{zip_path}.{os.getpid()}.tmp"
+    try:
+        yield temp_path
+        os.replace(temp_path, zip_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def _sync_unpacked_mod(skin_jobs, mods_path, mod_name, jobs, progress_callback, report, cancel_token=None):
+    """Render every skin in memory and sync it into <mods>/unpacked/<mod_name>.
+
+    Nothing is compressed; only files whose content changed are written and
+    files from earlier builds that are no longer produced are removed.
+    """
+    mod_dir = unpacked_mod_path(mods_path, mod_name)
+    print(f"Unpacked folder: {mod_dir}")
+
+    if not is_synced_folder(mod_dir):
+        raise FileExistsError(
+            f"An unpacked mod folder named '{mod_name}' already exists.\n"
+            f"It was not created by BeamSkin Studio, so it is left untouched."
+        )
+
+    report.mode = "unpacked"
+    skin_entries = _run_skin_jobs(
+        skin_jobs, render_skin_entries, jobs or 1, progress_callback, report, cancel_token
+    )
+
+    if progress_callback:
+        progress_callback(0.9)
+
+    folder_sync = FolderSync(mod_dir, cancel_token)
+    with stage("sync"):
+        folder_sync.sync([entry for entries in skin_entries for entry in entries])
+
+    report.info["sync"] = {
+        "written": folder_sync.written,
+        "unchanged": folder_sync.unchanged,
+        "removed": folder_sync.removed,
+        "bytes_written": folder_sync.bytes_written
+    }
+    _finish_report(report, mod_dir)
+
+    if progress_callback:
+        progress_callback(1.0)
+
+    print(f"\n✓ Unpacked mod synced successfully!")
+    print(f"  Written: {folder_sync.written}, unchanged: {folder_sync.unchanged}, removed: {folder_sync.removed}")
+    print(f"  Location: {mod_dir}")
+    print(f"{'='*60}\n")
+
+    return mod_dir
 
-                process_json_files(
-                    dest_skin_folder,
-                    base_carid,
-                    skin_folder,
-                    dds_filename,
-                    dds_identifier
+def _check_zip_free(zip_path, mod_name, overwrite):
+    if os.path.exists(zip_path) and not overwrite:
+        raise FileExistsError(
+            f"A mod named '{mod_name}.zip' already exists.\n"
+            f"Please choose a different name or delete the existing file."
+        )
+
+def _archive_unchanged(zip_path, manifest, report):
+    """True when zip_path already is the archive the manifest describes
+
+    The existing ZIP is then left untouched, so its modification time
+    still says when its content last changed.
+    """
+    if read_archive_digest(zip_path) != manifest["digest"]:
+        return False
+
+    if not os.path.exists(manifest_path(zip_path)):
+        save_manifest(zip_path, manifest)
+
+    report.info["unchanged"] = True
+    print(f"\nNothing changed since the last build, keeping {zip_path}")
+    return True
+
+def _finish_report(report, zip_path):
+    try:
+        if os.path.isdir(zip_path):
+            report.add_folder(zip_path)
+        else:
+            report.add_archive(zip_path)
+        report.finish()
+        report.save()
+        print(f"\n{report.summary()}")
+    except Exception as e:
+        print(f"[WARNING] Could not write build report: {e}")
+
+def generate_multi_skin_mod(
+    project_data,
+    output_path=None,
+    progress_callback=None,
+    jobs=1,
+    streaming=False,
+    compression_preset=DEFAULT_PRESET,
+    build_cache=None,
+    vehicles_root=None,
+    report=None,
+    overwrite=False,
+    unpacked=False,
+    cancel_token=None,
+    reproducible=False
+):
+    print(f"\n{'='*60}")
+    print(f"MULTI-SKIN MOD GENERATION")
+    print(f"{'='*60}")
+
+    mod_name = sanitize_mod_name(project_data["mod_name"])
+    author = project_data.get("author", "Unknown")
+    cars = project_data["cars"]
+
+    total_cars = len(cars)
+    total_skins = sum(len(car_info['skins']) for car_info in cars.values())
+
+    print(f"Mod Name: {mod_name}")
+    print(f"Author: {author}")
+    print(f"Total Cars: {total_cars}")
+    print(f"Total Skins: {total_skins}")
+    print(f"Compression: {compression_preset}")
+
+    if report is None:
+        report = BuildReport()
+    report.mod_name = mod_name
+    report.mode = ("cached" if build_cache is not None else "streaming") if streaming else "staging"
+    report.info.update({
+        "cars": total_cars,
+        "skins": total_skins,
+        "jobs": jobs or 1,
+        "compression": compression_preset,
+        "build_cache": build_cache is not None,
+        "reproducible": reproducible
+    })
+
+    skin_jobs = collect_skin_jobs(project_data, vehicles_root)
+
+    with stage("dds dedup"):
+        shared_textures, dedup_bytes_saved = dedupe_skin_textures(
+            skin_jobs,
+            build_cache.file_digest if build_cache is not None else None
+        )
+    report.info["shared_textures"] = shared_textures
+    report.info["dedup_bytes_saved"] = dedup_bytes_saved
+
+    mods_path = output_path or get_beamng_mods_path()
+    os.makedirs(mods_path, exist_ok=True)
+
+    if unpacked:
+        return _sync_unpacked_mod(skin_jobs, mods_path, mod_name, jobs, progress_callback, report, cancel_token)
+
+    zip_path = os.path.join(mods_path, f"{mod_name}.zip")
+
+    print(f"ZIP path: {zip_path}")
+
+    # A reproducible build of an unchanged project keeps the existing ZIP,
+    # so it is only refused once the manifest shows the archive differs
+    if not reproducible:
+        _check_zip_free(zip_path, mod_name, overwrite)
+
+    if streaming:
+        cache_lease = None
+        try:
+            if build_cache is not None:
+                artifact_paths, cache_keys, cache_lease = _build_cached_artifacts(
+                    skin_jobs, build_cache, compression_preset, jobs or 1, progress_callback, report, cancel_token
+                )
+            else:
+                skin_entries = _run_skin_jobs(
+                    skin_jobs, render_skin_entries, jobs or 1, progress_callback, report, cancel_token
                 )
 
-                if "config_data" in skin:
-                    print(f"  → Processing config data...")
-                    success = process_skin_config_data(
-                        skin,
-                        base_carid,
-                        skin_folder,
-                        temp_dir,
-                        template_path
-                    )
-                    if not success:
-                        print(f"  [WARNING] Config data processing failed for {skin_folder}")
-
-                if "material_properties" in skin:
-                    print(f"  → Processing material properties...")
-                    success = process_material_properties(
-                        skin,
-                        base_carid,
-                        skin_folder,
-                        dest_skin_folder
-                    )
-                    if not success:
-                        print(f"  [WARNING] Material properties processing failed for {skin_folder}")
+                all_entries = [entry for entries in skin_entries for entry in entries]
 
-                processed_skins += 1
-                if progress_callback:
+            manifest = None
+            if reproducible:
+                with stage("manifest"):
+                    records = archive_records(artifact_paths) if build_cache is not None else entry_records(all_entries)
+                    manifest = build_manifest(records, mod_name, compression_preset)
+                report.info["manifest_digest"] = manifest["digest"]
 
-                    progress = 0.1 + (processed_skins / total_skins) * 0.75
-                    progress_callback(progress)
+            unchanged = manifest is not None and _archive_unchanged(zip_path, manifest, report)
 
-        print(f"\n{'='*60}")
-        print(f"VALIDATING AND FIXING DDS FILENAMES")
-        print(f"{'='*60}")
+            if not unchanged:
+                _check_zip_free(zip_path, mod_name, overwrite)
+                print(f"\nStreaming skins into ZIP file...")
 
-        dds_results = process_dds_files_in_mod(temp_dir)
+                if progress_callback:
+                    progress_callback(0.9)
+
+                with stage("zip"), _output_zip(zip_path, overwrite) as write_path, \
+                        ModPackager(
+                            write_path, compression_preset, cancel_token,
+                            reproducible=reproducible, comment=digest_comment(manifest) if manifest else b""
+                        ) as packager:
+                    if build_cache is not None:
+                        packager.add_archives(artifact_paths)
+                    else:
+                        packager.add_entries(all_entries)
 
-        if dds_results['renamed']:
-            print(f"\n✓ Fixed {len(dds_results['renamed'])} DDS filename(s)")
+                if manifest is not None:
+                    save_manifest(zip_path, manifest)
 
-            print(f"\nUpdating skin.materials.json files with new DDS paths...")
-            for car_id, skin_folder, old_dds, new_dds in dds_results['renamed']:
-                skin_folder_path = os.path.join(temp_dir, "vehicles", car_id, skin_folder)
-                materials_json_path = os.path.join(skin_folder_path, "skin.materials.json")
+            if build_cache is not None:
+                with stage("cache evict"):
+                    build_cache.evict(keep=cache_keys)
 
-                if os.path.exists(materials_json_path):
-                    try:
-                        with open(materials_json_path, "r", encoding="utf-8") as f:
-                            content = f.read()
+            _finish_report(report, zip_path)
 
-                        old_path = f"vehicles/{car_id}/{skin_folder}/{old_dds}"
-                        new_path = f"vehicles/{car_id}/{skin_folder}/{new_dds}"
+            if progress_callback:
+                progress_callback(1.0)
 
-                        if old_path in content:
-                            content = content.replace(old_path, new_path)
+            print(f"\n✓ Multi-skin mod {'unchanged' if unchanged else 'created successfully'}!")
+            print(f"  Cars: {total_cars}")
+            print(f"  Skins: {total_skins}")
+            if not unchanged:
+                print(f"  Entries: {packager.entry_count}")
+            print(f"  Location: {zip_path}")
+            print(f"{'='*60}\n")
 
-                            with open(materials_json_path, "w", encoding="utf-8") as f:
-                                f.write(content)
+            return zip_path
+        finally:
+            if cache_lease is not None:
+                build_cache.release(cache_lease)
 
-                            print(f"  Updated {car_id}/{skin_folder}/skin.materials.json")
-                            print(f"    {old_path} -> {new_path}")
-                    except Exception as e:
-                        print(f"  [WARNING] Failed to update materials.json for {car_id}/{skin_folder}: {e}")
+    temp_dir = tempfile.mkdtemp()
+    print(f"Temp directory: {temp_dir}")
 
-        if dds_results['errors']:
-            print(f"\n⚠ {len(dds_results['errors'])} DDS file(s) had errors")
+    try:
+        _run_skin_jobs(
+            skin_jobs,
+            functools.partial(build_skin, temp_mod_root=temp_dir),
+            jobs or 1,
+            progress_callback,
+            report,
+            cancel_token
+        )
 
         print(f"\nCreating final ZIP file...")
 
         if progress_callback:
             progress_callback(0.9)
 
-        mods_path = output_path or get_beamng_mods_path()
-        os.makedirs(mods_path, exist_ok=True)
-        zip_path = os.path.join(mods_path, f"{mod_name}.zip")
-
-        print(f"ZIP path: {zip_path}")
-
-        if os.path.exists(zip_path):
-            raise FileExistsError(
-                f"A mod named '{mod_name}.zip' already exists.\n"
-                f"Please choose a different name or delete the existing file."
-            )
-
         print(f"\n[DEBUG] Files being zipped from {temp_dir}:")
         for root, dirs, files in os.walk(temp_dir):
-            for file in files:
+            dirs.sort()
+            for file in sorted(files):
                 full_path = os.path.join(root, file)
                 rel_path = os.path.relpath(full_path, temp_dir)
                 print(f"[DEBUG]   {rel_path}")
 
-        zip_folder(temp_dir, zip_path)
+        manifest = None
+        if reproducible:
+            with stage("manifest"):
+                manifest = build_manifest(folder_records(temp_dir), mod_name, compression_preset)
+            report.info["manifest_digest"] = manifest["digest"]
+
+        unchanged = manifest is not None and _archive_unchanged(zip_path, manifest, report)
+
+        if not unchanged:
+            _check_zip_free(zip_path, mod_name, overwrite)
+            with stage("zip"), _output_zip(zip_path, overwrite) as write_path:
+                zip_folder(
+                    temp_dir, write_path, compression_preset, cancel_token,
+                    reproducible=reproducible, comment=digest_comment(manifest) if manifest else b""
+                )
+
+            if manifest is not None:
+                save_manifest(zip_path, manifest)
+
+        _finish_report(report, zip_path)
 
         if progress_callback:
             progress_callback(1.0)
 
-        print(f"\n✓ Multi-skin mod created successfully!")
+        print(f"\n✓ Multi-skin mod {'unchanged' if unchanged else 'created successfully'}!")
         print(f"  Cars: {total_cars}")
         print(f"  Skins: {total_skins}")
         print(f"  Location: {zip_path}")
@@ -712,181 +1313,200 @@ def generate_multi_skin_mod(
         if os.path.exists(temp_dir):
             shutil.rmtree(temp_dir)
 
-def process_jbeam_files(folder_path, dds_identifier, skin_display_name, author):
+def render_jbeam_text(content, dds_identifier, skin_display_name, author):
 
-    for root_dir, _, files in os.walk(folder_path):
-        for file in files:
-            if not file.endswith(".jbeam"):
-                continue
+    content = re.sub(
+        r'"([^"]+_skin_)[^"]*("\s*:\s*\{)',
+        rf'"\g<1>{dds_identifier}\g<2>',
+        content
+    )
 
-            file_path = os.path.join(root_dir, file)
+    content = re.sub(
+        r'("authors"\s*:\s*")[^"]*(")',
+        rf'\g<1>{author}\g<2>',
+        content
+    )
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+    content = re.sub(
+        r'("name"\s*:\s*")[^"]*(")',
+        rf'\g<1>{skin_display_name}\g<2>',
+        content
+    )
 
-            content = re.sub(
-                r'"([^"]+_skin_)[^"]*("\s*:\s*\{)',
-                rf'"\g<1>{dds_identifier}\g<2>',
-                content
-            )
+    content = re.sub(
+        r'"([^"]+_skin_)skinname"',
+        rf'"\g<1>{dds_identifier}"',
+        content,
+        flags=re.IGNORECASE
+    )
 
-            content = re.sub(
-                r'("authors"\s*:\s*")[^"]*(")',
-                rf'\g<1>{author}\g<2>',
-                content
-            )
+    content = re.sub(
+        r'("globalSkin"\s*:\s*")[^"]*(")',
+        rf'\g<1>{dds_identifier}\g<2>',
+        content,
+        flags=re.IGNORECASE
+    )
 
-            content = re.sub(
-                r'("name"\s*:\s*")[^"]*(")',
-                rf'\g<1>{skin_display_name}\g<2>',
-                content
-            )
+    def replace_extra_skin(match):
+        return f'"{match.group(1)}{dds_identifier}"'
 
-            content = re.sub(
-                r'"([^"]+_skin_)skinname"',
-                rf'"\g<1>{dds_identifier}"',
-                content,
-                flags=re.IGNORECASE
-            )
+    content = re.sub(
+        r'"([^"]*_extra\.skin\.)[^"]+"',
+        replace_extra_skin,
+        content
+    )
 
-            content = re.sub(
-                r'("globalSkin"\s*:\s*")[^"]*(")',
-                rf'\g<1>{dds_identifier}\g<2>',
-                content,
-                flags=re.IGNORECASE
-            )
+    def replace_extra_skin_name(match):
+        return f'{match.group(1)}{dds_identifier}"'
 
-            def replace_extra_skin(match):
-                return f'"{match.group(1)}{dds_identifier}"'
+    content = re.sub(
+        r'("name"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
+        replace_extra_skin_name,
+        content
+    )
+    content = re.sub(
+        r'("mapTo"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
+        replace_extra_skin_name,
+        content
+    )
 
-            content = re.sub(
-                r'"([^"]*_extra\.skin\.)[^"]+"',
-                replace_extra_skin,
-                content
-            )
+    return content
 
-            def replace_extra_skin_name(match):
-                return f'{match.group(1)}{dds_identifier}"'
+def process_jbeam_files(folder_path, dds_identifier, skin_display_name, author):
 
-            content = re.sub(
-                r'("name"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
-                replace_extra_skin_name,
-                content
-            )
-            content = re.sub(
-                r'("mapTo"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
-                replace_extra_skin_name,
-                content
+    for root_dir, _, files in os.walk(folder_path):
+        for file in files:
+            if not file.endswith(".jbeam"):
+                continue
+
+            file_path = os.path.join(root_dir, file)
+
+            content = render_template_file(
+                file_path,
+                JBEAM,
+                dds_identifier=dds_identifier,
+                skin_display_name=skin_display_name,
+                author=author
             )
 
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(content)
 
-def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename, dds_identifier):
+def render_json_text(content, vehicle_id, skin_folder_name, dds_filename, dds_identifier, source_name=""):
 
-    for root_dir, _, files in os.walk(folder_path):
-        for file in files:
-            if not file.endswith(".json") or file.startswith("info"):
+    try:
+        data = json.loads(content)
+
+        for material_key, material_data in data.items():
+            if not isinstance(material_data, dict):
                 continue
 
-            file_path = os.path.join(root_dir, file)
+            if "Stages" in material_data and isinstance(material_data["Stages"], list):
+                stages = material_data["Stages"]
 
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                if len(stages) > 1 and isinstance(stages[1], dict):
+                    stage2 = stages[1]
+                    if "baseColorMap" in stage2:
+                        old_path = stage2["baseColorMap"]
 
-                for material_key, material_data in data.items():
-                    if not isinstance(material_data, dict):
-                        continue
+                        if "skinname" in old_path.lower():
 
-                    if "Stages" in material_data and isinstance(material_data["Stages"], list):
-                        stages = material_data["Stages"]
+                            new_path = re.sub(r'/skinname/', f'/{skin_folder_name}/', old_path, flags=re.IGNORECASE)
+                            new_path = re.sub(r'_skin_skinname\.dds', f'_skin_{dds_identifier}.dds', new_path, flags=re.IGNORECASE)
+                            print(f"[DEBUG] Replaced skinname placeholder in baseColorMap for {material_key}:")
+                        else:
 
-                        if len(stages) > 1 and isinstance(stages[1], dict):
-                            stage2 = stages[1]
-                            if "baseColorMap" in stage2:
-                                old_path = stage2["baseColorMap"]
+                            new_path = f"vehicles/{vehicle_id}/{skin_folder_name}/{dds_filename}"
+                            print(f"[DEBUG] Updated Stage 2 baseColorMap in {material_key}:")
 
-                                if "skinname" in old_path.lower():
+                        stage2["baseColorMap"] = new_path
+                        print(f"[DEBUG]   From: {old_path}")
+                        print(f"[DEBUG]   To:   {new_path}")
 
-                                    new_path = re.sub(r'/skinname/', f'/{skin_folder_name}/', old_path, flags=re.IGNORECASE)
-                                    new_path = re.sub(r'_skin_skinname\.dds', f'_skin_{dds_identifier}.dds', new_path, flags=re.IGNORECASE)
-                                    print(f"[DEBUG] Replaced skinname placeholder in baseColorMap for {material_key}:")
-                                else:
+        content = json.dumps(data, indent=2)
 
-                                    new_path = f"vehicles/{vehicle_id}/{skin_folder_name}/{dds_filename}"
-                                    print(f"[DEBUG] Updated Stage 2 baseColorMap in {material_key}:")
+    except json.JSONDecodeError:
 
-                                stage2["baseColorMap"] = new_path
-                                print(f"[DEBUG]   From: {old_path}")
-                                print(f"[DEBUG]   To:   {new_path}")
+        print(f"[DEBUG] JSON parse failed for {source_name}, using regex fallback")
 
-                content = json.dumps(data, indent=2)
+    def replace_skin_ref(match):
+        return f'"{match.group(1)}{dds_identifier}"'
 
-            except json.JSONDecodeError:
+    content = re.sub(
+        r'"([^"]+\.skin\.)[^"]+"',
+        replace_skin_ref,
+        content
+    )
 
-                print(f"[DEBUG] JSON parse failed for {file_path}, using regex fallback")
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+    def replace_skin_name(match):
+        return f'{match.group(1)}{dds_identifier}"'
 
-            def replace_skin_ref(match):
-                return f'"{match.group(1)}{dds_identifier}"'
+    content = re.sub(
+        r'("name"\s*:\s*"[^"]+\.skin\.)[^"]+"',
+        replace_skin_name,
+        content
+    )
+    content = re.sub(
+        r'("mapTo"\s*:\s*"[^"]+\.skin\.)[^"]+"',
+        replace_skin_name,
+        content
+    )
 
-            content = re.sub(
-                r'"([^"]+\.skin\.)[^"]+"',
-                replace_skin_ref,
-                content
-            )
+    def replace_extra_skin_all(match):
+        return f'"{match.group(1)}{dds_identifier}"'
+
+    content = re.sub(
+        r'"([^"]*_extra\.skin\.)[^"]+"',
+        replace_extra_skin_all,
+        content
+    )
 
-            def replace_skin_name(match):
-                return f'{match.group(1)}{dds_identifier}"'
+    def replace_extra_skin_name_all(match):
+        return f'{match.group(1)}{dds_identifier}"'
 
-            content = re.sub(
-                r'("name"\s*:\s*"[^"]+\.skin\.)[^"]+"',
-                replace_skin_name,
-                content
-            )
-            content = re.sub(
-                r'("mapTo"\s*:\s*"[^"]+\.skin\.)[^"]+"',
-                replace_skin_name,
-                content
-            )
+    content = re.sub(
+        r'("name"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
+        replace_extra_skin_name_all,
+        content
+    )
+    content = re.sub(
+        r'("mapTo"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
+        replace_extra_skin_name_all,
+        content
+    )
 
-            def replace_extra_skin_all(match):
-                return f'"{match.group(1)}{dds_identifier}"'
+    content = re.sub(
+        r'/skinname/',
+        f'/{skin_folder_name}/',
+        content,
+        flags=re.IGNORECASE
+    )
+    content = re.sub(
+        r'_skin_skinname\.dds',
+        f'_skin_{dds_identifier}.dds',
+        content,
+        flags=re.IGNORECASE
+    )
 
-            content = re.sub(
-                r'"([^"]*_extra\.skin\.)[^"]+"',
-                replace_extra_skin_all,
-                content
-            )
+    return content
 
-            def replace_extra_skin_name_all(match):
-                return f'{match.group(1)}{dds_identifier}"'
+def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename, dds_identifier):
 
-            content = re.sub(
-                r'("name"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
-                replace_extra_skin_name_all,
-                content
-            )
-            content = re.sub(
-                r'("mapTo"\s*:\s*"[^"]*_extra\.skin\.)[^"]+"',
-                replace_extra_skin_name_all,
-                content
-            )
+    for root_dir, _, files in os.walk(folder_path):
+        for file in files:
+            if not file.endswith(".json") or file.startswith("info"):
+                continue
 
-            content = re.sub(
-                r'/skinname/',
-                f'/{skin_folder_name}/',
-                content,
-                flags=re.IGNORECASE
-            )
-            content = re.sub(
-                r'_skin_skinname\.dds',
-                f'_skin_{dds_identifier}.dds',
-                content,
-                flags=re.IGNORECASE
+            file_path = os.path.join(root_dir, file)
+
+            content = render_template_file(
+                file_path,
+                JSON,
+                vehicle_id=vehicle_id,
+                skin_folder_name=skin_folder_name,
+                dds_filename=dds_filename,
+                dds_identifier=dds_identifier
             )
 
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
\ No newline at end of file
+                f.write(content)
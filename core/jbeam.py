@@ -0,0 +1,358 @@
+"""
+JBeam / JSON5 parser - reads BeamNG's relaxed JSON and writes it back in place
+
+BeamNG files allow // and /* */ comments, trailing commas, missing commas
+between members and a few bare words. parse() turns such text into plain
+dicts and lists. JBeamDocument keeps the original text next to the parsed
+tree, so changes made to document.data are written back as small in-place
+edits and every comment and line of formatting elsewhere survives.
+
+load_file() / load_document() share one parse per file and process,
+keyed by path, size and mtime.
+"""
+import os
+import re
+import copy
+import json
+import threading
+
+_TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<punct>[{}\[\]:,])
+  | (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<word>[A-Za-z_$][\w$.\-]*)
+''', re.VERBOSE | re.DOTALL)
+
+_WORDS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf")
+}
+
+class JBeamDecodeError(json.JSONDecodeError):
+    """Raised for text that cannot be parsed, with line and column like json"""
+
+def _tokenize(text):
+    pos = 0
+    length = len(text)
+    tokens = []
+
+    while pos < length:
+        match = _TOKEN_RE.match(text, pos)
+        if match is None:
+            if text.startswith("/*", pos):
+                raise JBeamDecodeError("Unterminated comment", text, pos)
+            if text[pos] in "\"'":
+                raise JBeamDecodeError("Unterminated string", text, pos)
+            raise JBeamDecodeError(f"Unexpected character {text[pos]!r}", text, pos)
+
+        kind = match.lastgroup
+        if kind not in ("ws", "comment"):
+            tokens.append((kind, match.group(), match.start(), match.end()))
+        pos = match.end()
+
+    return tokens
+
+def _decode_string(token):
+    if token[0] == '"':
+        try:
+            return json.loads(token, strict=False)
+        except json.JSONDecodeError:
+            # Unknown escapes such as Windows paths; keep them verbatim
+            return token[1:-1]
+    return token[1:-1].replace("\\'", "'").replace('\\"', '"')
+
+def _decode_number(token):
+    if any(c in token for c in ".eE"):
+        return float(token)
+    return int(token)
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.index = 0
+        # path -> (start, end) of every value in the text
+        self.spans = {}
+        # path -> layout of every object, used to insert new members
+        self.objects = {}
+
+    def _error(self, message, pos=None):
+        if pos is None:
+            pos = self.tokens[self.index][2] if self.index < len(self.tokens) else len(self.text)
+        raise JBeamDecodeError(message, self.text, pos)
+
+    def _next(self):
+        if self.index >= len(self.tokens):
+            self._error("Unexpected end of data")
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            self._error("Expecting value")
+        value = self._value(())
+        if self.index < len(self.tokens):
+            self._error("Extra data")
+        return value
+
+    def _value(self, path):
+        kind, token, start, end = self._next()
+
+        if token == "{":
+            return self._object(path, start)
+        if token == "[":
+            return self._array(path, start)
+
+        if kind == "string":
+            value = _decode_string(token)
+        elif kind == "number":
+            value = _decode_number(token)
+        elif kind == "word" and token in _WORDS:
+            value = _WORDS[token]
+        else:
+            self._error("Expecting value", start)
+
+        self.spans[path] = (start, end)
+        return value
+
+    def _object(self, path, start):
+        result = {}
+        member_starts = []
+        last_end = None
+
+        while True:
+            kind, token, token_start, token_end = self._next()
+
+            if token == "}":
+                break
+            if token == ",":
+                continue
+
+            if kind == "string":
+                key = _decode_string(token)
+            elif kind in ("word", "number"):
+                key = token
+            else:
+                self._error("Expecting property name", token_start)
+
+            if self._next()[1] != ":":
+                self._error("Expecting ':' delimiter", token_end)
+
+            result[key] = self._value(path + (key,))
+            member_starts.append(token_start)
+            last_end = self.spans[path + (key,)][1]
+
+        self.spans[path] = (start, token_end)
+        self.objects[path] = {
+            "open_end": start + 1,
+            "member_start": member_starts[-1] if member_starts else None,
+            "last_end": last_end
+        }
+        return result
+
+    def _array(self, path, start):
+        result = []
+
+        while True:
+            if self.index >= len(self.tokens):
+                self._error("Unexpected end of data")
+
+            kind, token, token_start, token_end = self.tokens[self.index]
+
+            if token == "]":
+                self.index += 1
+                break
+            if token == ",":
+                self.index += 1
+                continue
+
+            result.append(self._value(path + (len(result),)))
+
+        self.spans[path] = (start, token_end)
+        return result
+
+def parse(text):
+    """Parse JBeam / JSON5 text into plain dicts and lists"""
+    return _Parser(text).parse()
+
+loads = parse
+
+def dumps(value, indent=2, base_indent=""):
+    """Serialize a value for insertion into a JBeam file"""
+    text = json.dumps(value, indent=indent, ensure_ascii=False)
+    if base_indent:
+        text = text.replace("\n", "\n" + base_indent)
+    return text
+
+def _line_indent(text, pos):
+    line_start = text.rfind("\n", 0, pos) + 1
+    line = text[line_start:pos]
+    return line[:len(line) - len(line.lstrip())]
+
+def _same_scalar(old, new):
+    return type(old) is type(new) and old == new
+
+class JBeamDocument:
+    """Parsed JBeam text that can be edited without losing its formatting
+
+    Change document.data like any dict, then call dumps(). Only values that
+    actually changed are rewritten; new members are inserted before the
+    closing brace of their object. Removing members rewrites the object
+    that contained them.
+    """
+
+    def __init__(self, text, _parsed=None):
+        if _parsed is None:
+            parser = _Parser(text)
+            _parsed = (parser.parse(), parser.spans, parser.objects)
+
+        original, self._spans, self._objects = _parsed
+        self.text = text
+        self._original = original
+        self.data = copy.deepcopy(original)
+
+    def dumps(self):
+        edits = []
+        self._diff((), self._original, self.data, edits)
+
+        text = self.text
+        for start, end, replacement in sorted(edits, reverse=True):
+            text = text[:start] + replacement + text[end:]
+        return text
+
+    def set_values(self, values):
+        """Return the text with scalar values set at the given paths, or None
+
+        A cheaper dumps() for a document that is edited many different ways:
+        document.data is neither read nor copied. values maps paths (tuples
+        of keys and list indexes) to scalars; each path must name an existing
+        scalar or a new member of an existing object, otherwise None is
+        returned and the caller should edit document.data instead.
+        """
+        edits = []
+        added = {}
+
+        for path, value in values.items():
+            if isinstance(value, (dict, list)) or not path:
+                return None
+
+            try:
+                parent = self._original
+                for key in path[:-1]:
+                    parent = parent[key]
+            except (KeyError, IndexError, TypeError):
+                return None
+
+            if isinstance(parent, dict) and path[-1] not in parent:
+                added.setdefault(path[:-1], {})[path[-1]] = value
+                continue
+
+            try:
+                old = parent[path[-1]]
+            except (KeyError, IndexError, TypeError):
+                return None
+            if isinstance(old, (dict, list)):
+                return None
+
+            if not _same_scalar(old, value):
+                start, end = self._spans[path]
+                edits.append((start, end, dumps(value, base_indent=_line_indent(self.text, start))))
+
+        for path, members in added.items():
+            edits.append(self._insert_members(path, members))
+
+        text = self.text
+        for start, end, replacement in sorted(edits, reverse=True):
+            text = text[:start] + replacement + text[end:]
+        return text
+
+    def _diff(self, path, old, new, edits):
+        if isinstance(old, dict) and isinstance(new, dict) and path in self._objects:
+            if all(key in new for key in old):
+                for key in old:
+                    self._diff(path + (key,), old[key], new[key], edits)
+
+                added = {key: value for key, value in new.items() if key not in old}
+                if added:
+                    edits.append(self._insert_members(path, added))
+                return
+
+        elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+            for index, (old_item, new_item) in enumerate(zip(old, new)):
+                self._diff(path + (index,), old_item, new_item, edits)
+            return
+
+        elif _same_scalar(old, new):
+            return
+
+        start, end = self._spans[path]
+        edits.append((start, end, dumps(new, base_indent=_line_indent(self.text, start))))
+
+    def _insert_members(self, path, members):
+        layout = self._objects[path]
+
+        inline = [
+            f"{json.dumps(key, ensure_ascii=False)}: {json.dumps(value, ensure_ascii=False)}"
+            for key, value in members.items()
+        ]
+
+        if layout["member_start"] is None:
+            return (layout["open_end"], layout["open_end"], ", ".join(inline))
+
+        pos = layout["last_end"]
+
+        if "\n" not in self.text[layout["open_end"]:layout["member_start"]]:
+            # Object written on one line like {"a": 1, "b": 2}
+            return (pos, pos, "".join(f", {member}" for member in inline))
+
+        indent = _line_indent(self.text, layout["member_start"])
+        lines = [
+            f",\n{indent}{json.dumps(key, ensure_ascii=False)}: {dumps(value, base_indent=indent)}"
+            for key, value in members.items()
+        ]
+        return (pos, pos, "".join(lines))
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def _load_parsed(path):
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1], cached[2]
+
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    parser = _Parser(text)
+    parsed = (parser.parse(), parser.spans, parser.objects)
+
+    with _cache_lock:
+        _cache[path] = (signature, text, parsed)
+    return text, parsed
+
+def load_file(path):
+    """Parse a file through the shared cache
+
+    The returned tree is shared with other callers; copy it before changing it.
+    """
+    return _load_parsed(path)[1][0]
+
+def load_document(path):
+    """Open a file as an editable JBeamDocument, parsed through the shared cache"""
+    text, parsed = _load_parsed(path)
+    return JBeamDocument(text, parsed)
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
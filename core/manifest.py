@@ -0,0 +1,129 @@
+"""
+Archive manifests - per-entry content hashes for reproducible mod archives
+
+A reproducible build writes its entries in archive order with a fixed
+timestamp and fixed permissions, so the same inputs always give the same
+ZIP bytes. The manifest lists every entry's name, size and SHA-256 along
+with what else decides the bytes (compression preset, packager format,
+zlib version). Its digest goes into the ZIP comment and the manifest is
+saved next to the ZIP as <mod>.zip.manifest.json. The next build works
+out the manifest before compressing anything, and when the digest
+matches the existing ZIP's comment that ZIP is left as it is.
+"""
+import os
+import json
+import zlib
+import hashlib
+import zipfile
+
+from core.packager import encode_text, archive_order_key, ARCHIVE_FORMAT, CHUNK_SIZE
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+DIGEST_COMMENT_PREFIX = b"BeamSkin manifest sha256:"
+# Cache artifacts carry their entry records in the comment
+RECORDS_COMMENT_PREFIX = b"BeamSkin entries:"
+MAX_COMMENT_SIZE = 0xFFFF
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def entry_records(entries):
+    """[name, size, sha256] of (arcname, kind, payload) entries, in archive order"""
+    records = []
+    for arcname, kind, payload in entries:
+        if kind == "text":
+            data = encode_text(payload)
+            records.append([arcname, len(data), hashlib.sha256(data).hexdigest()])
+        else:
+            records.append([arcname, os.path.getsize(payload), hash_file(payload)])
+    return sorted(records, key=lambda record: archive_order_key(record[0]))
+
+def folder_records(source_dir):
+    """Entry records of a staged mod folder, named as zip_folder names them"""
+    entries = []
+    for root_dir, _, files in os.walk(source_dir):
+        for file in files:
+            full_path = os.path.join(root_dir, file)
+            arcname = os.path.relpath(full_path, source_dir).replace(os.sep, "/")
+            entries.append((arcname, "file", full_path))
+    return entry_records(entries)
+
+def records_comment(records):
+    """ZIP comment that stores entry records, or b"" if they do not fit"""
+    comment = RECORDS_COMMENT_PREFIX + json.dumps(records, separators=(",", ":")).encode("utf-8")
+    return comment if len(comment) <= MAX_COMMENT_SIZE else b""
+
+def archive_records(archive_paths):
+    """Entry records of the entries in several archives, in archive order
+
+    Uses the records stored in each archive's comment and hashes the
+    entries of archives that have none.
+    """
+    records = []
+    for archive_path in archive_paths:
+        with zipfile.ZipFile(archive_path, "r") as zipf:
+            if zipf.comment.startswith(RECORDS_COMMENT_PREFIX):
+                try:
+                    records.extend(json.loads(zipf.comment[len(RECORDS_COMMENT_PREFIX):]))
+                    continue
+                except ValueError:
+                    pass
+
+            for info in zipf.infolist():
+                digest = hashlib.sha256()
+                with zipf.open(info) as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                records.append([info.filename, info.file_size, digest.hexdigest()])
+
+    return sorted(records, key=lambda record: archive_order_key(record[0]))
+
+def build_manifest(records, mod_name, compression_preset):
+    """Manifest dict for an archive with the given entry records"""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "mod_name": mod_name,
+        "compression": compression_preset,
+        "archive_format": ARCHIVE_FORMAT,
+        "zlib": zlib.ZLIB_RUNTIME_VERSION,
+        "entries": [{"name": name, "size": size, "sha256": sha256} for name, size, sha256 in records]
+    }
+    canonical = json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    manifest["digest"] = hashlib.sha256(canonical).hexdigest()
+    return manifest
+
+def digest_comment(manifest):
+    return DIGEST_COMMENT_PREFIX + manifest["digest"].encode("ascii")
+
+def read_archive_digest(zip_path):
+    """Manifest digest recorded in an existing ZIP, or None"""
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zipf:
+            comment = zipf.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+
+    if not comment.startswith(DIGEST_COMMENT_PREFIX):
+        return None
+    return comment[len(DIGEST_COMMENT_PREFIX):].decode("ascii", "replace")
+
+def manifest_path(zip_path):
+    return zip_path + MANIFEST_SUFFIX
+
+def save_manifest(zip_path, manifest):
+    path = manifest_path(zip_path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"[WARNING] Could not save archive manifest: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,408 @@
+"""
+Streaming mod packager - writes mod entries straight into a ZIP archive
+
+Entries are deflated on a small thread pool (zlib releases the GIL while
+it compresses). Each entry is cut into CHUNK_SIZE pieces that are
+compressed independently, primed with the 32 KB that precede them, and
+stitched back into one DEFLATE stream: every piece but the last ends on
+a sync flush, which leaves the stream byte-aligned and unterminated. A
+large texture is then compressed by all threads at once instead of
+holding up the archive on one core. Pieces are written strictly in the
+order they were added and at most a few per thread are in flight, so
+memory stays bounded and the archive is the same for any thread count.
+
+Every entry carries the time the archive was started rather than the
+modification time of the file it came from, so a serial build and a
+process-pool build started in the same second give the same bytes, even
+though their staging files were written at different times. A
+reproducible packager uses a fixed date and permissions instead, so the
+archive depends on nothing but the entries' names and contents (see
+core.manifest).
+
+zipfile has no public way to write an entry whose compressed bytes were
+produced elsewhere, so _ZipWriter drives the private state that
+ZipFile.open(..., "w") uses. That state is checked when this module is
+imported, so a Python release that changes it fails loudly instead of
+writing broken archives.
+"""
+import io
+import os
+import sys
+import struct
+import time
+import zlib
+import zipfile
+import collections
+import concurrent.futures
+from core.compression import DEFAULT_PRESET, choose_file_compression, choose_data_compression
+from core.cancel import check_cancelled
+
+CHUNK_SIZE = 1024 * 1024
+
+# Threads used to deflate the final mod archive
+DEFAULT_THREADS = min(os.cpu_count() or 1, 8)
+
+# Compressed pieces waiting to be written, per thread
+PENDING_PER_THREAD = 2
+
+# DEFLATE window; each piece is primed with this much of the data before it
+WINDOW_SIZE = 32 * 1024
+
+# Bump when the bytes written for the same entries change
+ARCHIVE_FORMAT = 1
+
+# Entry metadata in reproducible archives; 1980 is the earliest ZIP date
+REPRODUCIBLE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+REPRODUCIBLE_ATTR = 0o644 << 16
+REPRODUCIBLE_SYSTEM = 3
+
+def archive_order_key(arcname):
+    """Sort key that matches a sorted os.walk: files first, then subfolders"""
+    parts = arcname.split("/")
+    return tuple((1, part) for part in parts[:-1]) + ((0, parts[-1]),)
+
+def archive_date_time():
+    """Date and time given to every entry of a new, non-reproducible archive"""
+    return time.localtime()[:6]
+
+# zipfile internals used by _ZipWriter: class attributes, then the
+# attributes every writable ZipFile instance has
+_ZIPFILE_CLASS_INTERNALS = (
+    (zipfile, "sizeFileHeader"),
+    (zipfile.ZipFile, "_writecheck"),
+    (zipfile.ZipInfo, "FileHeader")
+)
+_ZIPFILE_INSTANCE_INTERNALS = ("fp", "start_dir", "filelist", "NameToInfo", "_didModify")
+
+def _check_zipfile_internals():
+    """Raise ImportError if zipfile lacks the internals _ZipWriter relies on"""
+    missing = [
+        f"{getattr(owner, '__name__', owner)}.{name}"
+        for owner, name in _ZIPFILE_CLASS_INTERNALS
+        if not hasattr(owner, name)
+    ]
+    with zipfile.ZipFile(io.BytesIO(), "w") as probe:
+        missing.extend(f"ZipFile().{name}" for name in _ZIPFILE_INSTANCE_INTERNALS if not hasattr(probe, name))
+
+    if missing:
+        raise ImportError(
+            f"core.packager needs zipfile internals that Python {sys.version.split()[0]} "
+            f"does not have: {', '.join(missing)}"
+        )
+
+_check_zipfile_internals()
+
+class _ZipWriter:
+    """Writes entries into a ZipFile opened for writing, one at a time
+
+    The only code that touches zipfile's private state (see above).
+    """
+
+    def __init__(self, zipf):
+        self.zipf = zipf
+
+    def begin_entry(self, zinfo, zip64):
+        """Write the local header of zinfo at the end of the archive"""
+        zipf = self.zipf
+        zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader(zip64))
+
+    def write(self, data):
+        self.zipf.fp.write(data)
+
+    def end_entry(self, zinfo, zip64, rewrite_header=True):
+        """Add zinfo to the central directory once its data is written
+
+        With rewrite_header, the local header is written again to record
+        the CRC and sizes that were only known after the data.
+        """
+        zipf = self.zipf
+        zipf.start_dir = zipf.fp.tell()
+        if rewrite_header:
+            zipf.fp.seek(zinfo.header_offset)
+            zipf.fp.write(zinfo.FileHeader(zip64))
+            zipf.fp.seek(zipf.start_dir)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+    @staticmethod
+    def open_entry_data(src_zipf, info):
+        """Position src_zipf's file at the compressed data of info and return it"""
+        # Skip the local header; its extra field length can differ from the
+        # one in the central directory
+        src_fp = src_zipf.fp
+        src_fp.seek(info.header_offset)
+        header = src_fp.read(zipfile.sizeFileHeader)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        src_fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+        return src_fp
+
+def _deflate_chunk(data, level, zdict, final):
+    if level is None:
+        level = zlib.Z_DEFAULT_COMPRESSION
+    if zdict:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=zdict)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+def _done_future(result):
+    future = concurrent.futures.Future()
+    future.set_result(result)
+    return future
+
+class _PendingEntry:
+    """An entry whose pieces are still being compressed or written"""
+
+    def __init__(self, zinfo, compresslevel):
+        self.zinfo = zinfo
+        self.compresslevel = compresslevel
+        # Compressed data can be larger than the input
+        self.zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        self.crc = 0
+        self.file_size = 0
+        self.compress_size = 0
+        self.header_written = False
+
+def encode_text(text):
+    """Encode rendered text the same way a text-mode file write would"""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+class ModPackager:
+    """Streams rendered text and source files into a mod ZIP
+
+    Text entries are written from memory and files are copied from their
+    original location in CHUNK_SIZE pieces, so memory use stays bounded
+    however large the textures are. ZIP64 is enabled, so archives and
+    entries may grow past 4 GB.
+
+    Each entry is stored or deflated according to the compression preset
+    (see core.compression), on up to threads threads (see above).
+
+    Writing a name twice raises FileExistsError; zipfile itself would only
+    warn and leave two entries of that name in the archive.
+
+    If the with-block raises, the partially written archive is removed.
+    A cancel_token (core.cancel) is checked between entries. comment is
+    stored as the archive comment.
+    """
+
+    def __init__(
+        self, zip_path, compression_preset=DEFAULT_PRESET, cancel_token=None, threads=DEFAULT_THREADS,
+        reproducible=False, comment=b""
+    ):
+        self.zip_path = zip_path
+        self.compression_preset = compression_preset
+        self.cancel_token = cancel_token
+        self.reproducible = reproducible
+        self.date_time = REPRODUCIBLE_DATE_TIME if reproducible else archive_date_time()
+        self.zipf = zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+        self.zipf.comment = comment
+        self._writer = _ZipWriter(self.zipf)
+        self.entry_count = 0
+        self._names = set()
+        self._pool = concurrent.futures.ThreadPoolExecutor(threads) if threads > 1 else None
+        self._max_pending = threads * PENDING_PER_THREAD if self._pool else 0
+        self._pending = collections.deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._drain()
+        finally:
+            for _, future, _ in self._pending:
+                future.cancel()
+            self._pending.clear()
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+            self.zipf.close()
+
+        if exc_type is not None and os.path.exists(self.zip_path):
+            print(f"[DEBUG] Removing incomplete archive: {self.zip_path}")
+            os.remove(self.zip_path)
+        return False
+
+    def _submit(self, entry, data, zdict, final):
+        entry.crc = zlib.crc32(data, entry.crc)
+        entry.file_size += len(data)
+
+        if entry.zinfo.compress_type == zipfile.ZIP_STORED:
+            future = _done_future(data)
+        elif self._pool is not None:
+            future = self._pool.submit(_deflate_chunk, data, entry.compresslevel, zdict, final)
+        else:
+            future = _done_future(_deflate_chunk(data, entry.compresslevel, zdict, final))
+
+        self._pending.append((entry, future, final))
+        while len(self._pending) > self._max_pending:
+            self._write_next()
+
+    def _write_next(self):
+        entry, future, final = self._pending[0]
+        data = future.result()
+        self._pending.popleft()
+
+        zinfo = entry.zinfo
+
+        if not entry.header_written:
+            # Same bookkeeping ZipFile.open(..., "w") does for a new entry;
+            # the header is written again once CRC and sizes are known
+            zinfo.compress_size = 0
+            zinfo.CRC = 0
+            zinfo.flag_bits = 0
+            if not zinfo.external_attr:
+                zinfo.external_attr = 0o600 << 16
+            self._writer.begin_entry(zinfo, entry.zip64)
+            entry.header_written = True
+
+        self._writer.write(data)
+        entry.compress_size += len(data)
+
+        if not final:
+            return
+
+        zinfo.CRC = entry.crc
+        zinfo.file_size = entry.file_size
+        zinfo.compress_size = entry.compress_size
+        if not entry.zip64 and max(entry.file_size, entry.compress_size) > zipfile.ZIP64_LIMIT:
+            raise RuntimeError(f"{zinfo.filename} grew past 4 GB while it was being written")
+
+        self._writer.end_entry(zinfo, entry.zip64)
+
+    def _drain(self):
+        while self._pending:
+            self._write_next()
+
+    def _claim(self, arcname):
+        if arcname in self._names:
+            raise FileExistsError(
+                f"'{arcname}' would be written into the mod twice.\n"
+                f"Please give every skin of a vehicle a different name."
+            )
+        self._names.add(arcname)
+
+    def _normalize(self, zinfo):
+        zinfo.date_time = self.date_time
+        if self.reproducible:
+            zinfo.external_attr = REPRODUCIBLE_ATTR
+            zinfo.create_system = REPRODUCIBLE_SYSTEM
+
+    def _add_chunks(self, zinfo, compress_type, compresslevel, chunks):
+        self._claim(zinfo.filename)
+        self._normalize(zinfo)
+        zinfo.compress_type = compress_type
+        entry = _PendingEntry(zinfo, compresslevel)
+
+        # Read one piece ahead to know which piece is the last
+        previous = next(chunks, b"")
+        zdict = None
+        for chunk in chunks:
+            self._submit(entry, previous, zdict, False)
+            zdict = previous[-WINDOW_SIZE:]
+            previous = chunk
+            check_cancelled(self.cancel_token)
+        self._submit(entry, previous, zdict, True)
+
+        self.entry_count += 1
+
+    def add_bytes(self, arcname, data):
+        zinfo = zipfile.ZipInfo(arcname, date_time=self.date_time)
+        zinfo.external_attr = 0o644 << 16
+        zinfo.file_size = len(data)
+        compress_type, compresslevel = choose_data_compression(self.compression_preset)
+        view = memoryview(data)
+        chunks = (bytes(view[offset:offset + CHUNK_SIZE]) for offset in range(0, len(data), CHUNK_SIZE))
+        self._add_chunks(zinfo, compress_type, compresslevel, chunks)
+
+    def add_text(self, arcname, text):
+        self.add_bytes(arcname, encode_text(text))
+
+    def add_file(self, arcname, source_path):
+        # from_file records the source size, which decides up front
+        # whether the entry needs ZIP64
+        zinfo = zipfile.ZipInfo.from_file(source_path, arcname)
+        compress_type, compresslevel = choose_file_compression(
+            source_path, self.compression_preset, zinfo.file_size
+        )
+
+        with open(source_path, "rb") as src:
+            self._add_chunks(zinfo, compress_type, compresslevel, iter(lambda: src.read(CHUNK_SIZE), b""))
+
+    def add_entries(self, entries):
+        """Write (arcname, kind, payload) entries in archive order
+
+        kind is "text" (payload is rendered text) or "file" (payload is a
+        source path that is streamed as-is).
+        """
+        for arcname, kind, payload in sorted(entries, key=lambda e: archive_order_key(e[0])):
+            check_cancelled(self.cancel_token)
+            if kind == "text":
+                self.add_text(arcname, payload)
+            else:
+                self.add_file(arcname, payload)
+
+    def add_raw_entry(self, src_zipf, info):
+        """Copy an entry from another archive without recompressing it
+
+        The compressed bytes are moved over as-is, together with the CRC and
+        sizes recorded for them, so the entry keeps its original compression.
+        """
+        self._claim(info.filename)
+        self._drain()
+        zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.external_attr = info.external_attr
+        zinfo.CRC = info.CRC
+        zinfo.compress_size = info.compress_size
+        zinfo.file_size = info.file_size
+        self._normalize(zinfo)
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+
+        src_fp = _ZipWriter.open_entry_data(src_zipf, info)
+        self._writer.begin_entry(zinfo, zip64)
+
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = src_fp.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated entry {info.filename} in {src_zipf.filename}")
+            self._writer.write(chunk)
+            remaining -= len(chunk)
+
+        # CRC and sizes were known up front, so the header is already right
+        self._writer.end_entry(zinfo, zip64, rewrite_header=False)
+        self.entry_count += 1
+
+    def add_archives(self, archive_paths):
+        """Merge the entries of several archives, in archive order, without recompressing"""
+        sources = []
+        for archive_path in archive_paths:
+            with zipfile.ZipFile(archive_path, "r") as src_zipf:
+                sources.extend((archive_path, info) for info in src_zipf.infolist())
+
+        sources.sort(key=lambda source: archive_order_key(source[1].filename))
+
+        # Entries of one archive are mostly contiguous in archive order, so
+        # keep the current source open instead of opening every archive at once
+        current_path = None
+        src_zipf = None
+        try:
+            for archive_path, info in sources:
+                check_cancelled(self.cancel_token)
+                if archive_path != current_path:
+                    if src_zipf is not None:
+                        src_zipf.close()
+                    src_zipf = zipfile.ZipFile(archive_path, "r")
+                    current_path = archive_path
+                self.add_raw_entry(src_zipf, info)
+        finally:
+            if src_zipf is not None:
+                src_zipf.close()
@@ -12,7 +12,8 @@ app_settings = {
     "mods_folder": ""
 }
 
-os.makedirs("data", exist_ok=True)
+# Nothing is written at import time, so headless tools can import this
+# module without touching the working directory
 
 if os.path.exists(SETTINGS_FILE):
     try:
@@ -152,8 +153,8 @@ if "custom_themes" in app_settings:
 else:
     import copy
     THEMES = copy.deepcopy(DEFAULT_THEMES)
+    # Persisted with the next save_settings()
     app_settings["custom_themes"] = THEMES
-    save_settings()
 
 current_theme = app_settings["theme"]
 colors = THEMES[current_theme]
@@ -161,17 +162,12 @@ colors = THEMES[current_theme]
 ADDED_VEHICLES_FILE = "vehicles/added_vehicles.json"
 added_vehicles = {}
 
-os.makedirs("vehicles", exist_ok=True)
-
-if not os.path.exists(ADDED_VEHICLES_FILE):
-    with open(ADDED_VEHICLES_FILE, "w") as f:
-        json.dump({}, f)
-
-with open(ADDED_VEHICLES_FILE, "r") as f:
-    try:
-        added_vehicles = json.load(f)
-    except:
-        added_vehicles = {}
+if os.path.exists(ADDED_VEHICLES_FILE):
+    with open(ADDED_VEHICLES_FILE, "r") as f:
+        try:
+            added_vehicles = json.load(f)
+        except:
+            added_vehicles = {}
 
 def show_wip_warning(app=None, force=False):
     """Show WIP warning on first launch using CustomTkinter
@@ -427,4 +423,72 @@ def mark_setup_complete():
     """Mark first-time setup as complete"""
     app_settings["setup_complete"] = True
     save_settings()
-    print("[DEBUG] First-time setup marked as complete")
\ No newline at end of file
+    print("[DEBUG] First-time setup marked as complete")
+
+def get_build_jobs() -> int:
+    """Get the number of worker processes used for mod builds (1 = serial build)"""
+    try:
+        return max(1, int(app_settings.get("build_jobs", 1)))
+    except (TypeError, ValueError):
+        return 1
+
+def set_build_jobs(jobs: int):
+    """Set the number of worker processes used for mod builds"""
+    app_settings["build_jobs"] = max(1, int(jobs))
+    save_settings()
+    print(f"[DEBUG] Build workers set to: {app_settings['build_jobs']}")
+
+def get_streaming_build() -> bool:
+    """Check if mods are streamed straight into the ZIP instead of a temp folder"""
+    return bool(app_settings.get("streaming_build", True))
+
+def set_streaming_build(enabled: bool):
+    """Enable or disable streaming mod builds"""
+    app_settings["streaming_build"] = bool(enabled)
+    save_settings()
+    print(f"[DEBUG] Streaming build set to: {app_settings['streaming_build']}")
+
+def get_reproducible_build() -> bool:
+    """Check if mod ZIPs are built reproducibly (fixed metadata plus a content manifest)"""
+    return bool(app_settings.get("reproducible_build", False))
+
+def set_reproducible_build(enabled: bool):
+    """Enable or disable reproducible mod builds"""
+    app_settings["reproducible_build"] = bool(enabled)
+    save_settings()
+    print(f"[DEBUG] Reproducible build set to: {app_settings['reproducible_build']}")
+
+def get_compression_preset() -> str:
+    """Get the archive compression preset (fast, balanced or smallest)"""
+    from core.compression import PRESETS, DEFAULT_PRESET
+    preset = app_settings.get("compression_preset", DEFAULT_PRESET)
+    return preset if preset in PRESETS else DEFAULT_PRESET
+
+def set_compression_preset(preset: str):
+    """Set the archive compression preset"""
+    app_settings["compression_preset"] = preset
+    save_settings()
+    print(f"[DEBUG] Compression preset set to: {preset}")
+
+def get_build_cache_enabled() -> bool:
+    """Check if unchanged skins are reused from the build cache"""
+    return bool(app_settings.get("build_cache_enabled", True))
+
+def set_build_cache_enabled(enabled: bool):
+    """Enable or disable the build cache"""
+    app_settings["build_cache_enabled"] = bool(enabled)
+    save_settings()
+    print(f"[DEBUG] Build cache set to: {app_settings['build_cache_enabled']}")
+
+def get_build_cache_size_mb() -> int:
+    """Get the build cache size limit in megabytes"""
+    try:
+        return max(64, int(app_settings.get("build_cache_size_mb", 2048)))
+    except (TypeError, ValueError):
+        return 2048
+
+def set_build_cache_size_mb(size_mb: int):
+    """Set the build cache size limit in megabytes"""
+    app_settings["build_cache_size_mb"] = max(64, int(size_mb))
+    save_settings()
+    print(f"[DEBUG] Build cache size limit set to: {app_settings['build_cache_size_mb']} MB")
@@ -0,0 +1,232 @@
+"""
+Template render plans - compile a template file once, fill it in per skin
+
+A vehicle template is rendered by a fixed chain of regex passes
+(render_jbeam_text / render_json_text). Running that chain with sentinel
+strings in place of the per-skin values locates every substitution site,
+so the result can be split into literal text and value slots. Rendering a
+skin is then a single join over the plan.
+
+Plans are cached in memory (checked against the file's size and mtime) and
+on disk (keyed by a hash of the template content), so worker processes and
+later sessions skip compiling as well.
+"""
+import os
+import re
+import json
+import hashlib
+
+from core.jbeam import JBeamDocument, JBeamDecodeError
+from utils.config_helper import get_cache_dir
+
+# Bump when render_jbeam_text / render_json_text change their output
+PLAN_VERSION = 1
+
+JBEAM = "jbeam"
+JSON = "json"
+
+SENTINEL_PREFIX = "@@BSS_"
+SENTINEL_RE = re.compile(r"@@BSS_(\w+)@@")
+
+# Values containing any of these could change which regex passes match,
+# so the plan would not be equivalent to the regex chain for them
+UNSAFE_SUBSTRINGS = ('"', '\\', 'skinname', '.skin.', SENTINEL_PREFIX.lower())
+
+_plans = {}
+_plan_documents = {}
+
+def _sentinel(name):
+    return f"{SENTINEL_PREFIX}{name}@@"
+
+def compile_plan(kind, content, source_name=""):
+    """Compile template text into a plan, or None if it cannot be compiled"""
+    from core.file_ops import render_jbeam_text, render_json_text
+
+    if SENTINEL_PREFIX in content:
+        return None
+
+    if kind == JBEAM:
+        rendered = render_jbeam_text(
+            content,
+            _sentinel("dds_identifier"),
+            _sentinel("skin_display_name"),
+            _sentinel("author")
+        )
+        json_parsed = False
+    else:
+        rendered = render_json_text(
+            content,
+            _sentinel("vehicle_id"),
+            _sentinel("skin_folder_name"),
+            _sentinel("dds_filename"),
+            _sentinel("dds_identifier"),
+            source_name=source_name
+        )
+        try:
+            json.loads(content)
+            json_parsed = True
+        except json.JSONDecodeError:
+            json_parsed = False
+
+    # Even indexes are literal text, odd indexes are value names
+    return {
+        "version": PLAN_VERSION,
+        "parts": SENTINEL_RE.split(rendered),
+        # json.dumps escapes non-ASCII, so values must be plain ASCII to be
+        # inserted verbatim into a re-serialized template
+        "ascii_only": json_parsed
+    }
+
+def _values_fit_plan(plan, values):
+    for value in values.values():
+        # An empty value can stop a later pass from matching where the
+        # sentinel did
+        if not value:
+            return False
+        lowered = str(value).lower()
+        if any(unsafe in lowered for unsafe in UNSAFE_SUBSTRINGS):
+            return False
+        if plan["ascii_only"] and not (str(value).isascii() and str(value).isprintable()):
+            return False
+    return True
+
+def fill_plan(plan, values):
+    parts = plan["parts"]
+    return "".join(
+        part if index % 2 == 0 else values[part]
+        for index, part in enumerate(parts)
+    )
+
+def _load_disk_plan(plan_path):
+    try:
+        with open(plan_path, "r", encoding="utf-8") as f:
+            plan = json.load(f)
+        if plan.get("version") == PLAN_VERSION:
+            return plan
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _save_disk_plan(plan_path, plan):
+    temp_path = f"{plan_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(plan, f)
+        os.replace(temp_path, plan_path)
+    except OSError as e:
+        print(f"[WARNING] Could not cache template plan: {e}")
+
+def get_plan(path, kind):
+    """Get the compiled plan for a template file (None if not compilable)
+
+    Returns (plan, content); content is only read when the plan was not
+    already in memory.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cache_key = (os.path.abspath(path), kind)
+
+    cached = _plans.get(cache_key)
+    if cached and cached[0] == signature:
+        return cached[1], None
+
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    digest = hashlib.sha256(f"{kind}:{PLAN_VERSION}:{content}".encode("utf-8")).hexdigest()
+    plan_path = os.path.join(get_cache_dir("templates"), f"{digest}.json")
+
+    plan = _load_disk_plan(plan_path)
+    if plan is None:
+        plan = compile_plan(kind, content, source_name=path)
+        if plan is not None:
+            _save_disk_plan(plan_path, plan)
+
+    _plans[cache_key] = (signature, plan)
+    return plan, content
+
+def render_template_file(path, kind, **values):
+    """Render a template file with per-skin values
+
+    Uses the compiled plan when possible and falls back to the regex chain
+    for templates or values the plan cannot represent.
+    """
+    from core.file_ops import render_jbeam_text, render_json_text
+
+    plan, content = get_plan(path, kind)
+
+    if plan is not None and _values_fit_plan(plan, values):
+        return fill_plan(plan, values)
+
+    if content is None:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+    if kind == JBEAM:
+        return render_jbeam_text(
+            content,
+            values["dds_identifier"],
+            values["skin_display_name"],
+            values["author"]
+        )
+
+    return render_json_text(
+        content,
+        values["vehicle_id"],
+        values["skin_folder_name"],
+        values["dds_filename"],
+        values["dds_identifier"],
+        source_name=path
+    )
+
+def _plan_document(path, kind, plan):
+    """The plan's text with sentinels in its value slots, parsed once per plan"""
+    cache_key = (os.path.abspath(path), kind)
+    cached = _plan_documents.get(cache_key)
+    if cached and cached[0] is plan:
+        return cached[1]
+
+    text = "".join(
+        part if index % 2 == 0 else _sentinel(part)
+        for index, part in enumerate(plan["parts"])
+    )
+    try:
+        document = JBeamDocument(text)
+    except JBeamDecodeError:
+        document = None
+
+    _plan_documents[cache_key] = (plan, document)
+    return document
+
+def render_template_edit(path, kind, edit, **values):
+    """Render a template file with some of its parsed values changed
+
+    edit(data) gets the template's parsed tree, with sentinel strings in
+    place of the per-skin values, and returns {path: scalar} changes for
+    JBeamDocument.set_values. The template is parsed once, not once per
+    skin. Returns None when the changes cannot be made on the compiled
+    plan; render the file and edit the result instead then.
+    """
+    plan, _ = get_plan(path, kind)
+    if plan is None or not _values_fit_plan(plan, values):
+        return None
+
+    document = _plan_document(path, kind, plan)
+    if document is None:
+        return None
+
+    text = document.set_values(edit(document.data))
+    if text is None:
+        return None
+
+    parts = SENTINEL_RE.split(text)
+    # A change replaced a value slot, or a new value looks like one
+    if parts[1::2] != plan["parts"][1::2]:
+        return None
+
+    return fill_plan({"parts": parts}, values)
+
+def clear_plans():
+    """Drop the in-memory plans (the disk cache is content-addressed)"""
+    _plans.clear()
+    _plan_documents.clear()
@@ -0,0 +1,259 @@
+"""
+Thumbnail cache - scaled skin previews kept on disk between sessions
+
+Decoding a full-size DDS texture and scaling it down takes far longer than
+showing the result, and the same textures are previewed again and again.
+Every texture is decoded once, from the mip level that covers the largest
+preview, and stored as PNG previews at a few standard sizes, keyed by the
+texture's path, size and modification time, so an edited texture gets new
+previews. prefill() renders the previews of a
+whole project in the background, and clicking through its skins then only
+reads small PNGs. The cache has a size cap with LRU eviction, like the
+build cache. get_thumbnail_cache() returns the shared cache, created on
+first use so importing this module touches no files.
+"""
+import os
+import json
+import hashlib
+import threading
+
+from PIL import Image
+
+from core.dds_preview import open_preview
+from utils.config_helper import get_cache_dir
+
+# Bump when the way previews are rendered changes
+THUMBNAIL_FORMAT_VERSION = 2
+
+# Largest edge of the stored previews; PREVIEW_SIZE is the generator's preview
+THUMBNAIL_SIZES = (128, 400, 800)
+PREVIEW_SIZE = 800
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+THUMBNAIL_EXTENSION = ".png"
+# Fast PNG compression; previews are small and read far more than written
+PNG_COMPRESS_LEVEL = 1
+
+# Evict once this share of the cap has been added since the last eviction
+EVICT_FRACTION = 0.1
+
+def standard_size(size):
+    """Smallest standard preview size that covers size, or the largest one"""
+    for standard in THUMBNAIL_SIZES:
+        if standard >= size:
+            return standard
+    return THUMBNAIL_SIZES[-1]
+
+class ThumbnailCache:
+    """On-disk cache of scaled previews with a size cap and LRU eviction
+
+    As in the build cache, the file modification time doubles as the
+    last-used time. Safe to use from several threads; a texture that is
+    being rendered by one thread is waited for, not rendered twice.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or get_cache_dir("thumbnails")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._rendering = {}
+        self._added_bytes = 0
+        self._prefill_generation = 0
+
+    def _signature(self, path):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        return [THUMBNAIL_FORMAT_VERSION, path, stat.st_size, stat.st_mtime_ns]
+
+    def thumbnail_path(self, signature, size):
+        encoded = json.dumps(signature + [size]).encode("utf-8")
+        return os.path.join(self.cache_dir, hashlib.sha256(encoded).hexdigest() + THUMBNAIL_EXTENSION)
+
+    def _read(self, thumbnail_path):
+        try:
+            with Image.open(thumbnail_path) as img:
+                img.load()
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(thumbnail_path)
+        except OSError:
+            pass
+        return img
+
+    def get(self, path, size=PREVIEW_SIZE):
+        """PIL image of path scaled to fit size x size, rendered if not cached
+
+        Raises OSError if the texture cannot be read.
+        """
+        size = standard_size(size)
+        signature = self._signature(path)
+        thumbnail_path = self.thumbnail_path(signature, size)
+
+        while True:
+            img = self._read(thumbnail_path)
+            if img is not None:
+                return img
+
+            key = tuple(signature)
+            with self._lock:
+                event = self._rendering.get(key)
+                if event is None:
+                    event = self._rendering[key] = threading.Event()
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                # Another thread renders this texture; read its result
+                event.wait()
+                if not os.path.exists(thumbnail_path):
+                    # It failed; render here to get its error
+                    return self._render(path, signature)[size]
+                continue
+
+            try:
+                return self._render(path, signature)[size]
+            finally:
+                with self._lock:
+                    del self._rendering[key]
+                event.set()
+
+    def _render(self, path, signature):
+        """Decode path once and store every standard size; returns {size: image}"""
+        img = open_preview(path, THUMBNAIL_SIZES[-1])
+        if img.mode not in ("RGB", "RGBA", "L", "LA"):
+            img = img.convert("RGBA")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        images = {}
+        added = 0
+        # Largest first, each size scaled from the one before it
+        for size in reversed(THUMBNAIL_SIZES):
+            img = img.copy()
+            img.thumbnail((size, size), Image.Resampling.LANCZOS)
+            images[size] = img
+            added += self._store(img, self.thumbnail_path(signature, size))
+
+        with self._lock:
+            self._added_bytes += added
+            evict = self._added_bytes > self.max_bytes * EVICT_FRACTION
+            if evict:
+                self._added_bytes = 0
+        if evict:
+            self.evict()
+        return images
+
+    def _store(self, img, thumbnail_path):
+        temp_path = f"{thumbnail_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            img.save(temp_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+            os.replace(temp_path, thumbnail_path)
+            return os.path.getsize(thumbnail_path)
+        except OSError as e:
+            print(f"[WARNING] Could not cache thumbnail: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return 0
+
+    def is_cached(self, path, size=PREVIEW_SIZE):
+        try:
+            signature = self._signature(path)
+        except OSError:
+            return False
+        return os.path.exists(self.thumbnail_path(signature, standard_size(size)))
+
+    def prefill(self, paths, size=PREVIEW_SIZE):
+        """Render the previews of paths that are not cached yet on a background thread
+
+        A newer prefill() call stops the one before it. Returns the thread.
+        """
+        with self._lock:
+            self._prefill_generation += 1
+            generation = self._prefill_generation
+
+        paths = list(dict.fromkeys(path for path in paths if path))
+
+        def run():
+            rendered = 0
+            for path in paths:
+                if self._prefill_generation != generation:
+                    return
+                if self.is_cached(path, size):
+                    continue
+                try:
+                    self.get(path, size)
+                    rendered += 1
+                except Exception as e:
+                    print(f"[DEBUG] Could not prefill thumbnail for {path}: {e}")
+            if rendered:
+                print(f"[DEBUG] Thumbnail cache: rendered {rendered} of {len(paths)} preview(s)")
+
+        thread = threading.Thread(target=run, daemon=True, name="ThumbnailPrefill")
+        thread.start()
+        return thread
+
+    def _thumbnails(self):
+        thumbnails = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return thumbnails
+
+        for name in names:
+            if not name.endswith(THUMBNAIL_EXTENSION):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            thumbnails.append((stat.st_mtime, stat.st_size, path))
+        return thumbnails
+
+    def size(self):
+        """Total size of all cached previews in bytes"""
+        return sum(size for _, size, _ in self._thumbnails())
+
+    def evict(self):
+        """Remove least recently used previews until the cache fits its cap; returns the bytes freed"""
+        thumbnails = sorted(self._thumbnails())
+        total = sum(size for _, size, _ in thumbnails)
+        freed = 0
+
+        for _, size, path in thumbnails:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                freed += size
+            except OSError as e:
+                print(f"[WARNING] Could not evict cached thumbnail {path}: {e}")
+
+        if freed:
+            print(f"[DEBUG] Thumbnail cache evicted {freed / (1024 * 1024):.1f} MB")
+        return freed
+
+    def clear(self):
+        """Remove every cached preview; returns the bytes freed"""
+        freed = 0
+        for _, size, path in self._thumbnails():
+            try:
+                os.remove(path)
+                freed += size
+            except OSError as e:
+                print(f"[WARNING] Could not remove {path}: {e}")
+        return freed
+
+_thumbnail_cache = None
+_thumbnail_cache_lock = threading.Lock()
+
+def get_thumbnail_cache():
+    """The shared thumbnail cache, created on first use"""
+    global _thumbnail_cache
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None:
+            _thumbnail_cache = ThumbnailCache()
+        return _thumbnail_cache
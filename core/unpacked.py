@@ -0,0 +1,166 @@
+"""
+Unpacked mod output - syncs mod entries into a folder instead of a ZIP
+
+BeamNG loads mods unpacked from <mods>/unpacked/<mod name>/. Writing a
+test build there skips compression entirely, and FolderSync only touches
+files whose content changed and removes files the build no longer
+produces, so a rebuild after editing one skin writes that skin's bytes
+and nothing else.
+"""
+import os
+import json
+import shutil
+import filecmp
+
+from core.packager import encode_text, CHUNK_SIZE
+from core.cancel import check_cancelled
+
+MANIFEST_FILE = ".beamskin_sync.json"
+
+def unpacked_mod_path(mods_path, mod_name):
+    """Folder BeamNG loads an unpacked mod from"""
+    return os.path.join(mods_path, "unpacked", mod_name)
+
+def is_synced_folder(target_dir):
+    """True when target_dir was written by FolderSync (or does not exist yet)"""
+    if not os.path.exists(target_dir):
+        return True
+    return os.path.isfile(os.path.join(target_dir, MANIFEST_FILE)) or not os.listdir(target_dir)
+
+class FolderSync:
+    """Writes (arcname, kind, payload) entries into a folder, changes only
+
+    A manifest in the folder remembers the source size and mtime each file
+    was last written from, so unchanged source files are skipped without
+    reading them. Everything else is compared with what is on disk before
+    it is written. Files are replaced through a temporary name so the game
+    never reads a half-written file.
+    """
+
+    def __init__(self, target_dir, cancel_token=None):
+        self.target_dir = target_dir
+        self.cancel_token = cancel_token
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+        self.bytes_written = 0
+        self._manifest = self._load_manifest()
+        self._new_manifest = {}
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.target_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        manifest_path = os.path.join(self.target_dir, MANIFEST_FILE)
+        temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._new_manifest, f)
+        os.replace(temp_path, manifest_path)
+
+    def _dest_path(self, arcname):
+        return os.path.join(self.target_dir, *arcname.split("/"))
+
+    def _replace(self, dest_path, write):
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        temp_path = f"{dest_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                write(f)
+            os.replace(temp_path, dest_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def add_bytes(self, arcname, data):
+        dest_path = self._dest_path(arcname)
+
+        try:
+            if os.path.getsize(dest_path) == len(data):
+                with open(dest_path, "rb") as f:
+                    if f.read() == data:
+                        self.unchanged += 1
+                        return
+        except OSError:
+            pass
+
+        self._replace(dest_path, lambda f: f.write(data))
+        self.written += 1
+        self.bytes_written += len(data)
+
+    def add_text(self, arcname, text):
+        self.add_bytes(arcname, encode_text(text))
+
+    def add_file(self, arcname, source_path):
+        dest_path = self._dest_path(arcname)
+        stat = os.stat(source_path)
+        signature = [os.path.abspath(source_path), stat.st_size, stat.st_mtime_ns]
+
+        try:
+            dest_stat = os.stat(dest_path)
+        except OSError:
+            dest_stat = None
+
+        if dest_stat is not None:
+            dest_signature = [dest_stat.st_size, dest_stat.st_mtime_ns]
+            recorded = self._manifest.get(arcname)
+
+            if recorded == signature + dest_signature or (
+                dest_stat.st_size == stat.st_size and filecmp.cmp(source_path, dest_path, shallow=False)
+            ):
+                self._new_manifest[arcname] = signature + dest_signature
+                self.unchanged += 1
+                return
+
+        def copy(f):
+            with open(source_path, "rb") as src:
+                shutil.copyfileobj(src, f, CHUNK_SIZE)
+
+        self._replace(dest_path, copy)
+        dest_stat = os.stat(dest_path)
+        self._new_manifest[arcname] = signature + [dest_stat.st_size, dest_stat.st_mtime_ns]
+        self.written += 1
+        self.bytes_written += stat.st_size
+
+    def sync(self, entries):
+        """Write every entry that changed and remove files no entry produced
+
+        Returns the number of files written.
+        """
+        os.makedirs(self.target_dir, exist_ok=True)
+        wanted = set()
+
+        for arcname, kind, payload in entries:
+            check_cancelled(self.cancel_token)
+            wanted.add(os.path.normcase(self._dest_path(arcname)))
+            if kind == "text":
+                self.add_text(arcname, payload)
+            else:
+                self.add_file(arcname, payload)
+
+        manifest_path = os.path.normcase(os.path.join(self.target_dir, MANIFEST_FILE))
+
+        for root_dir, dirs, files in os.walk(self.target_dir, topdown=False):
+            for file in files:
+                path = os.path.join(root_dir, file)
+                if os.path.normcase(path) in wanted or os.path.normcase(path) == manifest_path:
+                    continue
+                try:
+                    os.remove(path)
+                    self.removed += 1
+                except OSError as e:
+                    print(f"[WARNING] Could not remove stale file {path}: {e}")
+
+            if root_dir != self.target_dir and not os.listdir(root_dir):
+                os.rmdir(root_dir)
+
+        self._save_manifest()
+
+        print(
+            f"[DEBUG] Synced {self.target_dir}: {self.written} written, "
+            f"{self.unchanged} unchanged, {self.removed} removed"
+        )
+        return self.written
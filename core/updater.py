@@ -231,6 +231,7 @@ def prompt_update(new_version):
     button_frame.pack(pady=10, fill="x", padx=20)
 
     def download_update():
+        from gui.dispatch import dispatcher, run_in_background
         print(f"[DEBUG] download_update called")
         """Download the latest repository ZIP"""
         print(f"[DEBUG] Downloading latest version ZIP...")
@@ -251,6 +252,24 @@ def prompt_update(new_version):
         status_label.pack(pady=(0, 5))
         update_window.update()
         
+        def download_failed(e):
+            print(f"[DEBUG] Download failed: {e}")
+            download_btn.configure(text="Download Update", state="normal")
+            
+            # Show error and fallback to browser
+            error_msg = f"Download failed: {str(e)}\n\nOpening GitHub page instead..."
+            ctk.CTkLabel(
+                main_frame,
+                text=error_msg,
+                font=ctk.CTkFont(size=10),
+                text_color="red"
+            ).pack(pady=5)
+            
+            update_window.after(2000, lambda: [
+                webbrowser.open("https://github.com/johanssonserlanderkevin-sys/BeamSkin-Studio"),
+                update_window.destroy()
+            ])
+        
         try:
             # GitHub repository ZIP URL
             zip_url = "https://github.com/johanssonserlanderkevin-sys/BeamSkin-Studio/archive/refs/heads/main.zip"
@@ -273,6 +292,12 @@ def prompt_update(new_version):
             status_label.configure(text=f"Downloading {filename}...")
             update_window.update()
             
+        except Exception as e:
+            download_failed(e)
+            return
+        
+        def fetch():
+            """Download the ZIP on a background thread; progress goes through the dispatcher"""
             response = requests.get(zip_url, stream=True, timeout=30)
             response.raise_for_status()
             
@@ -289,11 +314,13 @@ def prompt_update(new_version):
                         # Update progress
                         progress_mb = downloaded / (1024 * 1024)
                         total_mb = total_size / (1024 * 1024)
-                        status_label.configure(
+                        dispatcher.post_latest(
+                            "update_download",
+                            status_label.configure,
                             text=f"Downloading: {progress_mb:.1f} MB / {total_mb:.1f} MB"
                         )
-                        update_window.update_idletasks()
-            
+        
+        def show_download_complete(_):
             status_label.configure(text="Download complete!")
             update_window.update()
             
@@ -341,11 +368,28 @@ def prompt_update(new_version):
                 import shutil
                 from pathlib import Path
                 
-                try:
-                    # Update button to show extraction status
-                    extract_btn.configure(text="Extracting...", state="disabled")
-                    success_window.update()
+                # Update button to show extraction status
+                extract_btn.configure(text="Extracting...", state="disabled")
+                success_window.update()
+                
+                def extract_failed(e):
+                    print(f"[DEBUG] Extraction/update failed: {e}")
+                    import traceback
+                    traceback.print_exc()
                     
+                    extract_btn.configure(text="Extract & Update", state="normal")
+                    
+                    # Show error
+                    error_label = ctk.CTkLabel(
+                        frame,
+                        text=f"Update failed: {str(e)}",
+                        font=ctk.CTkFont(size=10),
+                        text_color="red"
+                    )
+                    error_label.pack(pady=5)
+                
+                def install():
+                    """Extract the downloaded ZIP and copy it over the app on a background thread"""
                     # Get current application directory (root of the app)
                     if getattr(sys, 'frozen', False):
                         # Running as compiled exe - get the directory containing the exe
@@ -474,6 +518,9 @@ def prompt_update(new_version):
                     except Exception as e:
                         print(f"[DEBUG] Could not delete ZIP file: {e}")
                     
+                    return files_updated
+                
+                def show_update_complete(files_updated):
                     # Show completion message
                     success_window.destroy()
                     
@@ -603,21 +650,7 @@ def prompt_update(new_version):
                         height=35
                     ).pack(pady=(0, 10))
                     
-                except Exception as e:
-                    print(f"[DEBUG] Extraction/update failed: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    
-                    extract_btn.configure(text="Extract & Update", state="normal")
-                    
-                    # Show error
-                    error_label = ctk.CTkLabel(
-                        frame,
-                        text=f"Update failed: {str(e)}",
-                        font=ctk.CTkFont(size=10),
-                        text_color="red"
-                    )
-                    error_label.pack(pady=5)
+                run_in_background(install, show_update_complete, extract_failed)
             
             def open_folder():
                 if sys.platform == 'win32':
@@ -664,23 +697,7 @@ def prompt_update(new_version):
                 height=35
             ).pack(fill="x")
             
-        except Exception as e:
-            print(f"[DEBUG] Download failed: {e}")
-            download_btn.configure(text="Download Update", state="normal")
-            
-            # Show error and fallback to browser
-            error_msg = f"Download failed: {str(e)}\n\nOpening GitHub page instead..."
-            ctk.CTkLabel(
-                main_frame,
-                text=error_msg,
-                font=ctk.CTkFont(size=10),
-                text_color="red"
-            ).pack(pady=5)
-            
-            update_window.after(2000, lambda: [
-                webbrowser.open("https://github.com/johanssonserlanderkevin-sys/BeamSkin-Studio"),
-                update_window.destroy()
-            ])
+        run_in_background(fetch, show_download_complete, download_failed)
 
     def maybe_later():
         print(f"[DEBUG] maybe_later called")
@@ -752,7 +769,8 @@ def check_for_updates():
                 print(f"[DEBUG] UPDATE AVAILABLE! {CURRENT_VERSION} -> {latest_version}")
 
                 if _app_instance:
-                    _app_instance.after(0, lambda: prompt_update(latest_version))
+                    from gui.dispatch import dispatcher
+                    dispatcher.post(prompt_update, latest_version)
                 else:
 
                     response = messagebox.askyesno(
@@ -0,0 +1,141 @@
+"""
+Watch mode - rebuild a mod when the files a project references change
+
+FileWatcher polls the size and modification time of a small set of files
+(the DDS, .pc and .jpg files of a project, and optionally the project file
+itself). A burst of saves is collected until the files have been quiet for
+the debounce period, then on_change is called once with every path that
+changed. Rebuilds go through the build cache, so only the skins whose
+inputs changed are rendered and compressed again.
+"""
+import os
+import time
+import threading
+
+from core.cancel import CancelToken
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.75
+
+def project_watch_paths(project_data):
+    """Every source file referenced by the project's skins"""
+    paths = set()
+    for car_info in project_data.get("cars", {}).values():
+        for skin in car_info.get("skins", []):
+            if skin.get("dds_path"):
+                paths.add(os.path.abspath(skin["dds_path"]))
+
+            config_data = skin.get("config_data") or {}
+            for field in ("pc_file_path", "jpg_file_path"):
+                if config_data.get(field):
+                    paths.add(os.path.abspath(config_data[field]))
+    return paths
+
+def affected_skins(project_data, changed_paths):
+    """(car instance id, skin name) of every skin that uses a changed file"""
+    changed = {os.path.abspath(path) for path in changed_paths}
+    affected = []
+
+    for car_instance_id, car_info in project_data.get("cars", {}).items():
+        for skin in car_info.get("skins", []):
+            config_data = skin.get("config_data") or {}
+            skin_paths = {skin.get("dds_path"), config_data.get("pc_file_path"), config_data.get("jpg_file_path")}
+            if any(path and os.path.abspath(path) in changed for path in skin_paths):
+                affected.append((car_instance_id, skin.get("name", "")))
+
+    return affected
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+class FileWatcher:
+    """Poll files on a background thread and report debounced changes
+
+    paths_fn returns the paths to watch and is called on every poll, so the
+    set can follow a project that is being edited.
+    on_change(changed_paths, cancel_token) runs on the watcher thread;
+    changes made while it runs are picked up by the next poll. stop()
+    cancels the token and waits for on_change to return, so a rebuild that
+    checks its token never outlives the watcher.
+    """
+
+    def __init__(self, paths_fn, on_change, interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE):
+        self.paths_fn = paths_fn
+        self.on_change = on_change
+        self.interval = interval
+        self.debounce = debounce
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._cancel_token = None
+
+    @property
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        cancel_token = self._cancel_token
+        if cancel_token is not None:
+            cancel_token.cancel()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def run(self):
+        """Poll until stop() is called; usable directly for a blocking loop"""
+        signatures = {path: _signature(path) for path in self.paths_fn()}
+        pending = set()
+        last_change = 0.0
+
+        while not self._stop_event.wait(self.interval):
+            try:
+                paths = self.paths_fn()
+            except Exception as e:
+                print(f"[WARNING] Watch mode could not list files: {e}")
+                continue
+
+            current = {path: _signature(path) for path in paths}
+            changed = {
+                path for path, signature in current.items()
+                if path in signatures and signature != signatures[path]
+            }
+            # Newly referenced files count as changed once they exist
+            changed.update(
+                path for path, signature in current.items()
+                if path not in signatures and signature is not None
+            )
+            signatures = current
+
+            if changed:
+                pending.update(changed)
+                last_change = time.monotonic()
+                continue
+
+            if pending and time.monotonic() - last_change >= self.debounce:
+                changed_paths = sorted(pending)
+                pending.clear()
+
+                # Set before checking for stop() so it either sees this
+                # token or this check sees the stop
+                cancel_token = self._cancel_token = CancelToken()
+                if self._stop_event.is_set():
+                    break
+                try:
+                    self.on_change(changed_paths, cancel_token)
+                except Exception as e:
+                    import traceback
+                    traceback.print_exc()
+                    print(f"[ERROR] Watch mode rebuild failed: {e}")
+                finally:
+                    self._cancel_token = None
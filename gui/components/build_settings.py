@@ -0,0 +1,277 @@
+"""
+Build Settings Section - Options that control how mods are generated
+"""
+import customtkinter as ctk
+import os
+from gui.state import state
+from core.settings import (
+    get_build_jobs, set_build_jobs, get_streaming_build, set_streaming_build,
+    get_reproducible_build, set_reproducible_build, get_build_cache_enabled, set_build_cache_enabled, get_build_cache_size_mb, set_build_cache_size_mb
+)
+
+CACHE_SIZE_OPTIONS = {
+    "512 MB": 512,
+    "1 GB": 1024,
+    "2 GB": 2048,
+    "5 GB": 5120,
+    "10 GB": 10240
+}
+
+class BuildSettingsSection:
+    """Section for configuring mod generation performance options"""
+
+    def __init__(self, parent, notification_callback=None):
+        """
+        Create build settings section
+
+        Args:
+            parent: Parent frame
+            notification_callback: Optional callback for showing notifications
+        """
+        self.notification_callback = notification_callback
+
+        self.frame = ctk.CTkFrame(parent, fg_color=state.colors["card_bg"], corner_radius=12)
+
+        header_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        header_frame.pack(fill="x", padx=20, pady=(20, 15))
+
+        ctk.CTkLabel(
+            header_frame,
+            text="⚙️ Build",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=state.colors["text"],
+            anchor="w"
+        ).pack(side="left")
+
+        ctk.CTkLabel(
+            self.frame,
+            text="Options that control how mods are generated",
+            font=ctk.CTkFont(size=12),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        ).pack(fill="x", padx=20, pady=(0, 20))
+
+        self._create_workers_config()
+
+        self._create_streaming_config()
+
+        self._create_reproducible_config()
+
+        self._create_cache_config()
+
+    def _create_workers_config(self):
+        """Create parallel build worker configuration"""
+        config_frame = ctk.CTkFrame(self.frame, fg_color=state.colors["frame_bg"], corner_radius=8)
+        config_frame.pack(fill="x", padx=20, pady=(0, 20))
+
+        row = ctk.CTkFrame(config_frame, fg_color="transparent")
+        row.pack(fill="x", padx=15, pady=(15, 10))
+
+        ctk.CTkLabel(
+            row,
+            text="Parallel Workers",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=state.colors["text"],
+            anchor="w"
+        ).pack(side="left")
+
+        cpu_count = os.cpu_count() or 1
+        values = [str(n) for n in range(1, cpu_count + 1)]
+
+        self.workers_var = ctk.StringVar(value=str(min(get_build_jobs(), cpu_count)))
+
+        ctk.CTkOptionMenu(
+            row,
+            variable=self.workers_var,
+            values=values,
+            command=self._on_workers_changed,
+            width=90,
+            height=32,
+            fg_color=state.colors["card_bg"],
+            button_color=state.colors["accent"],
+            button_hover_color=state.colors["accent_hover"],
+            text_color=state.colors["text"],
+            dropdown_fg_color=state.colors["card_bg"],
+            dropdown_hover_color=state.colors["card_hover"],
+            dropdown_text_color=state.colors["text"]
+        ).pack(side="right")
+
+        ctk.CTkLabel(
+            config_frame,
+            text="Number of skins processed at the same time (1 = one after another)",
+            font=ctk.CTkFont(size=11),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        ).pack(fill="x", padx=15, pady=(0, 15))
+
+    def _create_streaming_config(self):
+        """Create streaming build toggle"""
+        config_frame = ctk.CTkFrame(self.frame, fg_color=state.colors["frame_bg"], corner_radius=8)
+        config_frame.pack(fill="x", padx=20, pady=(0, 20))
+
+        self.streaming_var = ctk.BooleanVar(value=get_streaming_build())
+
+        ctk.CTkCheckBox(
+            config_frame,
+            text="Stream directly into ZIP",
+            variable=self.streaming_var,
+            command=self._on_streaming_changed,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=state.colors["text"],
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"]
+        ).pack(anchor="w", padx=15, pady=(15, 10))
+
+        ctk.CTkLabel(
+            config_frame,
+            text="Skips the temporary folder and writes textures straight from their original location",
+            font=ctk.CTkFont(size=11),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        ).pack(fill="x", padx=15, pady=(0, 15))
+
+    def _create_reproducible_config(self):
+        """Create reproducible build toggle"""
+        config_frame = ctk.CTkFrame(self.frame, fg_color=state.colors["frame_bg"], corner_radius=8)
+        config_frame.pack(fill="x", padx=20, pady=(0, 20))
+
+        self.reproducible_var = ctk.BooleanVar(value=get_reproducible_build())
+
+        ctk.CTkCheckBox(
+            config_frame,
+            text="Reproducible ZIPs",
+            variable=self.reproducible_var,
+            command=self._on_reproducible_changed,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=state.colors["text"],
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"]
+        ).pack(anchor="w", padx=15, pady=(15, 10))
+
+        ctk.CTkLabel(
+            config_frame,
+            text="The same project always gives the same ZIP; an unchanged mod is not rewritten",
+            font=ctk.CTkFont(size=11),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        ).pack(fill="x", padx=15, pady=(0, 15))
+
+    def _create_cache_config(self):
+        """Create build cache options"""
+        config_frame = ctk.CTkFrame(self.frame, fg_color=state.colors["frame_bg"], corner_radius=8)
+        config_frame.pack(fill="x", padx=20, pady=(0, 20))
+
+        self.cache_enabled_var = ctk.BooleanVar(value=get_build_cache_enabled())
+
+        ctk.CTkCheckBox(
+            config_frame,
+            text="Reuse unchanged skins (build cache)",
+            variable=self.cache_enabled_var,
+            command=self._on_cache_enabled_changed,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=state.colors["text"],
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"]
+        ).pack(anchor="w", padx=15, pady=(15, 10))
+
+        ctk.CTkLabel(
+            config_frame,
+            text="Only skins whose texture, settings or template changed are rebuilt (streaming builds only)",
+            font=ctk.CTkFont(size=11),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        ).pack(fill="x", padx=15, pady=(0, 10))
+
+        row = ctk.CTkFrame(config_frame, fg_color="transparent")
+        row.pack(fill="x", padx=15, pady=(0, 15))
+
+        ctk.CTkLabel(
+            row,
+            text="Cache size limit",
+            font=ctk.CTkFont(size=12),
+            text_color=state.colors["text"],
+            anchor="w"
+        ).pack(side="left")
+
+        ctk.CTkButton(
+            row,
+            text="🗑️ Clear build cache",
+            command=self._clear_build_cache,
+            width=150,
+            height=32,
+            fg_color=state.colors["error"],
+            hover_color=state.colors["error_hover"],
+            text_color="white",
+            corner_radius=8
+        ).pack(side="right")
+
+        current_mb = get_build_cache_size_mb()
+        current_label = next(
+            (label for label, size_mb in CACHE_SIZE_OPTIONS.items() if size_mb == current_mb),
+            f"{current_mb} MB"
+        )
+        self.cache_size_var = ctk.StringVar(value=current_label)
+
+        ctk.CTkOptionMenu(
+            row,
+            variable=self.cache_size_var,
+            values=list(CACHE_SIZE_OPTIONS.keys()),
+            command=self._on_cache_size_changed,
+            width=100,
+            height=32,
+            fg_color=state.colors["card_bg"],
+            button_color=state.colors["accent"],
+            button_hover_color=state.colors["accent_hover"],
+            text_color=state.colors["text"],
+            dropdown_fg_color=state.colors["card_bg"],
+            dropdown_hover_color=state.colors["card_hover"],
+            dropdown_text_color=state.colors["text"]
+        ).pack(side="right", padx=(0, 10))
+
+    def _on_cache_enabled_changed(self):
+        """Save the build cache toggle"""
+        set_build_cache_enabled(self.cache_enabled_var.get())
+
+    def _on_cache_size_changed(self, value: str):
+        """Save the selected cache size limit"""
+        set_build_cache_size_mb(CACHE_SIZE_OPTIONS[value])
+
+    def _clear_build_cache(self):
+        """Delete every cached skin artifact"""
+        from core.build_cache import BuildCache
+
+        try:
+            freed = BuildCache().clear()
+        except Exception as e:
+            print(f"[ERROR] Failed to clear build cache: {e}")
+            if self.notification_callback:
+                self.notification_callback(f"Failed to clear build cache: {e}", "error", 3000)
+            return
+
+        if self.notification_callback:
+            self.notification_callback(
+                f"Build cache cleared ({freed / (1024 * 1024):.1f} MB freed)", "success", 2500
+            )
+
+    def _on_streaming_changed(self):
+        """Save the streaming build toggle"""
+        set_streaming_build(self.streaming_var.get())
+
+    def _on_reproducible_changed(self):
+        """Save the reproducible build toggle"""
+        set_reproducible_build(self.reproducible_var.get())
+
+    def _on_workers_changed(self, value: str):
+        """Save the selected worker count"""
+        set_build_jobs(int(value))
+
+        if self.notification_callback:
+            self.notification_callback(f"Build workers set to {value}", "success", 2000)
+
+    def pack(self, **kwargs):
+        """Pack the section frame"""
+        self.frame.pack(**kwargs)
+
+    def pack_forget(self):
+        """Hide the section frame"""
+        self.frame.pack_forget()
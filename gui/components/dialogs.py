@@ -4,6 +4,7 @@ Dialog Components - Reusable dialog windows and notifications
 import customtkinter as ctk
 import webbrowser
 from gui.state import state
+from gui.dispatch import dispatcher
 from gui.components.setup_wizard import show_setup_wizard
 
 def show_notification(app, message, type="info", duration=3000):
@@ -25,6 +26,11 @@ def show_notification(app, message, type="info", duration=3000):
         print(f"[{type.upper()}] {message}")
         return
 
+    # Notifications from background jobs are shown from the Tk thread
+    if not dispatcher.on_main_thread():
+        dispatcher.post(show_notification, app, message, type, duration)
+        return
+
     if not hasattr(app, 'notification_frame'):
         app.notification_frame = ctk.CTkFrame(app, fg_color="transparent")
 
@@ -6,6 +6,14 @@ import customtkinter as ctk
 from tkinter import filedialog
 from gui.state import state
 from gui.components.preview import HoverPreviewManager
+from gui.components.virtual_list import VirtualList
+
+# Sidebar vehicles on each side of the hovered one whose previews are prefetched
+PREFETCH_NEIGHBOURS = 3
+
+VEHICLE_BUTTON_HEIGHT = 38
+# The "Add to Project" button shown under an expanded vehicle, with its padding
+ADD_BUTTON_HEIGHT = 32 + 5
 
 print(f"[DEBUG] Loading class: Sidebar")
 
@@ -27,7 +35,8 @@ class Sidebar(ctk.CTkFrame):
         self.expanded_vehicle_carid: Optional[str] = None
 
         self.custom_output_frame: Optional[ctk.CTkFrame] = None
-        self.sidebar_scroll: Optional[ctk.CTkScrollableFrame] = None
+        self.vehicle_list: Optional[VirtualList] = None
+        self.add_vehicle_callback: Optional[Callable[[str, str], None]] = None
 
         self._setup_ui()
 
@@ -146,6 +155,26 @@ class Sidebar(ctk.CTkFrame):
 
         self.custom_option_sidebar = custom_option_sidebar
 
+        # Syncs an uncompressed folder into <mods>/unpacked/ for quick test builds
+        unpacked_option_sidebar = ctk.CTkFrame(self, fg_color=state.colors["frame_bg"], corner_radius=8, height=45)
+        unpacked_option_sidebar.pack(fill="x", padx=15, pady=(0, 5))
+        unpacked_option_sidebar.pack_propagate(False)
+
+        self.unpacked_icon_label = ctk.CTkLabel(unpacked_option_sidebar, text="", image=None)
+        self.unpacked_icon_label.pack(side="left", padx=(10, 5), pady=10)
+
+        self.unpacked_radio_sidebar = ctk.CTkRadioButton(
+            unpacked_option_sidebar,
+            text="Unpacked (test builds)",
+            variable=self.output_mode_var,
+            value="unpacked",
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"],
+            text_color=state.colors["text"],
+            font=ctk.CTkFont(size=13, weight="bold")
+        )
+        self.unpacked_radio_sidebar.pack(side="left", padx=0, pady=10)
+
         self.output_mode_var.trace_add("write", lambda *args: self._update_output_mode())
 
         self.custom_output_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -213,13 +242,16 @@ class Sidebar(ctk.CTkFrame):
 
         self.sidebar_search_var.trace_add("write", lambda *args: self._filter_vehicles())
 
-        self.sidebar_scroll = ctk.CTkScrollableFrame(
+        self.vehicle_list = VirtualList(
             self,
-            fg_color="transparent",
+            create_row=self._create_vehicle_row,
+            bind_row=self._bind_vehicle_row,
+            row_height=self._vehicle_row_height,
+            row_gap=4,
             scrollbar_button_color=state.colors["border"],
             scrollbar_button_hover_color=state.colors["card_hover"]
         )
-        self.sidebar_scroll.pack(fill="both", expand=True, padx=15, pady=(0, 10))
+        self.vehicle_list.pack(fill="both", expand=True, padx=15, pady=(0, 10))
 
     def _on_mod_name_focus_in(self, event):
         """Handle focus in for mod name entry"""
@@ -274,18 +306,11 @@ class Sidebar(ctk.CTkFrame):
 
         search_query = search_query.lower()
 
-        for container, carid, display_name, add_btn_frame in state.sidebar_vehicle_buttons:
-
-            matches = (
-                not search_query or
-                search_query in display_name.lower() or
-                search_query in carid.lower()
-            )
-
-            if matches:
-                container.pack(fill="x", pady=2, padx=0)
-            else:
-                container.pack_forget()
+        matches = [
+            (carid, display_name) for carid, display_name in state.sidebar_vehicles
+            if not search_query or search_query in display_name.lower() or search_query in carid.lower()
+        ]
+        self.vehicle_list.set_items(matches)
 
     def _get_real_value(self, value: str, placeholder: str) -> str:
         """Get real value, ignoring placeholder"""
@@ -328,6 +353,8 @@ class Sidebar(ctk.CTkFrame):
         """
         print("[DEBUG] Populating sidebar with vehicles...")
 
+        self.add_vehicle_callback = add_callback
+
         all_vehicles = {}
 
         for carid, display_name in state.vehicle_ids.items():
@@ -337,49 +364,46 @@ class Sidebar(ctk.CTkFrame):
         for carid, carname in state.added_vehicles.items():
             all_vehicles[carid] = carname
 
-        sorted_vehicles = sorted(all_vehicles.items(), key=lambda x: x[1].lower())
-
-        for carid, display_name in sorted_vehicles:
-            self._add_vehicle_button(carid, display_name, add_callback)
-
-        print(f"[DEBUG] Added {len(state.sidebar_vehicle_buttons)} vehicles to sidebar")
+        state.sidebar_vehicles = sorted(all_vehicles.items(), key=lambda x: x[1].lower())
+        if self.expanded_vehicle_carid not in all_vehicles:
+            self.expanded_vehicle_carid = None
 
-    def _add_vehicle_button(self, carid: str, display_name: str, add_callback: Callable[[str, str], None]):
-        """Add a single vehicle button to the sidebar
+        self._filter_vehicles()
 
-        Args:
-            carid: Vehicle ID
-            display_name: Display name for the vehicle
-            add_callback: Function that takes (carid, display_name) to add vehicle
-        """
+        print(f"[DEBUG] Added {len(state.sidebar_vehicles)} vehicles to sidebar")
 
-        insert_position = len(state.sidebar_vehicle_buttons)
-        for i, (container, cid, dname, add_btn_frame) in enumerate(state.sidebar_vehicle_buttons):
-            if dname.lower() > display_name.lower():
-                insert_position = i
-                break
+    def _vehicle_row_height(self, item) -> int:
+        carid, _ = item
+        if carid == self.expanded_vehicle_carid:
+            return VEHICLE_BUTTON_HEIGHT + ADD_BUTTON_HEIGHT
+        return VEHICLE_BUTTON_HEIGHT
 
-        container_frame = ctk.CTkFrame(self.sidebar_scroll, corner_radius=8, fg_color="transparent")
+    def _create_vehicle_row(self, parent) -> ctk.CTkFrame:
+        """Build an empty vehicle row for the virtual list"""
+        row = ctk.CTkFrame(parent, corner_radius=8, fg_color="transparent")
+        row.carid = None
+        row.display_name = None
 
-        btn = ctk.CTkButton(
-            container_frame,
-            text=display_name,
+        row.btn = ctk.CTkButton(
+            row,
+            text="",
             fg_color=state.colors["card_bg"],
             hover_color=state.colors["card_hover"],
-            height=38,
+            height=VEHICLE_BUTTON_HEIGHT,
             corner_radius=8,
             text_color=state.colors["text"],
             anchor="w",
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=ctk.CTkFont(size=13, weight="bold"),
+            command=lambda: self._toggle_vehicle_add_button(row.carid)
         )
-        btn.pack(fill="x")
+        row.btn.pack(fill="x")
 
-        add_button_frame = ctk.CTkFrame(container_frame, fg_color="transparent")
+        row.add_button_frame = ctk.CTkFrame(row, fg_color="transparent")
 
         add_btn = ctk.CTkButton(
-            add_button_frame,
+            row.add_button_frame,
             text="➕ Add to Project",
-            command=lambda c=carid, d=display_name: add_callback(c, d),
+            command=lambda: self._add_vehicle(row.carid, row.display_name),
             fg_color=state.colors["accent"],
             hover_color=state.colors["accent_hover"],
             text_color=state.colors["accent_text"],
@@ -389,36 +413,50 @@ class Sidebar(ctk.CTkFrame):
         )
         add_btn.pack(fill="x")
 
-        btn.configure(command=lambda c=carid, frame=add_button_frame: self._toggle_vehicle_add_button(c, frame))
-
-        btn.bind("<Enter>", lambda e, c=carid: self.preview_manager.schedule_hover_preview(c, btn))
-        btn.bind("<Leave>", lambda e: self.preview_manager.hide_hover_preview())
-
-        state.sidebar_vehicle_buttons.insert(insert_position, (container_frame, carid, display_name, add_button_frame))
-
-        for widget in self.sidebar_scroll.winfo_children():
-            if widget in [container for container, _, _, _ in state.sidebar_vehicle_buttons]:
-                widget.pack_forget()
+        row.btn.bind("<Enter>", lambda e: self._on_vehicle_hover(row.carid, row.btn))
+        row.btn.bind("<Leave>", lambda e: self.preview_manager.hide_hover_preview())
+        return row
 
-        for container, cid, dname, add_frame in state.sidebar_vehicle_buttons:
-            container.pack(fill="x", pady=2, padx=0)
+    def _bind_vehicle_row(self, row: ctk.CTkFrame, item, index: int):
+        """Show a vehicle in a recycled row"""
+        row.carid, row.display_name = item
+        row.btn.configure(text=row.display_name)
 
-    def _toggle_vehicle_add_button(self, carid: str, add_button_frame: ctk.CTkFrame):
+        if row.carid == self.expanded_vehicle_carid:
+            row.add_button_frame.pack(fill="x", padx=5, pady=(0, 5))
+        else:
+            row.add_button_frame.pack_forget()
+
+    def _add_vehicle(self, carid: str, display_name: str):
+        if carid and self.add_vehicle_callback:
+            self.add_vehicle_callback(carid, display_name)
+
+    def _on_vehicle_hover(self, carid: str, btn: ctk.CTkButton):
+        """Schedule the hover preview and decode the previews of the vehicles around it"""
+        if not carid:
+            return
+        self.preview_manager.schedule_hover_preview(carid, btn)
+
+        visible = [cid for cid, _ in self.vehicle_list.items]
+        if carid not in visible:
+            return
+        index = visible.index(carid)
+        # Next ones first; the list is mostly moved through downwards
+        neighbours = visible[index + 1:index + 1 + PREFETCH_NEIGHBOURS] + visible[max(0, index - PREFETCH_NEIGHBOURS):index]
+        self.preview_manager.prefetch(neighbours)
+
+    def _toggle_vehicle_add_button(self, carid: Optional[str]):
         """Toggle the add button for a vehicle"""
-        if self.expanded_vehicle_carid == carid:
-
-            add_button_frame.pack_forget()
+        if not carid:
+            return
+        self.expanded_vehicle_carid = None if self.expanded_vehicle_carid == carid else carid
+        self.vehicle_list.refresh()
+
+    def collapse_expanded_vehicle(self):
+        """Hide the add button of the expanded vehicle, if any"""
+        if self.expanded_vehicle_carid is not None:
             self.expanded_vehicle_carid = None
-        else:
-
-            if self.expanded_vehicle_carid is not None:
-                for btn_frame, car_id, _, add_btn_frame in state.sidebar_vehicle_buttons:
-                    if car_id == self.expanded_vehicle_carid:
-                        add_btn_frame.pack_forget()
-                        break
-
-            add_button_frame.pack(fill="x", padx=5, pady=(0, 5))
-            self.expanded_vehicle_carid = carid
+            self.vehicle_list.refresh()
 
     def update_icons(self, steam_icon, folder_icon):
 
@@ -428,6 +466,7 @@ class Sidebar(ctk.CTkFrame):
             self.steam_icon_label.configure(image=steam_icon)
         if folder_icon:
             self.custom_icon_label.configure(image=folder_icon)
+            self.unpacked_icon_label.configure(image=folder_icon)
 
 print(f"[DEBUG] Loading class: Topbar")
 
@@ -435,7 +474,7 @@ class Topbar(ctk.CTkFrame):
     """Top navigation bar with menu and generate button"""
 
     def __init__(self, parent: ctk.CTk, on_view_change: Callable[[str], None], on_generate: Callable[[], None],
-                 logo_image=None):
+                 logo_image=None, on_plan: Callable[[], None] = None):
 
         print(f"[DEBUG] __init__ called")
 
@@ -444,6 +483,7 @@ class Topbar(ctk.CTkFrame):
 
         self.on_view_change = on_view_change
         self.on_generate = on_generate
+        self.on_plan = on_plan
         self.logo_image = logo_image
 
         self.menu_buttons = {}
@@ -488,6 +528,7 @@ class Topbar(ctk.CTkFrame):
 
         menu_items = [
             ("Project", "generator"),
+            ("Build Queue", "build_queue"),
             ("How to Use", "howto"),
             ("Car List", "carlist"),
             ("Add Vehicles", "add_vehicles"),
@@ -512,8 +553,12 @@ class Topbar(ctk.CTkFrame):
             btn.pack(side="left", padx=3)
             self.menu_buttons[view_name] = btn
 
+        # Plan and Generate are shown and hidden together
+        self.actions_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.actions_frame.pack(side="right", padx=25)
+
         self.generate_button = ctk.CTkButton(
-            self,
+            self.actions_frame,
             text="✨ Generate Mod",
             command=self.on_generate,
             height=40,
@@ -524,7 +569,22 @@ class Topbar(ctk.CTkFrame):
             corner_radius=10,
             font=ctk.CTkFont(size=14, weight="bold")
         )
-        self.generate_button.pack(side="right", padx=25)
+        self.generate_button.pack(side="right")
+
+        self.plan_button = ctk.CTkButton(
+            self.actions_frame,
+            text="📋 Plan",
+            command=self.on_plan,
+            height=40,
+            width=90,
+            fg_color=state.colors["card_bg"],
+            hover_color=state.colors["card_hover"],
+            text_color=state.colors["text"],
+            corner_radius=10,
+            font=ctk.CTkFont(size=14, weight="bold")
+        )
+        if self.on_plan:
+            self.plan_button.pack(side="right", padx=(0, 10))
 
     def update_logo(self, logo_image):
 
@@ -1,11 +1,17 @@
 """
 Hover Preview Manager - Handles vehicle preview popups on hover
 """
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional, Set
+from collections import OrderedDict
 import customtkinter as ctk
-from PIL import Image
 import os
 from gui.state import state
+from gui.images import image_service, load_scaled
+
+HOVER_REQUEST_KEY = "hover_preview"
+PREVIEW_SIZE = 300
+# Ready preview images kept in memory, most recently hovered last
+PREVIEW_CACHE_SIZE = 64
 
 class HoverPreviewManager:
     """Manages hover preview windows for vehicle cards"""
@@ -15,11 +21,131 @@ class HoverPreviewManager:
         self.preview_overlay = preview_overlay
         self.hover_timer: Optional[str] = None
         self.current_hover_carid: Optional[str] = None
+        self._images: "OrderedDict[str, ctk.CTkImage]" = OrderedDict()
+        self._image_paths: Dict[str, Optional[str]] = {}
+        self._unreadable: Set[str] = set()
+        self._loading: Set[str] = set()
+        self._fallback = False
+        self._waiting_carid: Optional[str] = None
+        self._hover_request_path: Optional[str] = None
+
+    def _resolve_image_path(self, carid: str) -> Optional[str]:
+        """Preview image path for carid, the missing-texture image, or None
+
+        Looked up on disk once per vehicle; vehicles without an image of
+        their own are remembered and get the fallback straight away.
+        """
+        if carid not in self._image_paths:
+            image_path = os.path.join("imagesforgui", "vehicles", carid, "default.jpg")
+            if not os.path.exists(image_path):
+                print(f"[DEBUG] No preview image for {carid} at {os.path.abspath(image_path)}, using the fallback")
+                image_path = self._fallback_path()
+            self._image_paths[carid] = image_path
+
+        image_path = self._image_paths[carid]
+        if image_path in self._unreadable:
+            return None
+        return image_path
+
+    def _fallback_path(self) -> Optional[str]:
+        if self._fallback is False:
+            fallback_path = os.path.join("imagesforgui", "common", "imagepreview", "MissingTexture.jpg")
+            self._fallback = fallback_path if os.path.exists(fallback_path) else None
+            if self._fallback is None:
+                print(f"[DEBUG] Fallback preview not found: {os.path.abspath(fallback_path)}")
+        return self._fallback
+
+    def _cached_image(self, image_path: str) -> Optional[ctk.CTkImage]:
+        photo = self._images.get(image_path)
+        if photo is not None:
+            self._images.move_to_end(image_path)
+        return photo
+
+    def _cache_image(self, image_path: str, img) -> ctk.CTkImage:
+        """Wrap a decoded preview in a CTkImage and keep it in the LRU cache"""
+        photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+        self._images[image_path] = photo
+        self._images.move_to_end(image_path)
+        while len(self._images) > PREVIEW_CACHE_SIZE:
+            self._images.popitem(last=False)
+        return photo
+
+    def _image_failed(self, image_path: str, error: Exception) -> None:
+        print(f"[DEBUG] Error loading image {image_path}: {error}")
+        self._loading.discard(image_path)
+        if self._hover_request_path == image_path:
+            self._hover_request_path = None
+        self._unreadable.add(image_path)
 
     def show_hover_preview(self, carid: str, x: int, y: int) -> None:
         """Show preview image for vehicle INSIDE the main window"""
         print(f"[DEBUG] show_hover_preview called for carid: {carid}")
-        print(f"[DEBUG] Current working directory: {os.getcwd()}")
+
+        image_path = self._resolve_image_path(carid)
+        if image_path is None:
+            print(f"[DEBUG] No preview available for {carid}")
+            return
+
+        photo = self._cached_image(image_path)
+        if photo is not None:
+            self._show_loaded_preview(carid, photo)
+            return
+
+        # Shown by _image_loaded() once decoded
+        self._waiting_carid = carid
+        if image_path in self._loading:
+            # A prefetch is decoding it already
+            return
+
+        print(f"[DEBUG] Attempting to load image: {image_path}")
+        self._drop_hover_request()
+        self._loading.add(image_path)
+        self._hover_request_path = image_path
+        image_service.request(
+            HOVER_REQUEST_KEY,
+            lambda: load_scaled(image_path, PREVIEW_SIZE),
+            lambda img: self._image_loaded(image_path, img),
+            lambda e: self._image_failed(image_path, e)
+        )
+
+    def _drop_hover_request(self) -> None:
+        """Cancel the hover request; a superseded request runs neither callback"""
+        image_service.cancel(HOVER_REQUEST_KEY)
+        if self._hover_request_path is not None:
+            self._loading.discard(self._hover_request_path)
+            self._hover_request_path = None
+
+    def prefetch(self, carids: Iterable[str]) -> None:
+        """Decode the previews of carids in the background so hovering them shows no delay"""
+        for carid in carids:
+            image_path = self._resolve_image_path(carid)
+            if image_path is None or image_path in self._images or image_path in self._loading:
+                continue
+
+            self._loading.add(image_path)
+            image_service.request(
+                None,
+                lambda path=image_path: load_scaled(path, PREVIEW_SIZE),
+                lambda img, path=image_path: self._image_loaded(path, img),
+                lambda e, path=image_path: self._image_failed(path, e)
+            )
+
+    def _image_loaded(self, image_path: str, img) -> None:
+        self._loading.discard(image_path)
+        if self._hover_request_path == image_path:
+            self._hover_request_path = None
+        photo = self._cache_image(image_path, img)
+
+        carid = self._waiting_carid
+        if carid is not None and self._image_paths.get(carid) == image_path:
+            self._waiting_carid = None
+            self._show_loaded_preview(carid, photo)
+
+    def _show_loaded_preview(self, carid: str, photo: ctk.CTkImage) -> None:
+        """Place the preview image next to the mouse"""
+        if self.current_hover_carid != carid:
+            print(f"[DEBUG] No longer hovering {carid}, dropping its preview")
+            return
 
         mouse_x = self.app.winfo_pointerx() - self.app.winfo_rootx()
         mouse_y = self.app.winfo_pointery() - self.app.winfo_rooty()
@@ -28,41 +154,7 @@ class HoverPreviewManager:
         for child in self.preview_overlay.winfo_children():
             child.destroy()
 
-        image_path = os.path.join("imagesforgui", "vehicles", carid, "default.jpg")
-        print(f"[DEBUG] Looking for image at: {image_path}")
-        print(f"[DEBUG] Absolute path: {os.path.abspath(image_path)}")
-        print(f"[DEBUG] Image exists: {os.path.exists(image_path)}")
-
-        if not os.path.exists(image_path):
-            print(f"[DEBUG] Image not found, trying fallback...")
-
-            if os.path.exists("imagesforgui"):
-                print(f"[DEBUG] imagesforgui exists, listing contents:")
-                try:
-                    print(f"[DEBUG] imagesforgui contents: {os.listdir('imagesforgui')}")
-                    if os.path.exists(os.path.join("imagesforgui", "vehicles")):
-                        print(f"[DEBUG] vehicles folder contents: {os.listdir(os.path.join('imagesforgui', 'vehicles'))}")
-                except Exception as e:
-                    print(f"[DEBUG] Error listing directories: {e}")
-            else:
-                print(f"[DEBUG] imagesforgui folder does NOT exist in current directory")
-
-            fallback_path = os.path.join("imagesforgui", "common", "imagepreview", "MissingTexture.jpg")
-            print(f"[DEBUG] Fallback path: {fallback_path}")
-            print(f"[DEBUG] Fallback absolute path: {os.path.abspath(fallback_path)}")
-            print(f"[DEBUG] Fallback exists: {os.path.exists(fallback_path)}")
-            if os.path.exists(fallback_path):
-                image_path = fallback_path
-            else:
-                print(f"[DEBUG] No fallback found, returning early")
-                return
-
         try:
-            print(f"[DEBUG] Attempting to load image: {image_path}")
-            img = Image.open(image_path)
-            img.thumbnail((300, 300), Image.Resampling.LANCZOS)
-            photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
-            print(f"[DEBUG] Image loaded successfully, size: {img.size}")
 
             header = ctk.CTkFrame(self.preview_overlay, fg_color=state.colors["accent"], height=30, corner_radius=8)
             header.pack(fill="x", padx=2, pady=2)
@@ -124,6 +216,8 @@ class HoverPreviewManager:
             self.app.after_cancel(self.hover_timer)
             self.hover_timer = None
 
+        self._drop_hover_request()
+        self._waiting_carid = None
         self.current_hover_carid = None
         self.preview_overlay.place_forget()
         for child in self.preview_overlay.winfo_children():
@@ -152,10 +246,16 @@ class HoverPreviewManager:
 
     def setup_robust_hover(self, widget, carid: str) -> None:
         """Set up hover events recursively for a widget and ALL its descendants"""
+        self.setup_row_hover(widget, lambda: carid)
+        print(f"[DEBUG] Robust recursive hover setup complete for carid: {carid}")
 
-        def on_enter(event):
+    def setup_row_hover(self, widget, get_carid: Callable[[], Optional[str]]) -> None:
+        """Like setup_robust_hover, for a recycled list row that shows get_carid()'s vehicle"""
 
-            self.schedule_hover_preview(carid, widget)
+        def on_enter(event):
+            carid = get_carid()
+            if carid:
+                self.schedule_hover_preview(carid, widget)
 
         def on_leave(event):
             self.hide_hover_preview()
@@ -174,4 +274,3 @@ class HoverPreviewManager:
                 apply_bindings(child)
 
         apply_bindings(widget)
-        print(f"[DEBUG] Robust recursive hover setup complete for carid: {carid}")
\ No newline at end of file
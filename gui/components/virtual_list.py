@@ -0,0 +1,156 @@
+"""
+Virtual List - scrollable list that only builds widgets for the visible rows
+
+A CTkScrollableFrame needs a widget tree per item, so a list of a few
+hundred vehicles takes seconds to build and scrolls slowly. VirtualList
+keeps a small pool of row widgets, enough to fill the visible window, and
+binds them to items by index while scrolling: the row for item i is pool
+slot i % pool size, so scrolling by one row rebinds one row. Rows are
+placed by hand at their item's offset, and item heights can differ
+(an expanded sidebar entry is taller than the others). Heights and
+offsets are in CTk units, like widget sizes, and scaled when placed.
+"""
+from typing import Any, Callable, List, Optional, Sequence, Union
+from bisect import bisect_right
+import tkinter
+import customtkinter as ctk
+
+# Distance moved by one mouse wheel step and one scrollbar unit
+WHEEL_STEP = 60
+SCROLL_UNIT = 20
+
+class VirtualList(ctk.CTkFrame):
+    """List of items shown through a pool of recycled row widgets
+
+    create_row(parent) builds an empty row widget; bind_row(row, item, index)
+    fills it with an item and is called again whenever the row is reused.
+    row_height is a height or a function of the item.
+    """
+
+    def __init__(self, parent, create_row: Callable[[Any], Any], bind_row: Callable[[Any, Any, int], None],
+                 row_height: Union[int, Callable[[Any], int]], row_gap: int = 0, row_padx: int = 0,
+                 scrollbar_button_color=None, scrollbar_button_hover_color=None, **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        kwargs.setdefault("corner_radius", 0)
+        super().__init__(parent, **kwargs)
+
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.row_gap = row_gap
+        self.row_padx = row_padx
+
+        self.items: List[Any] = []
+        self._tops: List[int] = [0]
+        self._offset = 0
+        self._rows: List[Any] = []
+        self._bound: List[Optional[int]] = []
+
+        scrollbar_kwargs = {}
+        if scrollbar_button_color is not None:
+            scrollbar_kwargs["button_color"] = scrollbar_button_color
+        if scrollbar_button_hover_color is not None:
+            scrollbar_kwargs["button_hover_color"] = scrollbar_button_hover_color
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar, **scrollbar_kwargs)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.viewport.bind("<Configure>", lambda event: self._layout())
+
+    @property
+    def total_height(self) -> int:
+        return self._tops[-1]
+
+    def _item_height(self, item) -> int:
+        return self.row_height(item) if callable(self.row_height) else self.row_height
+
+    def set_items(self, items: Sequence[Any], scroll_to_top: bool = False):
+        """Show items, rebinding the visible rows"""
+        self.items = list(items)
+        tops = [0]
+        for item in self.items:
+            tops.append(tops[-1] + self._item_height(item) + self.row_gap)
+        self._tops = tops
+
+        self._bound = [None] * len(self._rows)
+        if scroll_to_top:
+            self._offset = 0
+        self._layout()
+
+    def refresh(self):
+        """Rebind the visible rows after items changed in place (heights included)"""
+        self.set_items(self.items)
+
+    def scroll_to_top(self):
+        self._offset = 0
+        self._layout()
+
+    def scroll_by_wheel(self, steps: int):
+        """Scroll by mouse wheel steps, positive is down"""
+        self._scroll_to(self._offset + steps * WHEEL_STEP)
+
+    def _scroll_to(self, offset):
+        offset = int(offset)
+        if offset != self._offset:
+            self._offset = offset
+            self._layout()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(float(value) * self.total_height)
+        elif action == "scroll":
+            step = self.viewport.winfo_height() / self._get_widget_scaling() if unit == "pages" else SCROLL_UNIT
+            self._scroll_to(self._offset + int(float(value)) * step)
+
+    def _place_row(self, row, y: int, height: int):
+        # CTk widgets refuse width and height in place(); place the Tk widget
+        # directly, scaled like CTk scales its own geometry
+        scaling = self._get_widget_scaling()
+        tkinter.Place.place_configure(
+            row, x=round(self.row_padx * scaling), y=round(y * scaling), relwidth=1.0,
+            width=round(-2 * self.row_padx * scaling), height=round(height * scaling)
+        )
+
+    def _layout(self):
+        pixels = self.viewport.winfo_height()
+        if pixels <= 1:
+            # Not mapped yet; <Configure> lays it out once it is
+            return
+        height = pixels / self._get_widget_scaling()
+
+        total = self.total_height
+        self._offset = max(0, min(self._offset, int(total - height)))
+
+        first = max(0, bisect_right(self._tops, self._offset) - 1)
+        last = first
+        while last < len(self.items) and self._tops[last] < self._offset + height:
+            last += 1
+
+        # Grow the pool so every visible item has its own slot
+        while len(self._rows) < last - first:
+            self._rows.append(self.create_row(self.viewport))
+            self._bound = [None] * len(self._rows)
+
+        used = set()
+        pool_size = len(self._rows)
+        for index in range(first, last):
+            slot = index % pool_size
+            row = self._rows[slot]
+            if self._bound[slot] != index:
+                self.bind_row(row, self.items[index], index)
+                self._bound[slot] = index
+            self._place_row(
+                row, self._tops[index] - self._offset + self.row_gap // 2,
+                self._tops[index + 1] - self._tops[index] - self.row_gap
+            )
+            used.add(slot)
+
+        for slot, row in enumerate(self._rows):
+            if slot not in used:
+                row.place_forget()
+
+        if total <= height:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / total, (self._offset + height) / total)
@@ -0,0 +1,102 @@
+"""
+UI dispatcher - runs work posted from background threads on the Tk thread
+
+Tk widgets may only be touched from the thread running the main loop.
+Background jobs post callbacks with dispatcher.post(); the main loop drains
+the queue on an after() tick. Callbacks posted with post_latest() under a
+key replace the ones still waiting under that key, so a job reporting
+progress for every file costs at most one widget update per tick
+(about 30 per second).
+"""
+import queue
+import threading
+import traceback
+
+TICK_MS = 33
+IDLE_TICK_MS = 100
+
+class UIDispatcher:
+    """Queue of callbacks for the Tk thread"""
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._root = None
+        self._main_thread_id = None
+
+    def attach(self, root):
+        """Start draining the queue on root's main loop (call from the Tk thread)"""
+        self._root = root
+        self._main_thread_id = threading.get_ident()
+        root.after(TICK_MS, self._drain)
+
+    def on_main_thread(self):
+        return self._main_thread_id is None or threading.get_ident() == self._main_thread_id
+
+    def post(self, callback, *args, **kwargs):
+        """Run callback(*args, **kwargs) on the Tk thread, in posting order"""
+        self._queue.put((None, callback, args, kwargs))
+
+    def post_latest(self, key, callback, *args, **kwargs):
+        """Like post(), but only the most recent callback per key still waiting runs"""
+        with self._lock:
+            pending = key in self._latest
+            self._latest[key] = (callback, args, kwargs)
+        if not pending:
+            self._queue.put((key, None, None, None))
+
+    def call(self, callback, *args, **kwargs):
+        """Run callback now when on the Tk thread, otherwise post it"""
+        if self.on_main_thread():
+            callback(*args, **kwargs)
+        else:
+            self.post(callback, *args, **kwargs)
+
+    def _drain(self):
+        ran = 0
+        while True:
+            try:
+                key, callback, args, kwargs = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if key is not None:
+                with self._lock:
+                    callback, args, kwargs = self._latest.pop(key)
+
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                print(f"[ERROR] UI callback failed: {e}")
+                traceback.print_exc()
+            ran += 1
+
+        try:
+            self._root.after(TICK_MS if ran else IDLE_TICK_MS, self._drain)
+        except Exception:
+            # The window has been destroyed
+            pass
+
+dispatcher = UIDispatcher()
+
+def run_in_background(work, on_done=None, on_error=None):
+    """Run work() on a daemon thread and hand its outcome to the Tk thread
+
+    on_done(result) or on_error(exception) is called through the dispatcher.
+    Returns the started thread.
+    """
+    def runner():
+        try:
+            result = work()
+        except Exception as e:
+            traceback.print_exc()
+            if on_error:
+                dispatcher.post(on_error, e)
+            return
+        if on_done:
+            dispatcher.post(on_done, result)
+
+    thread = threading.Thread(target=runner, daemon=True)
+    thread.start()
+    return thread
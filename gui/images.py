@@ -0,0 +1,119 @@
+"""
+Image service - decodes and scales images off the Tk thread
+
+Opening and scaling an image can take long enough to freeze the window,
+so the GUI hands that work to a small thread pool (Pillow releases the
+GIL while decoding and resampling) and gets the ready image back on the
+Tk thread through the dispatcher. Requests are made under a key such as
+"hover_preview"; a newer request under the same key supersedes the older
+one, which is then cancelled if it has not started and dropped if it has,
+so moving quickly over many widgets only ever shows the last image.
+"""
+import os
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from gui.dispatch import dispatcher
+
+DEFAULT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+def load_image(path):
+    """Fully decoded PIL image of path"""
+    with Image.open(path) as img:
+        img.load()
+        return img
+
+def load_scaled(path, size):
+    """PIL image of path scaled down to fit size x size"""
+    img = load_image(path)
+    img.thumbnail((size, size), Image.Resampling.LANCZOS)
+    return img
+
+class ImageService:
+    """Thread pool for image work with per-key cancellation of stale requests"""
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._tickets = itertools.count(1)
+        self._current = {}
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ImageDecode")
+            return self._executor
+
+    def request(self, key, work, on_ready, on_error=None):
+        """Run work() on the pool and call on_ready(result) on the Tk thread
+
+        If work() raises, on_error(exception) is called instead. A later
+        request or cancel() under the same key makes this one stale: it is
+        not started if it is still queued, and neither callback runs.
+        key None requests are never stale. Returns the request's ticket.
+        """
+        ticket = next(self._tickets)
+
+        def run():
+            if not self.is_current(key, ticket):
+                return
+            try:
+                result = work()
+            except Exception as e:
+                if on_error:
+                    dispatcher.post(self._deliver, key, ticket, on_error, e)
+                else:
+                    print(f"[DEBUG] Image request {key} failed: {e}")
+                return
+            dispatcher.post(self._deliver, key, ticket, on_ready, result)
+
+        previous = None
+        if key is not None:
+            with self._lock:
+                previous = self._current.get(key)
+                self._current[key] = (ticket, None)
+        if previous is not None and previous[1] is not None:
+            previous[1].cancel()
+
+        future = self._pool().submit(run)
+        if key is not None:
+            with self._lock:
+                if self._current.get(key, (None,))[0] == ticket:
+                    self._current[key] = (ticket, future)
+        return ticket
+
+    def is_current(self, key, ticket):
+        if key is None:
+            return True
+        with self._lock:
+            current = self._current.get(key)
+        return current is not None and current[0] == ticket
+
+    def cancel(self, key):
+        """Make the request under key stale"""
+        with self._lock:
+            current = self._current.pop(key, None)
+        if current is not None and current[1] is not None:
+            current[1].cancel()
+
+    def _deliver(self, key, ticket, callback, value):
+        # A request superseded after its result was posted is dropped here
+        if not self.is_current(key, ticket):
+            return
+        if key is not None:
+            with self._lock:
+                self._current.pop(key, None)
+        callback(value)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._current.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+image_service = ImageService()
@@ -3,16 +3,18 @@ Main Window - Entry point for the BeamSkin Studio application
 """
 from typing import Dict, Optional
 import customtkinter as ctk
-from PIL import Image
 import os
 
 from gui.state import state
+from gui.dispatch import dispatcher
+from gui.images import image_service, load_image
 from gui.components.preview import HoverPreviewManager
 from gui.components.navigation import Sidebar, Topbar
 from gui.components.dialogs import show_update_dialog, show_wip_warning, show_notification
 from gui.tabs.settings import SettingsTab
 from gui.tabs.car_list import CarListTab
 from gui.tabs.generator import GeneratorTab
+from gui.tabs.build_queue import BuildQueueTab
 from gui.tabs.howto import HowToTab
 from gui.tabs.add_vehicles import AddVehiclesTab, load_added_vehicles_at_startup
 from gui.tabs.about import AboutTab
@@ -39,6 +41,8 @@ class BeamSkinStudioApp(ctk.CTk):
             except Exception as e:
                 print(f"[DEBUG] Failed to set icon: {e}")
 
+        dispatcher.attach(self)
+
         self.geometry("1600x1200")
         self.minsize(1000, 1000)
         self.configure(fg_color=state.colors["app_bg"])
@@ -97,78 +101,43 @@ class BeamSkinStudioApp(ctk.CTk):
     def _load_output_icons(self):
         """Load output icons for both themes"""
         icon_dir = os.path.join("gui", "Icons")
-        icon_size = (20, 20)
-
-        try:
-            steam_white_path = os.path.join(icon_dir, "Steam_logo_white.png")
-            steam_black_path = os.path.join(icon_dir, "Steam_logo_black.png")
-
-            if os.path.exists(steam_white_path):
-                self.steam_icon_white = ctk.CTkImage(
-                    light_image=Image.open(steam_white_path),
-                    dark_image=Image.open(steam_white_path),
-                    size=icon_size
-                )
-                print(f"[DEBUG] Loaded Steam white icon from: {steam_white_path}")
-
-            if os.path.exists(steam_black_path):
-                self.steam_icon_black = ctk.CTkImage(
-                    light_image=Image.open(steam_black_path),
-                    dark_image=Image.open(steam_black_path),
-                    size=icon_size
-                )
-                print(f"[DEBUG] Loaded Steam black icon from: {steam_black_path}")
-
-            folder_white_path = os.path.join(icon_dir, "Folder_logo_white.png")
-            folder_black_path = os.path.join(icon_dir, "Folder_logo_black.png")
-
-            if os.path.exists(folder_white_path):
-                self.folder_icon_white = ctk.CTkImage(
-                    light_image=Image.open(folder_white_path),
-                    dark_image=Image.open(folder_white_path),
-                    size=icon_size
-                )
-                print(f"[DEBUG] Loaded Folder white icon from: {folder_white_path}")
-
-            if os.path.exists(folder_black_path):
-                self.folder_icon_black = ctk.CTkImage(
-                    light_image=Image.open(folder_black_path),
-                    dark_image=Image.open(folder_black_path),
-                    size=icon_size
-                )
-                print(f"[DEBUG] Loaded Folder black icon from: {folder_black_path}")
-
-        except Exception as e:
-            print(f"[ERROR] Failed to load output icons: {e}")
+        self._load_theme_images("output icons", {
+            "steam_icon_white": os.path.join(icon_dir, "Steam_logo_white.png"),
+            "steam_icon_black": os.path.join(icon_dir, "Steam_logo_black.png"),
+            "folder_icon_white": os.path.join(icon_dir, "Folder_logo_white.png"),
+            "folder_icon_black": os.path.join(icon_dir, "Folder_logo_black.png")
+        }, (20, 20))
 
     def _load_logos(self):
         """Load logo images for both themes"""
         icon_dir = os.path.join("gui", "Icons")
+        self._load_theme_images("logos", {
+            "logo_white": os.path.join(icon_dir, "BeamSkin_Studio_White.png"),
+            "logo_black": os.path.join(icon_dir, "BeamSkin_Studio_Black.png")
+        }, (100, 100))
 
-        logo_size = (100, 100)
+    def _load_theme_images(self, label: str, paths: Dict[str, str], size):
+        """Decode images on the image service, then set them as CTkImage attributes
 
-        try:
-            logo_white_path = os.path.join(icon_dir, "BeamSkin_Studio_White.png")
-            logo_black_path = os.path.join(icon_dir, "BeamSkin_Studio_Black.png")
+        Args:
+            label: What the images are, for log messages
+            paths: Attribute name -> image path
+            size: Display size of the images
+        """
+        def work():
+            return {name: load_image(path) for name, path in paths.items() if os.path.exists(path)}
 
-            if os.path.exists(logo_white_path):
-                self.logo_white = ctk.CTkImage(
-                    light_image=Image.open(logo_white_path),
-                    dark_image=Image.open(logo_white_path),
-                    size=logo_size
-                )
-                print(f"[DEBUG] Loaded white logo from: {logo_white_path}")
+        def on_ready(images):
+            for name, img in images.items():
+                # One decoded image serves both appearance modes
+                setattr(self, name, ctk.CTkImage(light_image=img, dark_image=img, size=size))
+                print(f"[DEBUG] Loaded {name} from: {paths[name]}")
+            self._update_output_icons()
 
-            if os.path.exists(logo_black_path):
-                self.logo_black = ctk.CTkImage(
-                    light_image=Image.open(logo_black_path),
-                    dark_image=Image.open(logo_black_path),
-                    size=logo_size
-                )
-                print(f"[DEBUG] Loaded black logo from: {logo_black_path}")
+        def on_error(e):
+            print(f"[ERROR] Failed to load {label}: {e}")
 
-        except Exception as e:
-            print(f"[ERROR] Failed to load logos: {e}")
+        image_service.request(f"app_{label}", work, on_ready, on_error)
 
     def _update_output_icons(self):
         """Update icon labels and logo based on current theme"""
@@ -197,7 +166,8 @@ class BeamSkinStudioApp(ctk.CTk):
             self,
             on_view_change=self.switch_view,
             on_generate=self._generate_mod,
-            logo_image=current_logo
+            logo_image=current_logo,
+            on_plan=self._plan_mod
         )
         self.topbar.pack(fill="x", side="top")
 
@@ -230,6 +200,13 @@ class BeamSkinStudioApp(ctk.CTk):
             notification_callback=self.show_notification
         )
 
+        self.tabs["build_queue"] = BuildQueueTab(
+            self.main_container,
+            notification_callback=self.show_notification,
+            output_mode_var=self.sidebar.output_mode_var,
+            custom_output_var=self.sidebar.custom_output_var
+        )
+
         self.tabs["howto"] = HowToTab(self.main_container)
 
         self.tabs["carlist"] = CarListTab(self.main_container, self.preview_manager, self)
@@ -283,9 +260,9 @@ class BeamSkinStudioApp(ctk.CTk):
             self.sidebar.pack(fill="y", side="left")
 
         if view_name == "generator":
-            self.topbar.generate_button.pack(side="right", padx=25)
+            self.topbar.actions_frame.pack(side="right", padx=25)
         else:
-            self.topbar.generate_button.pack_forget()
+            self.topbar.actions_frame.pack_forget()
 
         if view_name in self.tabs:
 
@@ -314,6 +291,12 @@ class BeamSkinStudioApp(ctk.CTk):
         else:
             print("[DEBUG] ERROR: Generator tab not found or wrong type")
 
+    def _plan_mod(self):
+        """Plan the build - calls the generator tab's method"""
+        generator_tab = self.tabs.get("generator")
+        if generator_tab and isinstance(generator_tab, GeneratorTab):
+            generator_tab.plan_mod(self.sidebar.output_mode_var, self.sidebar.custom_output_var)
+
     def _add_vehicle_to_project_from_sidebar(self, carid: str, display_name: str):
         """Add a vehicle to the project from sidebar
 
@@ -331,12 +314,7 @@ class BeamSkinStudioApp(ctk.CTk):
 
             generator_tab.add_car_to_project(carid, display_name)
 
-            for btn_frame, car_id, _, add_btn_frame in state.sidebar_vehicle_buttons:
-                if car_id == carid:
-                    add_btn_frame.pack_forget()
-                    break
-
-            self.sidebar.expanded_vehicle_carid = None
+            self.sidebar.collapse_expanded_vehicle()
 
             print(f"[DEBUG] Successfully added {display_name} to generator tab")
         else:
@@ -345,6 +323,7 @@ class BeamSkinStudioApp(ctk.CTk):
     def _on_closing(self):
         """Handle window closing"""
         print("[DEBUG] \nShutting down BeamSkin Studio...")
+        image_service.shutdown()
         self.destroy()
 
     def show_startup_warning(self):
@@ -55,8 +55,9 @@ class StateManager:
         self.selected_display_name: Optional[str] = None
         self.expanded_vehicle_carid: Optional[str] = None
 
-        self.sidebar_vehicle_buttons: List[Tuple[ctk.CTkFrame, str, str, ctk.CTkFrame]] = []
-        self.carlist_items: List[Tuple[ctk.CTkFrame, str, str]] = []
+        # (carid, display name) and (carid, name, developer added), sorted by name
+        self.sidebar_vehicles: List[Tuple[str, str]] = []
+        self.carlist_vehicles: List[Tuple[str, str, bool]] = []
         self.car_id_list: List[Tuple[str, str]] = []
 
         self.car_card_frames: List[ctk.CTkFrame] = []
@@ -3,8 +3,6 @@ About Tab
 """
 import customtkinter as ctk
 import webbrowser
-import threading
-import time
 import os
 from PIL import Image
 from gui.state import state
@@ -161,30 +159,33 @@ class AboutTab(ctk.CTkFrame):
 
         if self.socials_frame.winfo_ismapped():
 
-            def collapse():
-                print(f"[DEBUG] collapse called")
-                self.socials_frame.pack_propagate(False)
-                for i in range(self.socials_frame.winfo_height(), -1, -5):
-                    self.socials_frame.configure(height=max(0, i))
-                    time.sleep(0.01)
-                self.socials_frame.pack_forget()
+            # Animated with after() so the widgets are only touched from the Tk thread
+            def collapse(height):
+                if height > 0:
+                    self.socials_frame.configure(height=height)
+                    self.after(10, collapse, height - 5)
+                else:
+                    self.socials_frame.configure(height=0)
+                    self.socials_frame.pack_forget()
 
-            threading.Thread(target=collapse, daemon=True).start()
+            print(f"[DEBUG] collapse called")
+            self.socials_frame.pack_propagate(False)
+            collapse(self.socials_frame.winfo_height())
         else:
 
             self.socials_frame.configure(height=0)
             self.socials_frame.pack(fill="x", pady=(2, 10))
             self.socials_frame.pack_propagate(False)
 
-            def expand():
-
-                print(f"[DEBUG] expand called")
-                for i in range(0, target_height + 2, 5):
-                    self.socials_frame.configure(height=i)
-                    time.sleep(0.01)
-                self.socials_frame.pack_propagate(True)
+            def expand(height):
+                if height <= target_height + 1:
+                    self.socials_frame.configure(height=height)
+                    self.after(10, expand, height + 5)
+                else:
+                    self.socials_frame.pack_propagate(True)
 
-            threading.Thread(target=expand, daemon=True).start()
+            print(f"[DEBUG] expand called")
+            expand(0)
 
     def _open_linktree(self):
         """Open Linktree URL and collapse socials"""
@@ -275,19 +275,6 @@ class AddVehiclesTab(ctk.CTkFrame):
             if hasattr(main_window, 'sidebar'):
                 print(f"[DEBUG] Sidebar found, refreshing...")
                 try:
-
-                    if hasattr(state, 'sidebar_vehicle_buttons'):
-                        print(f"[DEBUG] Clearing {len(state.sidebar_vehicle_buttons)} existing sidebar buttons...")
-
-                        for btn_frame, car_id, car_name, add_btn_frame in state.sidebar_vehicle_buttons:
-                            try:
-                                btn_frame.destroy()
-                            except:
-                                pass
-
-                        state.sidebar_vehicle_buttons.clear()
-                        print(f"[DEBUG] Sidebar state cleared")
-
                     if hasattr(main_window.sidebar, 'populate_vehicles'):
                         print(f"[DEBUG] Calling sidebar.populate_vehicles()...")
 
@@ -0,0 +1,454 @@
+"""
+Build Queue Tab - Generate many project files back to back
+"""
+import customtkinter as ctk
+from tkinter import filedialog
+from typing import Callable, Dict, Optional
+import os
+
+from gui.state import state
+from gui.dispatch import dispatcher
+from core.build import InvalidProjectError
+from core.build_queue import BuildQueue, QUEUED, RUNNING, DONE, FAILED, CANCELLED, DEFAULT_MAX_WORKERS
+from core.settings import (
+    get_mods_folder_path, get_build_jobs, get_streaming_build, get_reproducible_build,
+    get_compression_preset, get_build_cache_enabled, get_build_cache_size_mb
+)
+
+OUTPUT_LABELS = {
+    "steam": "Mods folder",
+    "unpacked": "Unpacked (test)",
+    "custom": "Custom folder..."
+}
+
+STATUS_LABELS = {
+    QUEUED: "Queued",
+    RUNNING: "Building...",
+    DONE: "✓ Done",
+    FAILED: "✗ Failed",
+    CANCELLED: "Cancelled"
+}
+
+print(f"[DEBUG] Loading class: BuildQueueTab")
+
+class BuildQueueTab(ctk.CTkFrame):
+    """Queue of project files built by a small pool of worker processes"""
+
+    def __init__(self, parent: ctk.CTk, notification_callback: Callable[[str, str, int], None] = None,
+                 output_mode_var: ctk.StringVar = None, custom_output_var: ctk.StringVar = None):
+
+        print(f"[DEBUG] __init__ called")
+        super().__init__(parent, fg_color=state.colors["app_bg"])
+
+        self.show_notification = notification_callback or self._fallback_notification
+
+        # New jobs default to the output selected in the sidebar
+        self.output_mode_var = output_mode_var
+        self.custom_output_var = custom_output_var
+
+        self.queue = BuildQueue(on_update=self._on_job_update, on_finished=self._on_queue_finished)
+        self.job_rows: Dict[int, dict] = {}
+
+        self.parallel_var = ctk.StringVar(value=str(DEFAULT_MAX_WORKERS))
+        self.overwrite_var = ctk.BooleanVar(value=True)
+
+        self.jobs_frame: Optional[ctk.CTkScrollableFrame] = None
+        self.empty_label: Optional[ctk.CTkLabel] = None
+        self.summary_label: Optional[ctk.CTkLabel] = None
+        self.start_button: Optional[ctk.CTkButton] = None
+
+        self._setup_ui()
+
+    def _fallback_notification(self, message: str, type: str = "info", duration: int = 3000):
+        print(f"[{type.upper()}] {message}")
+
+    def _setup_ui(self):
+        header = ctk.CTkFrame(self, fg_color=state.colors["card_bg"], corner_radius=12)
+        header.pack(fill="x", padx=20, pady=(20, 10))
+
+        ctk.CTkLabel(
+            header,
+            text="📦 Build Queue",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=state.colors["text"],
+            anchor="w"
+        ).pack(fill="x", padx=20, pady=(20, 5))
+
+        ctk.CTkLabel(
+            header,
+            text="Add project files and build them one after another with the current build settings",
+            font=ctk.CTkFont(size=12),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        ).pack(fill="x", padx=20, pady=(0, 15))
+
+        controls = ctk.CTkFrame(header, fg_color="transparent")
+        controls.pack(fill="x", padx=20, pady=(0, 20))
+
+        self._create_button(controls, "➕ Add Projects", self.add_projects).pack(side="left", padx=(0, 8))
+        self.start_button = self._create_button(controls, "▶ Start Queue", self.start_queue)
+        self.start_button.pack(side="left", padx=(0, 8))
+        self._create_button(controls, "✖ Cancel All", self.cancel_all, style="danger").pack(side="left", padx=(0, 8))
+        self._create_button(controls, "🧹 Clear Finished", self.clear_finished, style="secondary").pack(side="left")
+
+        ctk.CTkCheckBox(
+            controls,
+            text="Replace existing mods",
+            variable=self.overwrite_var,
+            font=ctk.CTkFont(size=12),
+            text_color=state.colors["text"],
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"]
+        ).pack(side="right", padx=(15, 0))
+
+        ctk.CTkOptionMenu(
+            controls,
+            variable=self.parallel_var,
+            values=[str(n) for n in range(1, max(2, min(8, os.cpu_count() or 1)) + 1)],
+            width=70,
+            height=32,
+            fg_color=state.colors["frame_bg"],
+            button_color=state.colors["accent"],
+            button_hover_color=state.colors["accent_hover"],
+            text_color=state.colors["text"],
+            dropdown_fg_color=state.colors["card_bg"],
+            dropdown_hover_color=state.colors["card_hover"],
+            dropdown_text_color=state.colors["text"]
+        ).pack(side="right")
+
+        ctk.CTkLabel(
+            controls,
+            text="Parallel builds",
+            font=ctk.CTkFont(size=12),
+            text_color=state.colors["text_secondary"]
+        ).pack(side="right", padx=(0, 8))
+
+        self.summary_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        )
+        self.summary_label.pack(fill="x", padx=25, pady=(0, 5))
+
+        self.jobs_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        self.jobs_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        self.empty_label = ctk.CTkLabel(
+            self.jobs_frame,
+            text="No projects queued. Click 'Add Projects' to pick .bsproject files.",
+            font=ctk.CTkFont(size=13),
+            text_color=state.colors["text_secondary"]
+        )
+        self.empty_label.pack(pady=40)
+
+    def _create_button(self, parent, text: str, command, style: str = "primary", width: int = 130) -> ctk.CTkButton:
+        if style == "primary":
+            fg_color, hover_color, text_color = state.colors["accent"], state.colors["accent_hover"], state.colors["accent_text"]
+        elif style == "danger":
+            fg_color, hover_color, text_color = state.colors["error"], state.colors["error_hover"], "white"
+        else:
+            fg_color, hover_color, text_color = state.colors["frame_bg"], state.colors["card_hover"], state.colors["text"]
+
+        return ctk.CTkButton(
+            parent,
+            text=text,
+            command=command,
+            width=width,
+            height=32,
+            fg_color=fg_color,
+            hover_color=hover_color,
+            text_color=text_color,
+            corner_radius=8,
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+
+    def add_projects(self):
+        """Pick .bsproject files and queue them"""
+        paths = filedialog.askopenfilenames(
+            title="Add Projects to Queue",
+            filetypes=[("BeamSkin Project", "*.bsproject"), ("All files", "*.*")]
+        )
+        if not paths:
+            return
+
+        output_mode = self.output_mode_var.get() if self.output_mode_var else "steam"
+        output_dir = self.custom_output_var.get() if self.custom_output_var else None
+
+        added = 0
+        for path in paths:
+            try:
+                job = self.queue.add(path, output_mode, output_dir or None)
+            except InvalidProjectError as e:
+                print(f"[ERROR] Could not queue project: {e}")
+                self.show_notification(f"Skipped {os.path.basename(path)}: not a valid project", "error", 4000)
+                continue
+            self._create_job_row(job)
+            added += 1
+
+        if added:
+            print(f"[DEBUG] Queued {added} project(s)")
+        self._update_summary()
+
+    def start_queue(self):
+        """Build every queued project with the current build settings"""
+        if self.queue.is_running:
+            self.show_notification("The queue is already running", "info", 2000)
+            return
+
+        queued = [job for job in self.queue.jobs if job.status == QUEUED]
+        if not queued:
+            self.show_notification("Nothing queued to build", "info", 2000)
+            return
+
+        mods_path = get_mods_folder_path()
+        if any(job.output_mode != "custom" for job in queued) and not (mods_path and os.path.isdir(mods_path)):
+            self.show_notification("Mods folder not configured. Please set it in Settings.", "error", 4000)
+            return
+
+        for job in queued:
+            if job.output_mode == "custom" and not job.output_dir:
+                self.show_notification(f"Pick an output folder for '{job.mod_name}'", "error", 4000)
+                return
+
+        parallel = max(1, int(self.parallel_var.get()))
+        self.queue.max_workers = parallel
+
+        build_options = {
+            # Split the skin workers between the builds running at the same time
+            "jobs": max(1, get_build_jobs() // parallel),
+            "streaming": get_streaming_build(),
+            "compression_preset": get_compression_preset(),
+            "cache_size_mb": get_build_cache_size_mb() if get_build_cache_enabled() else None,
+            "overwrite": self.overwrite_var.get(),
+            "reproducible": get_reproducible_build()
+        }
+        self.queue.start(mods_path, build_options)
+        self.start_button.configure(state="disabled")
+        self._update_summary()
+
+    def cancel_all(self):
+        self.queue.cancel_all()
+
+    def clear_finished(self):
+        for job in list(self.queue.jobs):
+            if job.finished:
+                self._remove_job_row(job)
+        self.queue.clear_finished()
+        self._update_summary()
+
+    def _create_job_row(self, job):
+        self.empty_label.pack_forget()
+
+        row = ctk.CTkFrame(
+            self.jobs_frame,
+            fg_color=state.colors["card_bg"],
+            corner_radius=10,
+            border_width=1,
+            border_color=state.colors["border"]
+        )
+        row.pack(fill="x", pady=4)
+
+        top = ctk.CTkFrame(row, fg_color="transparent")
+        top.pack(fill="x", padx=15, pady=(10, 4))
+
+        name_label = ctk.CTkLabel(
+            top,
+            text=f"{job.mod_name}  ({job.skin_count} skins)",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=state.colors["text"],
+            anchor="w"
+        )
+        name_label.pack(side="left")
+
+        remove_button = self._create_button(top, "Remove", lambda: self._on_remove_or_cancel(job), "secondary", 90)
+        remove_button.pack(side="right", padx=(6, 0))
+
+        log_button = self._create_button(top, "Log", lambda: self._show_job_log(job), "secondary", 70)
+        log_button.pack(side="right", padx=(6, 0))
+
+        output_var = ctk.StringVar(value=OUTPUT_LABELS.get(job.output_mode, OUTPUT_LABELS["steam"]))
+        output_menu = ctk.CTkOptionMenu(
+            top,
+            variable=output_var,
+            values=list(OUTPUT_LABELS.values()),
+            command=lambda label: self._on_output_changed(job, label),
+            width=150,
+            height=28,
+            fg_color=state.colors["frame_bg"],
+            button_color=state.colors["accent"],
+            button_hover_color=state.colors["accent_hover"],
+            text_color=state.colors["text"],
+            dropdown_fg_color=state.colors["card_bg"],
+            dropdown_hover_color=state.colors["card_hover"],
+            dropdown_text_color=state.colors["text"]
+        )
+        output_menu.pack(side="right", padx=(6, 0))
+
+        path_label = ctk.CTkLabel(
+            row,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        )
+        path_label.pack(fill="x", padx=15)
+
+        bottom = ctk.CTkFrame(row, fg_color="transparent")
+        bottom.pack(fill="x", padx=15, pady=(4, 10))
+
+        status_label = ctk.CTkLabel(
+            bottom,
+            text="",
+            width=110,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            text_color=state.colors["text_secondary"],
+            anchor="w"
+        )
+        status_label.pack(side="left")
+
+        progress_bar = ctk.CTkProgressBar(
+            bottom,
+            height=8,
+            corner_radius=4,
+            fg_color=state.colors["frame_bg"],
+            progress_color=state.colors["accent"]
+        )
+        progress_bar.pack(side="left", fill="x", expand=True, padx=(10, 0))
+
+        self.job_rows[job.id] = {
+            "frame": row,
+            "name_label": name_label,
+            "path_label": path_label,
+            "status_label": status_label,
+            "progress_bar": progress_bar,
+            "output_var": output_var,
+            "output_menu": output_menu,
+            "remove_button": remove_button
+        }
+        self._refresh_job_row(job)
+
+    def _remove_job_row(self, job):
+        widgets = self.job_rows.pop(job.id, None)
+        if widgets:
+            widgets["frame"].destroy()
+        if not self.job_rows:
+            self.empty_label.pack(pady=40)
+
+    def _refresh_job_row(self, job):
+        widgets = self.job_rows.get(job.id)
+        if not widgets:
+            return
+
+        target = job.output_dir if job.output_mode == "custom" else OUTPUT_LABELS.get(job.output_mode)
+        widgets["name_label"].configure(text=f"{job.mod_name}  ({job.skin_count} skins)")
+        widgets["path_label"].configure(text=f"{job.project_path}  →  {target or 'no folder selected'}")
+
+        status_text = STATUS_LABELS.get(job.status, job.status)
+        if job.status == RUNNING:
+            status_text = f"{job.progress * 100:.0f}%"
+        elif job.status == DONE and job.report is not None:
+            status_text = f"✓ {job.report.wall_time:.1f}s"
+
+        status_colors = {
+            DONE: state.colors["success"],
+            FAILED: state.colors["error"],
+            CANCELLED: state.colors["warning"]
+        }
+        widgets["status_label"].configure(
+            text=status_text,
+            text_color=status_colors.get(job.status, state.colors["text_secondary"])
+        )
+        widgets["progress_bar"].set(job.progress)
+        widgets["output_menu"].configure(state="normal" if job.status == QUEUED else "disabled")
+        widgets["remove_button"].configure(text="Cancel" if job.status in (QUEUED, RUNNING) and self.queue.is_running else "Remove")
+
+    def _on_output_changed(self, job, label):
+        output_mode = next(mode for mode, mode_label in OUTPUT_LABELS.items() if mode_label == label)
+        if output_mode == "custom":
+            folder = filedialog.askdirectory(title=f"Output folder for {job.mod_name}")
+            if not folder:
+                self.job_rows[job.id]["output_var"].set(OUTPUT_LABELS[job.output_mode])
+                return
+            job.output_dir = folder
+        job.output_mode = output_mode
+        self._refresh_job_row(job)
+
+    def _on_remove_or_cancel(self, job):
+        if self.queue.is_running and not job.finished:
+            self.queue.cancel(job)
+            return
+
+        if self.queue.remove(job):
+            self._remove_job_row(job)
+            self._update_summary()
+
+    def _on_job_update(self, job):
+        # Called from the queue threads; coalesced to one row update per tick
+        dispatcher.post_latest(("build_queue", job.id), self._refresh_job_row, job)
+        if job.finished:
+            dispatcher.post(self._on_job_finished, job)
+
+    def _on_job_finished(self, job):
+        if job.status == FAILED:
+            self.show_notification(f"✗ '{job.mod_name}' failed: {job.error}", "error", 5000)
+        self._update_summary()
+
+    def _on_queue_finished(self):
+        dispatcher.post(self._show_queue_finished)
+
+    def _show_queue_finished(self):
+        self.start_button.configure(state="normal")
+        for job in self.queue.jobs:
+            self._refresh_job_row(job)
+        self._update_summary()
+
+        done = sum(1 for job in self.queue.jobs if job.status == DONE)
+        failed = sum(1 for job in self.queue.jobs if job.status == FAILED)
+        if done or failed:
+            self.show_notification(
+                f"Build queue finished: {done} built, {failed} failed",
+                "warning" if failed else "success",
+                5000
+            )
+
+    def _update_summary(self):
+        counts = {}
+        for job in self.queue.jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+
+        if not counts:
+            self.summary_label.configure(text="")
+            return
+
+        parts = [f"{counts[status]} {status}" for status in STATUS_LABELS if status in counts]
+        self.summary_label.configure(text=f"{len(self.queue.jobs)} project(s): " + ", ".join(parts))
+
+    def _show_job_log(self, job):
+        """Open a window with the job's log and build report summary"""
+        window = ctk.CTkToplevel(self.winfo_toplevel())
+        window.title(f"Build log - {job.mod_name}")
+        window.geometry("800x500")
+        window.configure(fg_color=state.colors["app_bg"])
+
+        textbox = ctk.CTkTextbox(
+            window,
+            font=ctk.CTkFont(family="Courier", size=11),
+            fg_color=state.colors["card_bg"],
+            text_color=state.colors["text"],
+            wrap="none"
+        )
+        textbox.pack(fill="both", expand=True, padx=10, pady=10)
+
+        lines = job.log_lines()
+        if job.report is not None:
+            lines += ["", job.report.summary()]
+            if job.report.report_path:
+                lines.append(f"Report: {job.report.report_path}")
+        if job.result_path:
+            lines.append(f"Output: {job.result_path}")
+
+        textbox.insert("1.0", "\n".join(lines) or "No output yet")
+        textbox.configure(state="disabled")
+        textbox.see("end")
@@ -4,12 +4,15 @@ Car List Tab
 from typing import List, Tuple
 import os
 import zipfile
+import shutil
 import re
 from tkinter import filedialog
 import customtkinter as ctk
 from gui.state import state
 from gui.components.preview import HoverPreviewManager
+from gui.components.virtual_list import VirtualList
 from gui.components.dialogs import show_notification
+from gui.dispatch import run_in_background
 
 try:
     from utils.file_ops import load_added_vehicles_json
@@ -18,6 +21,15 @@ except ImportError:
     def load_added_vehicles_json():
         return {}
 
+# Height of a vehicle card in the list, without the gap between cards
+CARD_HEIGHT = 86
+
+def _extract_zip_member(zip_path, member, destination):
+    """Copy one file out of a game ZIP without loading it into memory at once"""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zip_ref.open(member) as source, open(destination, 'wb') as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
 class CarListTab(ctk.CTkFrame):
     """Car list tab with search and UV map extraction"""
 
@@ -27,7 +39,7 @@ class CarListTab(ctk.CTkFrame):
         self.app = app
 
         self.carlist_search_var = ctk.StringVar()
-        self.carlist_scroll: ctk.CTkScrollableFrame = None
+        self.carlist_list: VirtualList = None
 
         self._setup_ui()
         self._populate_car_list()
@@ -45,8 +57,17 @@ class CarListTab(ctk.CTkFrame):
         )
         carlist_search_entry.pack(fill="x", padx=10, pady=(10, 5))
 
-        self.carlist_scroll = ctk.CTkScrollableFrame(self, fg_color=state.colors["frame_bg"])
-        self.carlist_scroll.pack(fill="both", expand=True, padx=10, pady=10)
+        self.carlist_list = VirtualList(
+            self,
+            create_row=self._create_carlist_card,
+            bind_row=self._bind_carlist_card,
+            row_height=CARD_HEIGHT,
+            row_gap=16,
+            row_padx=8,
+            fg_color=state.colors["frame_bg"],
+            corner_radius=6
+        )
+        self.carlist_list.pack(fill="both", expand=True, padx=10, pady=10)
 
         self.carlist_search_var.trace_add("write", self._update_carlist)
 
@@ -74,43 +95,30 @@ class CarListTab(ctk.CTkFrame):
             ("wigeon", "Ibishu Wigeon"), ("wl40", "Hirochi WL-40")
         ]
 
-        for carid, name in car_id_list:
-            self._add_carlist_card(carid, name, developer_added=False)
+        vehicles = [(carid, name, False) for carid, name in car_id_list]
+        vehicles += [(carid, carname, True) for carid, carname in state.added_vehicles.items()]
+        state.carlist_vehicles = sorted(vehicles, key=lambda vehicle: vehicle[1].lower())
 
-        for carid, carname in state.added_vehicles.items():
-            self._add_carlist_card(carid, carname, developer_added=True)
+        self._update_carlist()
 
     def refresh_vehicle_list(self):
         """Refresh the vehicle list when new vehicles are added"""
         print(f"[DEBUG] CarListTab: refresh_vehicle_list called")
 
-        for card_frame, carid, name in state.carlist_items:
-            card_frame.destroy()
-
-        state.carlist_items.clear()
-
         self._populate_car_list()
 
-        self._update_carlist()
-
-        print(f"[DEBUG] CarListTab: Vehicle list refreshed with {len(state.carlist_items)} vehicles")
-
-    def _add_carlist_card(self, carid: str, name: str, developer_added: bool = False):
-        """Add a vehicle card to the car list"""
-
-        insert_position = len(state.carlist_items)
-        for i, (card, cid, cname) in enumerate(state.carlist_items):
-            if cname.lower() > name.lower():
-                insert_position = i
-                break
+        print(f"[DEBUG] CarListTab: Vehicle list refreshed with {len(state.carlist_vehicles)} vehicles")
 
+    def _create_carlist_card(self, parent) -> ctk.CTkFrame:
+        """Build an empty vehicle card for the virtual list"""
         card_frame = ctk.CTkFrame(
-            self.carlist_scroll,
+            parent,
             corner_radius=14,
             fg_color=state.colors["card_bg"],
             border_width=1,
             border_color=state.colors["border"]
         )
+        card_frame.carid = None
 
         inner_frame = ctk.CTkFrame(
             card_frame,
@@ -132,42 +140,42 @@ class CarListTab(ctk.CTkFrame):
         text_stack = ctk.CTkFrame(text_container, fg_color="transparent")
         text_stack.pack(side="left", fill="x", expand=True)
 
-        ctk.CTkLabel(
+        card_frame.name_label = ctk.CTkLabel(
             text_stack,
-            text=name,
+            text="",
             anchor="w",
             font=ctk.CTkFont(size=14, weight="bold"),
             text_color=state.colors["text"]
-        ).pack(anchor="w")
+        )
+        card_frame.name_label.pack(anchor="w")
 
-        ctk.CTkLabel(
+        card_frame.carid_label = ctk.CTkLabel(
             text_stack,
-            text=carid,
+            text="",
             anchor="w",
             font=ctk.CTkFont(size=13, weight="bold"),
             text_color=state.colors["text_secondary"]
-        ).pack(anchor="w")
+        )
+        card_frame.carid_label.pack(anchor="w")
 
         btn_container = ctk.CTkFrame(inner_frame, fg_color="transparent")
         btn_container.pack(side="right", padx=8, pady=8)
 
-        if not developer_added:
-            uv_btn = ctk.CTkButton(
-                btn_container,
-                text="🖼 UV Map",
-                width=110,
-                height=36,
-                fg_color=state.colors["success"],
-                hover_color=state.colors["accent_hover"],
-                text_color=state.colors["accent_text"],
-                corner_radius=10,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                command=lambda c=carid: self._get_uv_map(c)
-            )
-            uv_btn.pack(side="left", padx=4)
-            uv_btn.bind("<Enter>", lambda e: self.preview_manager.hide_hover_preview(force=True), add=True)
-
-        copy_btn = ctk.CTkButton(
+        # Only shown for built-in vehicles
+        card_frame.uv_btn = ctk.CTkButton(
+            btn_container,
+            text="🖼 UV Map",
+            width=110,
+            height=36,
+            fg_color=state.colors["success"],
+            hover_color=state.colors["accent_hover"],
+            text_color=state.colors["accent_text"],
+            corner_radius=10,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            command=lambda: self._get_uv_map(card_frame.carid)
+        )
+
+        card_frame.copy_btn = ctk.CTkButton(
             btn_container,
             text="📋 Copy ID",
             width=100,
@@ -179,32 +187,35 @@ class CarListTab(ctk.CTkFrame):
             font=ctk.CTkFont(size=12),
             border_width=1,
             border_color=state.colors["border"],
-            command=lambda c=carid: self._copy_carid(c)
+            command=lambda: self._copy_carid(card_frame.carid)
         )
-        copy_btn.pack(side="left", padx=4)
-        copy_btn.bind("<Enter>", lambda e: self.preview_manager.hide_hover_preview(force=True), add=True)
+        card_frame.copy_btn.pack(side="left", padx=4)
 
-        self.preview_manager.setup_robust_hover(card_frame, carid)
+        card_frame.uv_btn.bind("<Enter>", lambda e: self.preview_manager.hide_hover_preview(force=True), add=True)
+        card_frame.copy_btn.bind("<Enter>", lambda e: self.preview_manager.hide_hover_preview(force=True), add=True)
 
-        state.carlist_items.insert(insert_position, (card_frame, carid, name))
+        self.preview_manager.setup_row_hover(card_frame, lambda: card_frame.carid)
+        return card_frame
 
-        for widget in self.carlist_scroll.winfo_children():
-            widget.pack_forget()
+    def _bind_carlist_card(self, card_frame: ctk.CTkFrame, vehicle, index: int):
+        """Show a vehicle in a recycled card"""
+        carid, name, developer_added = vehicle
+        card_frame.carid = carid
+        card_frame.name_label.configure(text=name)
+        card_frame.carid_label.configure(text=carid)
 
-        for card, cid, cname in state.carlist_items:
-            card.pack(fill="x", pady=8, padx=8)
+        if developer_added:
+            card_frame.uv_btn.pack_forget()
+        else:
+            card_frame.uv_btn.pack(side="left", padx=4, before=card_frame.copy_btn)
 
     def _update_carlist(self, *args):
         """Filter car list based on search query"""
         query = self.carlist_search_var.get().lower()
-        for row_frame, carid, name in state.carlist_items:
-            row_frame.pack_forget()
-            if query in carid.lower() or query in name.lower():
-                row_frame.pack(fill="x", pady=8, padx=8)
-        try:
-            self.carlist_scroll._parent_canvas.yview_moveto(0)
-        except:
-            pass
+        self.carlist_list.set_items(
+            [vehicle for vehicle in state.carlist_vehicles if query in vehicle[0].lower() or query in vehicle[1].lower()],
+            scroll_to_top=True
+        )
 
     def _copy_carid(self, carid: str):
         """Copy car ID to clipboard"""
@@ -451,37 +462,40 @@ class CarListTab(ctk.CTkFrame):
                     )
 
                     if destination:
-                        with zipfile.ZipFile(source_zip, 'r') as source_zip_ref:
-                            with source_zip_ref.open(file_path) as source:
-                                with open(destination, 'wb') as target:
-                                    target.write(source.read())
+                        def extract_one():
+                            _extract_zip_member(source_zip, file_path, destination)
+
+                        def on_extracted(_):
+                            show_notification(self.app, f"✅ UV map copied successfully!", "success", 3000)
+                            print(f"[DEBUG] UV Map extracted from {source_zip} to {destination}")
 
-                        show_notification(self.app, f"✅ UV map copied successfully!", "success", 3000)
-                        print(f"[DEBUG] UV Map extracted from {source_zip} to {destination}")
+                        run_in_background(extract_one, on_extracted, self._on_uv_extract_failed)
                 else:
                     destination_folder = filedialog.askdirectory(
                         title="Select Folder to Save UV Maps"
                     )
 
                     if destination_folder:
-                        success_count = 0
-                        for file_info in selected_files:
-                            file_path, source_zip = file_info
-                            filename = os.path.basename(file_path)
-                            destination = os.path.join(destination_folder, filename)
-
-                            try:
-                                with zipfile.ZipFile(source_zip, 'r') as source_zip_ref:
-                                    with source_zip_ref.open(file_path) as source:
-                                        with open(destination, 'wb') as target:
-                                            target.write(source.read())
-                                success_count += 1
-                                print(f"[DEBUG] UV Map extracted: {filename} from {os.path.basename(source_zip)} to {destination}")
-                            except Exception as e:
-                                print(f"[DEBUG] Failed to extract {filename}: {e}")
-
-                        show_notification(self.app, f"✅ {success_count} UV map(s) copied successfully!", "success", 3000)
-                        print(f"[DEBUG] {success_count}/{len(selected_files)} UV maps extracted to {destination_folder}")
+                        def extract_all():
+                            success_count = 0
+                            for file_info in selected_files:
+                                file_path, source_zip = file_info
+                                filename = os.path.basename(file_path)
+                                destination = os.path.join(destination_folder, filename)
+
+                                try:
+                                    _extract_zip_member(source_zip, file_path, destination)
+                                    success_count += 1
+                                    print(f"[DEBUG] UV Map extracted: {filename} from {os.path.basename(source_zip)} to {destination}")
+                                except Exception as e:
+                                    print(f"[DEBUG] Failed to extract {filename}: {e}")
+                            return success_count
+
+                        def on_all_extracted(success_count):
+                            show_notification(self.app, f"✅ {success_count} UV map(s) copied successfully!", "success", 3000)
+                            print(f"[DEBUG] {success_count}/{len(selected_files)} UV maps extracted to {destination_folder}")
+
+                        run_in_background(extract_all, on_all_extracted, self._on_uv_extract_failed)
 
         except zipfile.BadZipFile:
             show_notification(self.app, f"❌ Invalid ZIP file: {carid}.zip", "error", 4000)
@@ -490,4 +504,8 @@ class CarListTab(ctk.CTkFrame):
             show_notification(self.app, f"❌ Failed to extract UV map: {str(e)}", "error", 4000)
             print(f"[DEBUG] Error extracting UV map: {e}")
             import traceback
-            traceback.print_exc()
\ No newline at end of file
+            traceback.print_exc()
+
+    def _on_uv_extract_failed(self, error):
+        show_notification(self.app, f"❌ Failed to extract UV map: {str(error)}", "error", 4000)
+        print(f"[DEBUG] Error extracting UV map: {error}")
@@ -4,12 +4,20 @@ Generator Tab
 from typing import Dict, List, Optional, Any, Callable
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from PIL import Image
 import threading
+import copy
 import json
 import os
 
 from gui.state import state
+from core import jbeam
+from core.compression import PRESETS
+from core.settings import get_compression_preset, set_compression_preset
+from core.cancel import CancelToken, BuildCancelled
+from core.build_worker import build_worker
+from core.thumbnails import get_thumbnail_cache, PREVIEW_SIZE
+from gui.dispatch import dispatcher, run_in_background
+from gui.images import image_service
 
 try:
     from utils.file_ops import load_added_vehicles_json
@@ -26,6 +34,8 @@ except ImportError:
         print(f"[DEBUG] generate_multi_skin_mod called")
         messagebox.showerror("Error", "generate_multi_skin_mod function not available")
 
+DDS_PREVIEW_REQUEST_KEY = "dds_preview"
+
 print(f"[DEBUG] Loading class: GeneratorTab")
 
 class GeneratorTab(ctk.CTkFrame):
@@ -47,7 +57,10 @@ class GeneratorTab(ctk.CTkFrame):
         self.current_car_label: Optional[ctk.CTkLabel] = None
         self.dds_preview_label: Optional[ctk.CTkLabel] = None
         self.progress_bar: Optional[ctk.CTkProgressBar] = None
+        self.cancel_build_btn: Optional[ctk.CTkButton] = None
+        self.build_cancel_token: Optional[CancelToken] = None
         self.export_status_label: Optional[ctk.CTkLabel] = None
+        self.build_summary_label: Optional[ctk.CTkLabel] = None
         self.skin_name_entry: Optional[ctk.CTkEntry] = None
         self.jpg_file_entry: Optional[ctk.CTkEntry] = None
         self.config_name_entry: Optional[ctk.CTkEntry] = None
@@ -63,6 +76,10 @@ class GeneratorTab(ctk.CTkFrame):
         self.jpg_file_path_var = ctk.StringVar()
 
         self.add_material_properties_var = ctk.BooleanVar(value=False)
+        self.watch_mode_var = ctk.BooleanVar(value=False)
+        self.file_watcher = None
+        # (project snapshot, watched paths) read by the watcher thread; only replaced on the Tk thread
+        self.watch_snapshot = None
         self.material_properties_entries = {}
         self.material_properties_frame = None
 
@@ -96,6 +113,12 @@ class GeneratorTab(ctk.CTkFrame):
         self._bind_search()
         self.refresh_project_display()
 
+        # Start the build worker now so the first build does not wait for it
+        try:
+            build_worker.start()
+        except Exception as e:
+            print(f"[WARNING] Could not start build worker: {e}")
+
     def set_sidebar_references(self, mod_name_entry, author_entry):
 
         print(f"[DEBUG] set_sidebar_references called")
@@ -176,6 +199,44 @@ class GeneratorTab(ctk.CTkFrame):
         self._create_button(project_controls, "📂 Load", self.load_project, "primary", 90, 30).pack(side="left", padx=(0, 3))
         self._create_button(project_controls, "Clear", self.clear_project, "danger", 90, 30).pack(side="left")
 
+        compression_row = ctk.CTkFrame(left_sidebar, fg_color="transparent")
+        compression_row.pack(fill="x", padx=15, pady=(0, 10))
+
+        ctk.CTkLabel(
+            compression_row,
+            text="Compression:",
+            font=ctk.CTkFont(size=11, weight="bold"),
+            text_color=state.colors["text"]
+        ).pack(side="left", padx=(0, 8))
+
+        self.compression_preset_var = ctk.StringVar(value=PRESETS[get_compression_preset()]["label"])
+
+        ctk.CTkOptionMenu(
+            compression_row,
+            variable=self.compression_preset_var,
+            values=[preset["label"] for preset in PRESETS.values()],
+            command=self._on_compression_preset_changed,
+            height=28,
+            fg_color=state.colors["frame_bg"],
+            button_color=state.colors["accent"],
+            button_hover_color=state.colors["accent_hover"],
+            text_color=state.colors["text"],
+            dropdown_fg_color=state.colors["card_bg"],
+            dropdown_hover_color=state.colors["card_hover"],
+            dropdown_text_color=state.colors["text"]
+        ).pack(side="left", fill="x", expand=True)
+
+        ctk.CTkCheckBox(
+            left_sidebar,
+            text="👁 Watch mode (rebuild on save)",
+            variable=self.watch_mode_var,
+            command=self._on_watch_mode_changed,
+            font=ctk.CTkFont(size=11, weight="bold"),
+            text_color=state.colors["text"],
+            fg_color=state.colors["accent"],
+            hover_color=state.colors["accent_hover"]
+        ).pack(anchor="w", padx=15, pady=(0, 10))
+
         separator = ctk.CTkFrame(left_sidebar, height=2, fg_color=state.colors["border"])
         separator.pack(fill="x", padx=15, pady=(0, 10))
 
@@ -537,6 +598,131 @@ class GeneratorTab(ctk.CTkFrame):
             progress_color=state.colors["accent"]
         )
 
+        self.cancel_build_btn = ctk.CTkButton(
+            self.generator_scroll,
+            text="✖ Cancel build",
+            command=self.cancel_build,
+            height=30,
+            width=140,
+            fg_color=state.colors["error"],
+            hover_color=state.colors["error_hover"],
+            text_color="white",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            corner_radius=8
+        )
+
+        # Timings and sizes of the last build, from its build report
+        self.build_summary_label = ctk.CTkLabel(
+            self.generator_scroll,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=state.colors["text_secondary"],
+            justify="left"
+        )
+
+    def cancel_build(self):
+        """Ask the running build to stop at the next skin or archive entry"""
+        if self.build_cancel_token is None or self.build_cancel_token.cancelled:
+            return
+        print("[DEBUG] Build cancel requested")
+        self.build_cancel_token.cancel()
+        self.cancel_build_btn.configure(state="disabled")
+        self.export_status_label.configure(text="Cancelling...")
+
+    def _show_build_summary(self, report):
+        """Show the compact summary of a finished build under the progress bar"""
+        try:
+            summary = report.summary()
+        except Exception as e:
+            print(f"[WARNING] Could not summarize build report: {e}")
+            return
+
+        if report.report_path:
+            summary += f"\nReport: {report.report_path}"
+
+        self.build_summary_label.configure(text=summary)
+        self.build_summary_label.pack(padx=20, pady=(0, 10), anchor="w")
+
+    def _on_watch_mode_changed(self):
+        """Start or stop watching the project's source files"""
+        if self.watch_mode_var.get():
+            self.show_notification("Generate the mod once to start watching its files", "info", 4000)
+        else:
+            self._stop_watching()
+            self.show_notification("Watch mode stopped", "info")
+
+    def _start_watching(self, output_path, unpacked=False):
+        """Rebuild the mod whenever a DDS, .pc or .jpg file of the project changes
+
+        Rebuilds always stream through the build cache, so only the skins
+        whose files changed are rendered again, and replace the ZIP in place.
+        """
+        from core.watch import FileWatcher, affected_skins
+        from core.settings import get_build_jobs, get_build_cache_size_mb, get_reproducible_build
+
+        self._stop_watching()
+        self._refresh_watch_snapshot()
+
+        def rebuild(changed_paths, cancel_token):
+            # Runs on the watcher thread: only the snapshot taken on the Tk thread is read
+            project_data, _ = self.watch_snapshot
+            skins = affected_skins(project_data, changed_paths)
+            print(f"[DEBUG] Watch mode: {len(changed_paths)} file(s) changed, {len(skins)} skin(s) affected")
+
+            try:
+                _, report = build_worker.build(
+                    project_data,
+                    output_path=output_path,
+                    jobs=get_build_jobs(),
+                    streaming=True,
+                    compression_preset=get_compression_preset(),
+                    cache_size_mb=get_build_cache_size_mb(),
+                    overwrite=True,
+                    unpacked=unpacked,
+                    reproducible=get_reproducible_build(),
+                    cancel_token=cancel_token
+                )
+            except BuildCancelled:
+                print(f"[DEBUG] Watch mode rebuild cancelled")
+                return
+            except Exception as e:
+                print(f"[ERROR] Watch mode rebuild failed: {e}")
+                dispatcher.post(self.show_notification, f"Watch rebuild failed: {str(e)}", "error", 5000)
+                return
+
+            dispatcher.post(
+                self.show_notification,
+                f"↻ Rebuilt '{project_data['mod_name']}' ({len(skins)} skin(s) changed) in {report.wall_time:.1f}s",
+                "success",
+                3000
+            )
+            dispatcher.post(self._show_build_summary, report)
+
+        self.file_watcher = FileWatcher(lambda: self.watch_snapshot[1], rebuild)
+        self.file_watcher.start()
+        print(f"[DEBUG] Watch mode started")
+        self.show_notification("👁 Watching project files for changes", "info", 3000)
+
+    def _refresh_watch_snapshot(self):
+        """Copy the project for the watcher thread; call on the Tk thread after every change"""
+        from core.watch import project_watch_paths
+
+        project_data = copy.deepcopy(self.project_data)
+        self.watch_snapshot = (project_data, frozenset(project_watch_paths(project_data)))
+
+    def _stop_watching(self):
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
+            print(f"[DEBUG] Watch mode stopped")
+
+    def _on_compression_preset_changed(self, label: str):
+        """Save the compression preset picked in the sidebar"""
+        for name, preset in PRESETS.items():
+            if preset["label"] == label:
+                set_compression_preset(name)
+                break
+
     def _create_card(self, parent) -> ctk.CTkFrame:
         """Create a card container"""
         return ctk.CTkFrame(
@@ -949,37 +1135,7 @@ class GeneratorTab(ctk.CTkFrame):
             if 'dds_path' in skin:
                 self.dds_path_var.set(skin['dds_path'])
 
-                try:
-                    img = Image.open(skin['dds_path'])
-                    img.thumbnail((800, 800), Image.Resampling.LANCZOS)
-                    photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
-
-                    try:
-                        self.dds_preview_label.configure(image="", text="")
-                    except:
-                        pass
-
-                    if hasattr(self.dds_preview_label, 'image'):
-                        old_image = self.dds_preview_label.image
-                        self.dds_preview_label.image = None
-                        del old_image
-
-                    self.dds_preview_label.image = photo
-                    self.dds_preview_label.configure(image=photo)
-
-                    self.dds_preview_label.update_idletasks()
-
-                    print(f"[DEBUG] Loaded DDS preview for editing: {skin['dds_path']}")
-                except Exception as e:
-                    print(f"[DEBUG] Could not load DDS preview: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    try:
-                        self.dds_preview_label.configure(image="", text="Preview unavailable")
-                        if hasattr(self.dds_preview_label, 'image'):
-                            self.dds_preview_label.image = None
-                    except:
-                        pass
+                self._request_dds_preview(skin['dds_path'])
         except Exception as e:
             print(f"[DEBUG] Error setting DDS path: {e}")
 
@@ -1374,32 +1530,49 @@ class GeneratorTab(ctk.CTkFrame):
         if filename:
             self.dds_path_var.set(filename)
 
-            try:
-                img = Image.open(filename)
-                img.thumbnail((800, 800), Image.Resampling.LANCZOS)
-                photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+            self._request_dds_preview(filename)
 
-                try:
-                    self.dds_preview_label.configure(image=None, text="")
-                except:
-                    pass
+    def _request_dds_preview(self, dds_path: str):
+        """Load the preview of dds_path on the image service and show it when ready
 
-                self.dds_preview_label.image = photo
+        Args:
+            dds_path: Path of the DDS texture
+        """
+        image_service.request(
+            DDS_PREVIEW_REQUEST_KEY,
+            lambda: get_thumbnail_cache().get(dds_path, PREVIEW_SIZE),
+            lambda img: self._show_dds_preview(dds_path, img),
+            lambda e: self._show_dds_preview_error(dds_path, e)
+        )
 
-                try:
-                    self.dds_preview_label.configure(image=photo)
-                except:
-                    pass
+    def _show_dds_preview(self, dds_path: str, img):
+        """Show a loaded DDS preview if its texture is still the selected one"""
+        if not self.dds_preview_label or self.dds_path_var.get() != dds_path:
+            return
 
-                print(f"[DEBUG] DDS preview loaded: {filename}")
-            except Exception as e:
-                print(f"[DEBUG] Could not load DDS preview: {e}")
-                try:
-                    if hasattr(self, 'dds_preview_label') and self.dds_preview_label:
-                        self.dds_preview_label.image = None
-                        self.dds_preview_label.configure(text="Preview unavailable")
-                except:
-                    pass
+        photo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+
+        try:
+            self.dds_preview_label.configure(image="", text="")
+        except:
+            pass
+
+        self.dds_preview_label.image = photo
+        self.dds_preview_label.configure(image=photo)
+
+        print(f"[DEBUG] DDS preview loaded: {dds_path}")
+
+    def _show_dds_preview_error(self, dds_path: str, error: Exception):
+        """Show that the preview of the selected texture could not be loaded"""
+        print(f"[DEBUG] Could not load DDS preview: {error}")
+        if not self.dds_preview_label or self.dds_path_var.get() != dds_path:
+            return
+
+        try:
+            self.dds_preview_label.image = None
+            self.dds_preview_label.configure(image="", text="Preview unavailable")
+        except:
+            pass
 
     def _toggle_config_data(self):
         """Toggle visibility of config data section"""
@@ -1691,21 +1864,7 @@ class GeneratorTab(ctk.CTkFrame):
                         print(f"[DEBUG] Found material file: {filepath}")
 
                         try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                content = f.read()
-
-                            import re
-
-                            content = re.sub(r',(\s*[}\]])', r'\1', content)
-
-                            try:
-                                data = json.loads(content)
-                            except json.JSONDecodeError as e:
-                                print(f"[DEBUG] JSON decode error in {filename} even after cleanup: {e}")
-                                print(f"[DEBUG] Error at line {e.lineno}, column {e.colno}")
-                                import traceback
-                                traceback.print_exc()
-                                continue
+                            data = jbeam.load_file(filepath)
 
                             for material_name, material_info in data.items():
 
@@ -1743,6 +1902,10 @@ class GeneratorTab(ctk.CTkFrame):
 
                                 print(f"[DEBUG] Material file exists but contains no editable properties: {filepath}")
 
+                        except jbeam.JBeamDecodeError as e:
+                            print(f"[DEBUG] Parse error in {filename}: {e}")
+                            print(f"[DEBUG] Error at line {e.lineno}, column {e.colno}")
+                            continue
                         except Exception as e:
                             print(f"[DEBUG] Error loading {filename}: {e}")
                             import traceback
@@ -2057,6 +2220,13 @@ class GeneratorTab(ctk.CTkFrame):
 
                 self.refresh_project_display()
 
+                # Render skin previews now so selecting a skin does not decode its DDS
+                get_thumbnail_cache().prefill(
+                    skin.get("dds_path")
+                    for car_info in loaded_data["cars"].values()
+                    for skin in car_info.get("skins", [])
+                )
+
             except Exception as e:
                 print(f"[DEBUG] Error loading project: {e}")
                 self.show_notification(f"Error loading project: {str(e)}", "error")
@@ -2117,6 +2287,9 @@ class GeneratorTab(ctk.CTkFrame):
         print(f"[DEBUG] ========== REFRESH PROJECT DISPLAY ==========")
         print(f"[DEBUG] Cars in project: {len(self.project_data['cars'])}")
 
+        if self.file_watcher is not None:
+            self._refresh_watch_snapshot()
+
         for widget in self.project_overview_frame.winfo_children():
             widget.destroy()
 
@@ -2361,6 +2534,72 @@ class GeneratorTab(ctk.CTkFrame):
 
         pass
 
+    def plan_mod(self, output_mode_var, custom_output_var):
+        """Estimate size and time of the build and list problems, without building"""
+        from core.build_plan import plan_build
+        from core.settings import get_mods_folder_path
+
+        if not self.project_data["cars"]:
+            self.show_notification("Please add at least one car to the project", "error")
+            return
+
+        project_data = copy.deepcopy(self.project_data)
+        if self.mod_name_entry_sidebar:
+            project_data["mod_name"] = self.get_real_value(self.mod_name_entry_sidebar, "Enter mod name...").strip()
+        if self.author_entry_sidebar:
+            project_data["author"] = self.get_real_value(self.author_entry_sidebar, "Your name...").strip() or "Unknown"
+
+        output_mode = output_mode_var.get()
+        if output_mode == "custom":
+            output_path = custom_output_var.get() or None
+        elif output_mode == "steam":
+            output_path = get_mods_folder_path() or None
+        else:
+            # Unpacked builds sync into their folder, there is no ZIP to replace
+            output_path = None
+
+        compression_preset = get_compression_preset()
+        self.show_notification("Planning build...", "info", 1500)
+
+        run_in_background(
+            lambda: plan_build(project_data, compression_preset, output_path=output_path),
+            on_done=self._show_build_plan,
+            on_error=lambda e: self.show_notification(f"Could not plan build: {str(e)}", "error", 5000)
+        )
+
+    def _show_build_plan(self, plan):
+        """Show a build plan in its own window"""
+        window = ctk.CTkToplevel(self.winfo_toplevel())
+        window.title(f"Build plan - {plan.mod_name or 'Unnamed mod'}")
+        window.geometry("760x520")
+        window.configure(fg_color=state.colors["app_bg"])
+
+        if plan.ok:
+            status_text = "✓ Ready to build"
+            status_color = state.colors["success"]
+        else:
+            status_text = f"✗ {len(plan.problems)} problem(s) to fix before building"
+            status_color = state.colors["error"]
+
+        ctk.CTkLabel(
+            window,
+            text=status_text,
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color=status_color,
+            anchor="w"
+        ).pack(fill="x", padx=15, pady=(15, 5))
+
+        textbox = ctk.CTkTextbox(
+            window,
+            font=ctk.CTkFont(family="Courier", size=12),
+            fg_color=state.colors["card_bg"],
+            text_color=state.colors["text"],
+            wrap="word"
+        )
+        textbox.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        textbox.insert("1.0", plan.summary())
+        textbox.configure(state="disabled")
+
     def generate_mod(self, generate_button_topbar, output_mode_var, custom_output_var):
 
         print(f"[DEBUG] generate_mod called")
@@ -2427,7 +2666,7 @@ class GeneratorTab(ctk.CTkFrame):
                 self.show_notification("Please select a custom output location", "error")
                 return
             print(f"[DEBUG] Output mode: Custom - {output_path}")
-        elif output_mode == "steam":
+        elif output_mode in ("steam", "unpacked"):
 
             try:
                 from core.settings import get_mods_folder_path
@@ -2441,7 +2680,7 @@ class GeneratorTab(ctk.CTkFrame):
                     self.show_notification(f"Mods folder does not exist: {output_path}", "error", 4000)
                     return
 
-                print(f"[DEBUG] Output mode: Steam - {output_path}")
+                print(f"[DEBUG] Output mode: {output_mode.capitalize()} - {output_path}")
             except ImportError:
                 self.show_notification("Could not load settings. Please configure mods folder path.", "error", 4000)
                 return
@@ -2459,23 +2698,53 @@ class GeneratorTab(ctk.CTkFrame):
         total_skins = sum(len(car_info['skins']) for car_info in self.project_data['cars'].values())
         print(f"[DEBUG] Total Skins: {total_skins}")
 
+        self.build_summary_label.pack_forget()
         self.export_status_label.configure(text="Preparing to export...")
         self.export_status_label.pack(padx=20, pady=(10, 5))
         self.progress_bar.pack(fill="x", padx=20, pady=(0, 5))
         self.progress_bar.set(0)
+        self.build_cancel_token = cancel_token = CancelToken()
+        self.cancel_build_btn.configure(state="normal")
+        self.cancel_build_btn.pack(padx=20, pady=(0, 5))
         generate_button_topbar.configure(state="disabled")
 
-        def update_status(message):
+        # In watch mode the mod is rebuilt in place, so replace it here too
+        watch_mode = self.watch_mode_var.get()
+        unpacked = output_mode == "unpacked"
 
-            print(f"[DEBUG] update_status called")
+        def set_status(message):
+
+            print(f"[DEBUG] set_status called")
+            # Progress still queued behind a cancel must not overwrite it
+            if cancel_token.cancelled and message != "Build cancelled":
+                return
             self.export_status_label.configure(text=message)
 
-        def update_progress(value):
+        def set_progress(value):
 
-            print(f"[DEBUG] update_progress called")
+            print(f"[DEBUG] set_progress called")
             if self.progress_bar.winfo_ismapped():
                 self.progress_bar.set(value)
 
+        # Called from the build thread; widgets are updated on the Tk thread,
+        # at most once per dispatcher tick however often the build reports
+        def update_status(message):
+            dispatcher.post_latest("build_status", set_status, message)
+
+        def update_progress(value):
+            dispatcher.post_latest("build_progress", set_progress, value)
+
+        def notify(message, type="info", duration=3000):
+            dispatcher.post(self.show_notification, message, type, duration)
+
+        def on_build_finished():
+            self.progress_bar.set(0)
+            self.build_cancel_token = None
+            self.cancel_build_btn.pack_forget()
+            generate_button_topbar.configure(state="normal")
+            self.after(2000, lambda: self.progress_bar.pack_forget())
+            self.after(2000, lambda: self.export_status_label.pack_forget())
+
         def thread_fn():
 
             print(f"[DEBUG] thread_fn called")
@@ -2485,7 +2754,6 @@ class GeneratorTab(ctk.CTkFrame):
 
                 def progress_with_status(value):
 
-                    print(f"[DEBUG] progress_with_status called")
                     update_progress(value)
                     if value < 0.3:
                         update_status("Copying template files...")
@@ -2495,36 +2763,58 @@ class GeneratorTab(ctk.CTkFrame):
                         update_status("Creating ZIP archive...")
 
                 if generate_multi_skin_mod:
-                    generate_multi_skin_mod(
-                        self.project_data,
+                    from core.settings import (
+                        get_build_jobs, get_streaming_build, get_reproducible_build,
+                        get_build_cache_enabled, get_build_cache_size_mb
+                    )
+
+                    # The worker process gets a snapshot, so edits made
+                    # while it builds do not leak into this build
+                    _, report = build_worker.build(
+                        copy.deepcopy(self.project_data),
+                        progress_callback=progress_with_status,
                         output_path=output_path,
-                        progress_callback=progress_with_status
+                        jobs=get_build_jobs(),
+                        streaming=get_streaming_build(),
+                        compression_preset=get_compression_preset(),
+                        cache_size_mb=get_build_cache_size_mb() if get_build_cache_enabled() else None,
+                        overwrite=watch_mode,
+                        unpacked=unpacked,
+                        cancel_token=cancel_token,
+                        reproducible=get_reproducible_build()
                     )
 
                     update_status("Export completed successfully!")
+                    dispatcher.post(self._show_build_summary, report)
+                    if watch_mode:
+                        dispatcher.post(self._start_watching, output_path, unpacked)
                     print("[DEBUG] Mod generation completed successfully!")
                     print("[DEBUG] ="*50 + "\n")
-                    self.show_notification(f"✓ Mod '{mod_name}' created with {total_skins} skins!", "success", 5000)
+                    notify(f"✓ Mod '{mod_name}' created with {total_skins} skins!", "success", 5000)
 
-                    self.after(2000, lambda: self.show_notification("Project kept. Click 'Clear Project' to start new one.", "info", 4000))
+                    dispatcher.post(
+                        self.after, 2000,
+                        lambda: self.show_notification("Project kept. Click 'Clear Project' to start new one.", "info", 4000)
+                    )
                 else:
                     update_status("Error: Generation function not available")
-                    self.show_notification("Error: generate_multi_skin_mod function not found", "error", 5000)
+                    notify("Error: generate_multi_skin_mod function not found", "error", 5000)
 
+            except BuildCancelled:
+                update_status("Build cancelled")
+                print("[DEBUG] Mod generation cancelled")
+                notify("Build cancelled", "info", 3000)
             except FileExistsError as e:
                 update_status("Error: File already exists")
                 print(f"[DEBUG] ERROR: File already exists - {e}")
-                self.show_notification(f"File already exists: {str(e)}", "error", 5000)
+                notify(f"File already exists: {str(e)}", "error", 5000)
             except Exception as e:
                 update_status("Error: Export failed")
                 print(f"[DEBUG] ERROR: {e}")
                 import traceback
                 traceback.print_exc()
-                self.show_notification(f"Error: {str(e)}", "error", 5000)
+                notify(f"Error: {str(e)}", "error", 5000)
             finally:
-                self.progress_bar.set(0)
-                generate_button_topbar.configure(state="normal")
-                self.after(2000, lambda: self.progress_bar.pack_forget())
-                self.after(2000, lambda: self.export_status_label.pack_forget())
+                dispatcher.post(on_build_finished)
 
         threading.Thread(target=thread_fn, daemon=True).start()
\ No newline at end of file
@@ -10,6 +10,7 @@ from gui.state import state
 from core.settings import reset_theme_colors, update_theme_color, DEFAULT_THEMES
 from utils.debug import toggle_debug_mode
 from gui.components.path_configuration import PathConfigurationSection
+from gui.components.build_settings import BuildSettingsSection
 
 print(f"[DEBUG] Loading class: SettingsTab")
 
@@ -88,6 +89,12 @@ class SettingsTab(ctk.CTkFrame):
         )
         self.path_config.pack(fill="x", padx=10, pady=(10, 15))
 
+        self.build_settings = BuildSettingsSection(
+            self.settings_scrollable_frame,
+            notification_callback=self.show_notification
+        )
+        self.build_settings.pack(fill="x", padx=10, pady=(0, 15))
+
         ctk.CTkLabel(
             self.settings_scrollable_frame,
             text="─" * 60,
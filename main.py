@@ -33,6 +33,9 @@ def center_window(window):
 
 if __name__ == "__main__":
 
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     try:
         from utils.single_instance import check_single_instance, release_global_lock
         import atexit
@@ -0,0 +1,36 @@
+import os
+import sys
+import shutil
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep build reports and other cache files out of the user's cache"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+
+@pytest.fixture
+def vehicles_root(tmp_path):
+    """A vehicles folder holding a copy of the etk800 template"""
+    root = tmp_path / "vehicles"
+    shutil.copytree(os.path.join(REPO_ROOT, "vehicles", "etk800"), root / "etk800")
+    return str(root)
+
+@pytest.fixture
+def project(tmp_path):
+    dds_path = tmp_path / "etk800_skin_test.dds"
+    dds_path.write_bytes(b"DDS " + b"\x7c\x00\x00\x00" + bytes(120) + bytes(range(256)) * 64)
+    return {
+        "mod_name": "Test Mod",
+        "author": "Tester",
+        "cars": {
+            "etk800": {
+                "base_carid": "etk800",
+                "skins": [{"name": "Test Skin", "dds_path": str(dds_path)}]
+            }
+        }
+    }
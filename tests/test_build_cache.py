@@ -0,0 +1,116 @@
+import os
+import json
+import zipfile
+import threading
+import multiprocessing
+
+from core.build_cache import BuildCache
+from core.build_report import BuildReport
+from core.file_ops import generate_multi_skin_mod
+
+def _build(project, vehicles_root, output_path, build_cache):
+    report = BuildReport()
+    zip_path = generate_multi_skin_mod(
+        project, output_path=output_path, streaming=True, build_cache=build_cache,
+        vehicles_root=vehicles_root, overwrite=True, report=report
+    )
+    return zip_path, report
+
+def test_template_edit_invalidates_cached_skins(tmp_path, project, vehicles_root):
+    build_cache = BuildCache(cache_dir=str(tmp_path / "cache"))
+    output_path = str(tmp_path / "mods")
+
+    _build(project, vehicles_root, output_path, build_cache)
+    zip_path, report = _build(project, vehicles_root, output_path, build_cache)
+    assert report.info.get("cache_hits") == 1
+
+    jbeam_path = os.path.join(vehicles_root, "etk800", "SKINNAME", "etk800.jbeam")
+    with open(jbeam_path, "a", encoding="utf-8") as f:
+        f.write("\n// edited template\n")
+
+    zip_path, report = _build(project, vehicles_root, output_path, build_cache)
+    assert not report.info.get("cache_hits")
+    with zipfile.ZipFile(zip_path) as zipf:
+        jbeam_names = [name for name in zipf.namelist() if name.endswith(".jbeam")]
+        assert jbeam_names
+        assert "// edited template" in zipf.read(jbeam_names[0]).decode("utf-8")
+
+def test_eviction_elsewhere_keeps_leased_artifacts(tmp_path, project, vehicles_root, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    output_path = str(tmp_path / "mods")
+    _build(project, vehicles_root, output_path, BuildCache(cache_dir=cache_dir))
+
+    # Another process with a tiny cap evicts right after this build's lookup
+    build_cache = BuildCache(cache_dir=cache_dir)
+    other = BuildCache(cache_dir=cache_dir, max_bytes=0)
+    lookup = build_cache.lookup
+
+    def lookup_then_evict(key):
+        path = lookup(key)
+        assert other.evict() == 0
+        return path
+
+    monkeypatch.setattr(build_cache, "lookup", lookup_then_evict)
+    zip_path, report = _build(project, vehicles_root, output_path, build_cache)
+
+    assert report.info.get("cache_hits") == 1
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert zipf.testzip() is None
+        assert any(name.endswith(".dds") for name in zipf.namelist())
+
+    # Released once merged
+    assert not os.listdir(os.path.join(cache_dir, "in_use"))
+    assert other.evict() > 0
+
+def test_failed_build_releases_its_lease(tmp_path, project, vehicles_root):
+    cache_dir = str(tmp_path / "cache")
+    build_cache = BuildCache(cache_dir=cache_dir)
+    project["cars"]["etk800"]["skins"][0]["dds_path"] = str(tmp_path / "missing.dds")
+
+    try:
+        _build(project, vehicles_root, str(tmp_path / "mods"), build_cache)
+    except OSError:
+        pass
+    leases_dir = os.path.join(cache_dir, "in_use")
+    assert not os.path.isdir(leases_dir) or not os.listdir(leases_dir)
+
+def test_saved_digests_merge_with_other_processes(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = BuildCache(cache_dir=cache_dir)
+    second = BuildCache(cache_dir=cache_dir)
+
+    for name, cache in (("a.dds", first), ("b.dds", second)):
+        path = tmp_path / name
+        path.write_bytes(name.encode("ascii"))
+        cache.file_digest(str(path))
+        cache.save()
+
+    with open(os.path.join(cache_dir, "digests.json"), "r", encoding="utf-8") as f:
+        saved = json.load(f)
+    assert {os.path.basename(path) for path in saved} == {"a.dds", "b.dds"}
+
+def _hold_lock(cache_dir, locked, release):
+    with BuildCache(cache_dir=cache_dir).locked():
+        locked.set()
+        release.wait(10)
+
+def test_lock_is_shared_between_processes(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    build_cache = BuildCache(cache_dir=cache_dir)
+    locked = multiprocessing.Event()
+    release = multiprocessing.Event()
+    process = multiprocessing.Process(target=_hold_lock, args=(cache_dir, locked, release))
+    process.start()
+    try:
+        assert locked.wait(10)
+        waiter = threading.Thread(target=lambda: build_cache.evict())
+        waiter.start()
+        waiter.join(0.3)
+        assert waiter.is_alive()
+
+        release.set()
+        waiter.join(10)
+        assert not waiter.is_alive()
+    finally:
+        release.set()
+        process.join(10)
@@ -0,0 +1,85 @@
+import os
+import zipfile
+
+from core.build_plan import plan_build, recorded_throughput, DEFAULT_THROUGHPUT
+from core.build_report import BuildReport
+from core.file_ops import generate_multi_skin_mod
+
+def test_plan_matches_the_build(tmp_path, project, vehicles_root):
+    plan = plan_build(project, vehicles_root=vehicles_root, reports_dir=str(tmp_path / "reports"))
+    assert plan.ok, plan.problems
+
+    zip_path = generate_multi_skin_mod(project, output_path=str(tmp_path / "mods"), vehicles_root=vehicles_root)
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert plan.entry_count == len(zipf.infolist())
+    assert plan.bytes_out > 0
+    assert plan.throughput == DEFAULT_THROUGHPUT and not plan.throughput_recorded
+
+def test_skins_sharing_a_folder_are_a_problem(tmp_path, project, vehicles_root):
+    dds_path = project["cars"]["etk800"]["skins"][0]["dds_path"]
+    project["cars"]["etk800"]["skins"] = [
+        {"name": "Red Car", "dds_path": dds_path},
+        {"name": "red_car", "dds_path": dds_path}
+    ]
+
+    plan = plan_build(project, vehicles_root=vehicles_root, reports_dir=str(tmp_path / "reports"))
+
+    assert not plan.ok
+    assert len(plan.problems) == 1
+    assert "skin folder 'vehicles/etk800/red_car' is also used by etk800 / Red Car" in plan.problems[0]
+
+def test_missing_inputs_are_problems(tmp_path, project, vehicles_root):
+    skin = project["cars"]["etk800"]["skins"][0]
+    skin["dds_path"] = str(tmp_path / "gone.dds")
+    skin["config_data"] = {"pc_file_path": str(tmp_path / "gone.pc")}
+    project["cars"]["pickup"] = {"base_carid": "pickup", "skins": []}
+    project["mod_name"] = ""
+
+    plan = plan_build(project, vehicles_root=vehicles_root, reports_dir=str(tmp_path / "reports"))
+
+    problems = "\n".join(plan.problems)
+    assert "The mod has no name" in problems
+    assert "DDS file not found" in problems
+    assert ".pc file not found" in problems
+    assert "no template for vehicle 'pickup'" in problems
+    assert "pickup" in plan.summary()
+
+def test_existing_mod_and_unnamed_dds_are_warnings(tmp_path, project, vehicles_root):
+    output_path = tmp_path / "mods"
+    output_path.mkdir()
+    (output_path / "Test_Mod.zip").write_bytes(b"")
+    unnamed = tmp_path / "skin.dds"
+    unnamed.write_bytes(b"DDS ")
+    project["cars"]["etk800"]["skins"][0]["dds_path"] = str(unnamed)
+
+    plan = plan_build(
+        project, vehicles_root=vehicles_root, output_path=str(output_path), reports_dir=str(tmp_path / "reports")
+    )
+
+    assert plan.ok
+    assert any("Test_Mod.zip already exists" in warning for warning in plan.warnings)
+    assert any("no skin name in DDS filename 'skin.dds'" in warning for warning in plan.warnings)
+
+def test_shared_textures_are_counted_once(tmp_path, project, vehicles_root):
+    dds_path = project["cars"]["etk800"]["skins"][0]["dds_path"]
+    copy_path = tmp_path / "etk800_skin_copy.dds"
+    with open(dds_path, "rb") as f:
+        copy_path.write_bytes(f.read())
+    project["cars"]["etk800"]["skins"].append({"name": "Copy", "dds_path": str(copy_path)})
+
+    plan = plan_build(project, vehicles_root=vehicles_root, reports_dir=str(tmp_path / "reports"))
+
+    assert plan.shared_textures == 1
+    assert plan.dedup_bytes_saved == os.path.getsize(dds_path)
+
+def test_throughput_comes_from_uncached_reports(tmp_path):
+    reports_dir = str(tmp_path / "reports")
+    os.makedirs(reports_dir)
+    for index, (bytes_in, cache_hits) in enumerate(((1000, 0), (3000, 0), (10 ** 9, 2))):
+        report = BuildReport(f"Mod {index}")
+        report.wall_time = 1.0
+        report.entries.append({"name": "a.dds", "bytes_in": bytes_in, "bytes_out": bytes_in, "stored": True})
+        report.info["cache_hits"] = cache_hits
+        report.save(reports_dir)
+
+    assert recorded_throughput(reports_dir) == 2000
@@ -0,0 +1,42 @@
+import os
+import time
+
+from core.build_report import BuildReport
+from core.file_ops import generate_multi_skin_mod
+
+def test_cpu_time_counts_skins_built_in_worker_processes():
+    report = BuildReport("Test Mod")
+    report.add_skin("etk800 [1/2]", "Red", 1.0, 0.75, pid=os.getpid() + 1)
+    report.add_skin("etk800 [2/2]", "Blue", 1.0, 0.5, pid=os.getpid() + 2)
+    # Built here, so already part of this process's CPU time
+    report.add_skin("etk800 [1/1]", "Green", 1.0, 100.0)
+    report.finish()
+
+    assert 1.25 <= report.cpu_time < 100.0
+    assert "pid" not in report.to_dict()["slowest_skins"][0]
+
+def test_process_pool_build_reports_worker_cpu(tmp_path, project, vehicles_root):
+    dds_path = project["cars"]["etk800"]["skins"][0]["dds_path"]
+    project["cars"]["etk800"]["skins"] = [{"name": name, "dds_path": dds_path} for name in ("Red", "Blue")]
+
+    report = BuildReport()
+    generate_multi_skin_mod(project, output_path=str(tmp_path / "mods"), jobs=2, vehicles_root=vehicles_root, report=report)
+
+    assert {skin["pid"] for skin in report.skins}.isdisjoint({os.getpid()})
+    assert report.cpu_time >= sum(skin["cpu"] for skin in report.skins)
+
+def test_reports_of_one_moment_do_not_overwrite_each_other(tmp_path):
+    paths = set()
+    for _ in range(3):
+        report = BuildReport("Test Mod")
+        report.started = 1700000000.25
+        report.finish()
+        paths.add(report.save(str(tmp_path)))
+
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(1700000000)) + "-250"
+    assert len(paths) == 3
+    assert sorted(os.listdir(tmp_path)) == [
+        f"{stamp}_Test_Mod-2.json",
+        f"{stamp}_Test_Mod-3.json",
+        f"{stamp}_Test_Mod.json"
+    ]
@@ -0,0 +1,63 @@
+import os
+import zipfile
+
+import pytest
+
+from core.compression import (
+    DEFAULT_PRESET, PRESETS, SAMPLE_BLOCK_SIZE, get_preset, sample_compressibility,
+    choose_file_compression, choose_data_compression
+)
+
+@pytest.fixture
+def random_dds(tmp_path):
+    path = tmp_path / "noise.dds"
+    path.write_bytes(bytes(128) + os.urandom(SAMPLE_BLOCK_SIZE * 6))
+    return str(path)
+
+@pytest.fixture
+def flat_dds(tmp_path):
+    path = tmp_path / "flat.dds"
+    path.write_bytes(bytes(128) + b"\x10\x20\x30\x40" * (SAMPLE_BLOCK_SIZE * 2))
+    return str(path)
+
+def test_unknown_preset_falls_back_to_default():
+    assert get_preset("nonsense") is PRESETS[DEFAULT_PRESET]
+
+def test_sampling_tells_noise_from_flat_data(random_dds, flat_dds):
+    assert sample_compressibility(random_dds) > 0.95
+    assert sample_compressibility(flat_dds) < 0.1
+
+def test_sampling_small_and_empty_files(tmp_path):
+    small = tmp_path / "small.dds"
+    small.write_bytes(bytes(200))
+    empty = tmp_path / "empty.dds"
+    empty.write_bytes(b"")
+
+    assert sample_compressibility(str(small)) < 0.5
+    assert sample_compressibility(str(empty)) == 1.0
+
+def test_already_compressed_formats_are_stored(tmp_path):
+    jpg = tmp_path / "preview.jpg"
+    jpg.write_bytes(bytes(1000))
+    for preset in PRESETS:
+        assert choose_file_compression(str(jpg), preset) == (zipfile.ZIP_STORED, None)
+
+@pytest.mark.parametrize("preset, expected", [
+    ("fast", (zipfile.ZIP_STORED, None)),
+    ("balanced", (zipfile.ZIP_STORED, None)),
+    ("smallest", (zipfile.ZIP_DEFLATED, 9))
+])
+def test_incompressible_dds_by_preset(random_dds, preset, expected):
+    assert choose_file_compression(random_dds, preset) == expected
+
+@pytest.mark.parametrize("preset, expected", [
+    ("fast", (zipfile.ZIP_STORED, None)),
+    ("balanced", (zipfile.ZIP_DEFLATED, 6)),
+    ("smallest", (zipfile.ZIP_DEFLATED, 9))
+])
+def test_compressible_dds_by_preset(flat_dds, preset, expected):
+    assert choose_file_compression(flat_dds, preset) == expected
+
+def test_text_is_deflated_at_the_preset_level():
+    for name, preset in PRESETS.items():
+        assert choose_data_compression(name) == (zipfile.ZIP_DEFLATED, preset["level"])
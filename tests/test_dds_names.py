@@ -0,0 +1,43 @@
+import zipfile
+
+import pytest
+
+from core.file_ops import canonical_dds_filename, generate_multi_skin_mod, get_fixed_dds_filename
+
+@pytest.mark.parametrize("filename, expected", [
+    ("etk800_skin_red.dds", "etk800_skin_red.dds"),
+    ("ETK800_SKIN_Red.DDS", "ETK800_SKIN_Red.DDS"),
+    ("pickup_skin_red.dds", "etk800_skin_red.dds"),
+    ("skin_red.dds", "etk800_skin_red.dds"),
+    ("myskin_red.dds", "etk800_skin_red.dds"),
+    ("red.DDS", "etk800_skin_red.dds"),
+    ("skin.dds", None),
+    ("skin_.dds", None)
+])
+def test_fixed_dds_filename(filename, expected):
+    assert get_fixed_dds_filename(filename, "etk800") == expected
+
+def test_canonical_name_falls_back_to_the_file_name(tmp_path):
+    assert canonical_dds_filename(str(tmp_path / "paint.dds"), "etk800") == "etk800_skin_paint.dds"
+    assert canonical_dds_filename(str(tmp_path / "skin.dds"), "etk800") == "skin.dds"
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_build_stores_dds_under_canonical_name(tmp_path, project, vehicles_root, streaming):
+    dds_path = tmp_path / "MyPaint.dds"
+    dds_path.write_bytes(b"DDS " + bytes(200))
+    project["cars"]["etk800"]["skins"][0]["dds_path"] = str(dds_path)
+    output_path = tmp_path / "mods"
+
+    zip_path = generate_multi_skin_mod(
+        project, output_path=str(output_path), streaming=streaming, vehicles_root=vehicles_root
+    )
+
+    with zipfile.ZipFile(zip_path) as zf:
+        names = zf.namelist()
+        materials = zf.read("vehicles/etk800/Test_Skin/materials.json").decode("utf-8")
+        assert zf.read("vehicles/etk800/Test_Skin/etk800_skin_MyPaint.dds") == dds_path.read_bytes()
+
+    assert not any(name.endswith("MyPaint.dds") and "_skin_" not in name for name in names)
+    assert "vehicles/etk800/Test_Skin/etk800_skin_MyPaint.dds" in materials
+    assert "MyPaint.dds" not in materials.replace("etk800_skin_MyPaint.dds", "")
+    assert dds_path.exists()
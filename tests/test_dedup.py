@@ -0,0 +1,73 @@
+import zipfile
+
+import pytest
+
+from core.file_ops import collect_skin_jobs, dedupe_skin_textures, generate_multi_skin_mod
+
+def _write_dds(path, fill):
+    path.write_bytes(b"DDS " + b"\x7c\x00\x00\x00" + bytes(120) + bytes([fill]) * 2048)
+    return str(path)
+
+@pytest.fixture
+def twin_project(tmp_path, project):
+    red = _write_dds(tmp_path / "etk800_skin_red.dds", 1)
+    twin = tmp_path / "copy"
+    twin.mkdir()
+    red_copy = _write_dds(twin / "etk800_skin_red2.dds", 1)
+    blue = _write_dds(tmp_path / "etk800_skin_blue.dds", 2)
+    project["cars"]["etk800"]["skins"] = [
+        {"name": "Red", "dds_path": red},
+        {"name": "Red Copy", "dds_path": red_copy},
+        {"name": "Blue", "dds_path": blue}
+    ]
+    return project
+
+def test_identical_textures_point_at_the_first_copy(twin_project, vehicles_root):
+    jobs = collect_skin_jobs(twin_project, vehicles_root)
+    digests = []
+
+    def file_digest(path):
+        digests.append(path)
+        with open(path, "rb") as f:
+            return f.read()
+
+    duplicates, bytes_saved = dedupe_skin_textures(jobs, file_digest)
+
+    assert (duplicates, bytes_saved) == (1, 128 + 2048)
+    assert "shared_dds" not in jobs[0] and "shared_dds" not in jobs[2]
+    assert jobs[1]["shared_dds"] == "vehicles/etk800/Red/etk800_skin_red.dds"
+    # All three have the same size, so all are hashed
+    assert len(digests) == 3
+
+def test_different_sizes_are_not_hashed(twin_project, vehicles_root, tmp_path):
+    twin_project["cars"]["etk800"]["skins"][1]["dds_path"] = str(tmp_path / "etk800_skin_other.dds")
+    (tmp_path / "etk800_skin_other.dds").write_bytes(b"DDS " + bytes(100))
+    twin_project["cars"]["etk800"]["skins"][2]["dds_path"] = str(tmp_path / "etk800_skin_third.dds")
+    (tmp_path / "etk800_skin_third.dds").write_bytes(b"DDS " + bytes(200))
+    jobs = collect_skin_jobs(twin_project, vehicles_root)
+
+    def file_digest(path):
+        raise AssertionError("hashed a texture with a unique size")
+
+    assert dedupe_skin_textures(jobs, file_digest) == (0, 0)
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_mod_stores_a_shared_texture_once(tmp_path, twin_project, vehicles_root, streaming):
+    zip_path = generate_multi_skin_mod(
+        twin_project, output_path=str(tmp_path / "mods"), streaming=streaming, vehicles_root=vehicles_root
+    )
+
+    with zipfile.ZipFile(zip_path) as zipf:
+        names = zipf.namelist()
+        dds_names = sorted(name for name in names if name.endswith(".dds"))
+        assert dds_names == [
+            "vehicles/etk800/Blue/etk800_skin_blue.dds",
+            "vehicles/etk800/Red/etk800_skin_red.dds"
+        ]
+
+        materials = zipf.read("vehicles/etk800/Red_Copy/materials.json").decode("utf-8")
+        assert "vehicles/etk800/Red/etk800_skin_red.dds" in materials
+        assert "Red_Copy/etk800_skin_red2.dds" not in materials
+
+        # The other skins keep their own textures
+        assert "vehicles/etk800/Blue/etk800_skin_blue.dds" in zipf.read("vehicles/etk800/Blue/materials.json").decode("utf-8")
@@ -0,0 +1,26 @@
+import pytest
+
+from core.file_ops import generate_multi_skin_mod
+from core.packager import ModPackager
+
+@pytest.mark.parametrize("names", [("Red", "red"), ("Red Car", "Red_Car")])
+@pytest.mark.parametrize("streaming", [True, False])
+def test_skins_sharing_a_folder_are_refused(tmp_path, project, vehicles_root, names, streaming):
+    dds_path = project["cars"]["etk800"]["skins"][0]["dds_path"]
+    project["cars"]["etk800"]["skins"] = [{"name": name, "dds_path": dds_path} for name in names]
+    output_path = tmp_path / "mods"
+
+    with pytest.raises(FileExistsError, match="would both be stored in"):
+        generate_multi_skin_mod(project, output_path=str(output_path), streaming=streaming, vehicles_root=vehicles_root)
+    assert not list(output_path.glob("*.zip"))
+
+def test_packager_refuses_duplicate_entries(tmp_path):
+    zip_path = tmp_path / "mod.zip"
+
+    with pytest.raises(FileExistsError, match="written into the mod twice"):
+        with ModPackager(str(zip_path), threads=1) as packager:
+            packager.add_entries([
+                ("vehicles/etk800/Red/skin.jbeam", "text", "{}"),
+                ("vehicles/etk800/Red/skin.jbeam", "text", "{}")
+            ])
+    assert not zip_path.exists()
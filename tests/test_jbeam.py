@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from core.jbeam import JBeamDocument, JBeamDecodeError, parse, load_document, load_file, clear_cache
+
+RELAXED_TEXT = """{
+    // line comment
+    "etk800_skin_red": {
+        "information": {
+            "authors": "Tester", /* block comment */
+            "name": "Red",
+            "value": 200,
+        },
+        slotType: "paint_design"
+        "globalSkin": "red",
+        "nodes": [
+            ["id", "posX", "posY"],
+            ["a1", 0.5, -1e3],
+            ["a2", .25, 7],
+        ],
+        'single': 'quoted',
+        "flags": [true, false, null],
+    },
+}
+"""
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+@pytest.mark.parametrize("text", [
+    RELAXED_TEXT,
+    '{"a": 1}',
+    '{\n  "a": [\n    1,\n    2,\n  ],\n}\n',
+    "{a: 1 b: 2}",
+    "[1, 2, 3,]",
+    '/* leading */ {"x": "C:\\\\Skins\\\\red"} // trailing',
+])
+def test_unchanged_document_round_trips(text):
+    assert JBeamDocument(text).dumps() == text
+
+def test_relaxed_syntax_parses_to_plain_values():
+    data = parse(RELAXED_TEXT)
+    skin = data["etk800_skin_red"]
+    assert skin["information"] == {"authors": "Tester", "name": "Red", "value": 200}
+    assert skin["slotType"] == "paint_design"
+    assert skin["nodes"] == [["id", "posX", "posY"], ["a1", 0.5, -1000.0], ["a2", 0.25, 7]]
+    assert skin["single"] == "quoted"
+    assert skin["flags"] == [True, False, None]
+
+def test_set_values_only_touches_the_target_values():
+    document = JBeamDocument(RELAXED_TEXT)
+    text = document.set_values({
+        ("etk800_skin_red", "information", "name"): "Blue",
+        ("etk800_skin_red", "nodes", 1, 1): 2.5,
+        ("etk800_skin_red", "globalSkin"): "red"
+    })
+
+    expected = RELAXED_TEXT.replace('"name": "Red"', '"name": "Blue"').replace('["a1", 0.5,', '["a1", 2.5,')
+    assert text == expected
+    # The document itself is not changed
+    assert document.dumps() == RELAXED_TEXT
+    assert document.data["etk800_skin_red"]["information"]["name"] == "Red"
+
+def test_set_values_adds_new_members_in_the_object_style():
+    document = JBeamDocument(RELAXED_TEXT)
+    text = document.set_values({("etk800_skin_red", "information", "color"): "red"})
+    assert '"value": 200,\n            "color": "red",\n        },' in text
+    assert parse(text)["etk800_skin_red"]["information"]["color"] == "red"
+
+    inline = JBeamDocument('{"a": {"b": 1}}').set_values({("a", "c"): 2})
+    assert inline == '{"a": {"b": 1, "c": 2}}'
+
+@pytest.mark.parametrize("values", [
+    {("etk800_skin_red", "information"): "not a scalar target"},
+    {("etk800_skin_red", "missing", "name"): "x"},
+    {("etk800_skin_red", "nodes", 9, 0): "x"},
+    {("etk800_skin_red", "globalSkin"): {"nested": True}},
+    {(): 1},
+])
+def test_set_values_refuses_what_it_cannot_edit(values):
+    assert JBeamDocument(RELAXED_TEXT).set_values(values) is None
+
+def test_dumps_writes_back_edits_to_data():
+    document = JBeamDocument(RELAXED_TEXT)
+    document.data["etk800_skin_red"]["information"]["value"] = 300
+    text = document.dumps()
+    assert text == RELAXED_TEXT.replace('"value": 200', '"value": 300')
+
+@pytest.mark.parametrize("text, message", [
+    ('{"a": 1', "Unexpected end of data"),
+    ('{"a" 1}', "Expecting ':' delimiter"),
+    ('{"a": }', "Expecting value"),
+    ('{"a": "open}', "Unterminated string"),
+    ('{"a": 1} /* open', "Unterminated comment"),
+    ('{"a": 1} {}', "Extra data"),
+    ('{"a": #}', "Unexpected character"),
+    ("", "Expecting value"),
+])
+def test_malformed_input_raises(text, message):
+    with pytest.raises(JBeamDecodeError, match=message):
+        parse(text)
+
+def test_decode_error_has_line_and_column():
+    with pytest.raises(JBeamDecodeError) as info:
+        parse('{\n  "a": 1,\n  "b": ?\n}')
+    assert (info.value.lineno, info.value.colno) == (3, 8)
+
+def test_shared_parse_follows_file_changes(tmp_path):
+    path = tmp_path / "materials.json"
+    path.write_text('{"a": 1}', encoding="utf-8")
+    assert load_file(str(path)) == {"a": 1}
+    assert load_file(str(path)) is load_file(str(path))
+
+    path.write_text('{"a": 22}', encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert load_file(str(path)) == {"a": 22}
+    assert load_document(str(path)).dumps() == '{"a": 22}'
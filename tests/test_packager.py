@@ -0,0 +1,119 @@
+import random
+import struct
+import zipfile
+
+import pytest
+
+import core.packager as packager_module
+from core.packager import CHUNK_SIZE, ModPackager
+
+def _sample_data(seed, size):
+    """Repetitive enough to deflate well, varied enough to span chunks"""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        part = rng.randbytes(rng.randint(16, 256)) * rng.randint(1, 32)
+        parts.append(part)
+        length += len(part)
+    return b"".join(parts)[:size]
+
+@pytest.fixture
+def entries(tmp_path):
+    """arcname -> contents, with files next to the packager's inputs"""
+    texture = tmp_path / "texture.bin"
+    texture.write_bytes(_sample_data(1, 3 * CHUNK_SIZE + 12345))
+    preview = tmp_path / "preview.png"
+    preview.write_bytes(_sample_data(2, CHUNK_SIZE + 7))
+    return {
+        "vehicles/etk800/a/big.bin": ("bytes", _sample_data(3, 2 * CHUNK_SIZE + 1)),
+        "vehicles/etk800/a/texture.bin": ("file", texture),
+        "vehicles/etk800/a/preview.png": ("file", preview),
+        "vehicles/etk800/a/skin.jbeam": ("text", '{"skin": {}}\n'),
+        "vehicles/etk800/a/empty.txt": ("bytes", b"")
+    }
+
+def _contents(kind, payload):
+    if kind == "file":
+        return payload.read_bytes()
+    if kind == "text":
+        return packager_module.encode_text(payload)
+    return payload
+
+def _pack(zip_path, entries, threads):
+    with ModPackager(str(zip_path), threads=threads, reproducible=True) as packager:
+        for arcname, (kind, payload) in entries.items():
+            if kind == "file":
+                packager.add_file(arcname, str(payload))
+            elif kind == "text":
+                packager.add_text(arcname, payload)
+            else:
+                packager.add_bytes(arcname, payload)
+    return zip_path
+
+def _local_header_sizes(f, info):
+    """(CRC, compressed size, size) from the local header of info"""
+    f.seek(info.header_offset)
+    fields = struct.unpack(zipfile.structFileHeader, f.read(zipfile.sizeFileHeader))
+    crc, compress_size, file_size, name_length, extra_length = fields[7:12]
+    f.seek(name_length, 1)
+    extra = f.read(extra_length)
+    while extra:
+        header_id, length = struct.unpack("<HH", extra[:4])
+        if header_id == 1:
+            file_size, compress_size = struct.unpack("<QQ", extra[4:20])
+        extra = extra[4 + length:]
+    return crc, compress_size, file_size
+
+def _assert_archive_holds(zip_path, entries):
+    with zipfile.ZipFile(zip_path) as zf, open(zip_path, "rb") as f:
+        assert zf.testzip() is None
+        # zipfile only reads the central directory; other tools trust the
+        # local headers, which are written before the sizes are known
+        for info in zf.infolist():
+            assert _local_header_sizes(f, info) == (info.CRC, info.compress_size, info.file_size)
+        assert sorted(zf.namelist()) == sorted(entries)
+        for arcname, (kind, payload) in entries.items():
+            assert zf.read(arcname) == _contents(kind, payload)
+
+@pytest.mark.parametrize("threads", [2, 4, 8])
+def test_thread_count_does_not_change_the_archive(tmp_path, entries, threads):
+    serial = _pack(tmp_path / "serial.zip", entries, 1)
+    parallel = _pack(tmp_path / "parallel.zip", entries, threads)
+
+    assert parallel.read_bytes() == serial.read_bytes()
+
+def test_stitched_entries_read_back(tmp_path, entries):
+    zip_path = _pack(tmp_path / "mod.zip", entries, 4)
+
+    _assert_archive_holds(zip_path, entries)
+    with zipfile.ZipFile(zip_path) as zf:
+        big = zf.getinfo("vehicles/etk800/a/big.bin")
+        assert big.compress_type == zipfile.ZIP_DEFLATED
+        assert big.compress_size < big.file_size
+        assert zf.getinfo("vehicles/etk800/a/preview.png").compress_type == zipfile.ZIP_STORED
+
+def test_entries_and_merges_past_the_zip64_limit(tmp_path, entries, monkeypatch):
+    # Lower the limit so ZIP64 headers, offsets and end records are written
+    # without producing a 4 GB archive
+    monkeypatch.setattr(zipfile, "ZIP64_LIMIT", CHUNK_SIZE)
+    zip_path = _pack(tmp_path / "mod.zip", entries, 4)
+
+    merged_path = tmp_path / "merged.zip"
+    with ModPackager(str(merged_path), threads=4, reproducible=True) as packager:
+        packager.add_archives([str(zip_path)])
+
+    for path in (zip_path, merged_path):
+        # ZIP64 end of central directory record
+        assert b"PK\x06\x06" in path.read_bytes()
+        _assert_archive_holds(path, entries)
+        with zipfile.ZipFile(path) as zf:
+            infos = zf.infolist()
+            assert any(info.file_size > zipfile.ZIP64_LIMIT for info in infos)
+            assert any(info.header_offset > zipfile.ZIP64_LIMIT for info in infos)
+
+def test_missing_zipfile_internals_fail_at_import(monkeypatch):
+    monkeypatch.delattr(zipfile.ZipFile, "_writecheck")
+
+    with pytest.raises(ImportError, match="ZipFile._writecheck"):
+        packager_module._check_zipfile_internals()
@@ -0,0 +1,36 @@
+import zipfile
+
+import pytest
+
+import core.packager
+from core.file_ops import generate_multi_skin_mod
+
+BUILD_TIME = (2001, 2, 3, 4, 5, 6)
+
+@pytest.fixture
+def three_skin_project(tmp_path, project):
+    skins = []
+    for index, name in enumerate(("Red", "Green", "Blue")):
+        dds_path = tmp_path / f"etk800_skin_{name.lower()}.dds"
+        dds_path.write_bytes(b"DDS " + b"\x7c\x00\x00\x00" + bytes(120) + bytes([index]) * 4096 + bytes(range(256)) * 32)
+        skins.append({"name": f"{name} Skin", "dds_path": str(dds_path)})
+    project["cars"]["etk800"]["skins"] = skins
+    return project
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_serial_and_process_pool_builds_are_identical(tmp_path, monkeypatch, three_skin_project, vehicles_root, streaming):
+    # Both builds start in the same second
+    monkeypatch.setattr(core.packager, "archive_date_time", lambda: BUILD_TIME)
+
+    archives = []
+    for jobs in (1, 4):
+        zip_path = generate_multi_skin_mod(
+            three_skin_project, output_path=str(tmp_path / f"jobs{jobs}"), jobs=jobs, streaming=streaming,
+            vehicles_root=vehicles_root
+        )
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert {info.date_time for info in zipf.infolist()} == {BUILD_TIME}
+        with open(zip_path, "rb") as f:
+            archives.append(f.read())
+
+    assert archives[0] == archives[1]
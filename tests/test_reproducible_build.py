@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from core.build_report import BuildReport
+from core.file_ops import generate_multi_skin_mod
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_unchanged_reproducible_build_keeps_existing_zip(tmp_path, project, vehicles_root, streaming):
+    output_path = str(tmp_path / "mods")
+    zip_path = generate_multi_skin_mod(
+        project, output_path=output_path, streaming=streaming, vehicles_root=vehicles_root, reproducible=True
+    )
+    mtime = os.path.getmtime(zip_path)
+
+    report = BuildReport()
+    again = generate_multi_skin_mod(
+        project, output_path=output_path, streaming=streaming, vehicles_root=vehicles_root, reproducible=True,
+        report=report
+    )
+    assert again == zip_path
+    assert report.info.get("unchanged")
+    assert os.path.getmtime(zip_path) == mtime
+
+def test_changed_reproducible_build_still_refuses_to_overwrite(tmp_path, project, vehicles_root):
+    output_path = str(tmp_path / "mods")
+    generate_multi_skin_mod(project, output_path=output_path, vehicles_root=vehicles_root, reproducible=True)
+
+    project["cars"]["etk800"]["skins"][0]["name"] = "Renamed Skin"
+    with pytest.raises(FileExistsError):
+        generate_multi_skin_mod(project, output_path=output_path, vehicles_root=vehicles_root, reproducible=True)
@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+import core.file_ops
+import core.templates
+from core.file_ops import render_jbeam_text, render_json_text
+from core.templates import JBEAM, JSON, compile_plan, get_plan, render_template_file, clear_plans
+
+@pytest.fixture(autouse=True)
+def fresh_plans():
+    clear_plans()
+    yield
+    clear_plans()
+
+@pytest.fixture
+def jbeam_path(vehicles_root):
+    return os.path.join(vehicles_root, "etk800", "SKINNAME", "etk800.jbeam")
+
+@pytest.fixture
+def materials_path(vehicles_root):
+    return os.path.join(vehicles_root, "etk800", "SKINNAME", "materials.json")
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def _jbeam_values(name):
+    return {"dds_identifier": name.replace(" ", ""), "skin_display_name": name, "author": "Tester"}
+
+def _json_values(name):
+    return {
+        "vehicle_id": "etk800",
+        "skin_folder_name": name.replace(" ", "_"),
+        "dds_filename": f"etk800_skin_{name.replace(' ', '')}.dds",
+        "dds_identifier": name.replace(" ", "")
+    }
+
+def _regex_jbeam(path, values):
+    return render_jbeam_text(_read(path), values["dds_identifier"], values["skin_display_name"], values["author"])
+
+def _regex_json(path, values):
+    return render_json_text(
+        _read(path), values["vehicle_id"], values["skin_folder_name"], values["dds_filename"],
+        values["dds_identifier"], source_name=path
+    )
+
+def test_plan_renders_like_the_regex_chain(jbeam_path, materials_path, monkeypatch):
+    values = _jbeam_values("Red Skin")
+    json_values = _json_values("Red Skin")
+    expected_jbeam = _regex_jbeam(jbeam_path, values)
+    expected_json = _regex_json(materials_path, json_values)
+
+    # Compile first, then make sure rendering does not go through the regex chain
+    get_plan(jbeam_path, JBEAM)
+    get_plan(materials_path, JSON)
+    monkeypatch.setattr(core.file_ops, "render_jbeam_text", None)
+    monkeypatch.setattr(core.file_ops, "render_json_text", None)
+
+    assert render_template_file(jbeam_path, JBEAM, **values) == expected_jbeam
+    assert render_template_file(materials_path, JSON, **json_values) == expected_json
+
+def _no_plan(plan, values):
+    raise AssertionError("plan used for values it cannot represent")
+
+@pytest.mark.parametrize("name", ['Quote "Skin"', "my skinname", "Red.skin.x"])
+def test_values_that_do_not_fit_the_plan_fall_back(jbeam_path, materials_path, monkeypatch, name):
+    monkeypatch.setattr(core.templates, "fill_plan", _no_plan)
+
+    values = _jbeam_values(name)
+    json_values = _json_values(name)
+    assert render_template_file(jbeam_path, JBEAM, **values) == _regex_jbeam(jbeam_path, values)
+    assert render_template_file(materials_path, JSON, **json_values) == _regex_json(materials_path, json_values)
+
+def test_non_ascii_values_fall_back_for_strict_json(tmp_path, monkeypatch):
+    # Strict JSON is re-serialized by the regex chain, which escapes non-ASCII
+    path = str(tmp_path / "strict.materials.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            '{"etk800.skin.SKINNAME": {"Stages": [{}, '
+            '{"baseColorMap": "vehicles/etk800/SKINNAME/etk800_skin_SKINNAME.dds"}]}}'
+        )
+    get_plan(path, JSON)
+    monkeypatch.setattr(core.templates, "fill_plan", _no_plan)
+
+    json_values = _json_values("Ünïcode")
+    assert render_template_file(path, JSON, **json_values) == _regex_json(path, json_values)
+
+def test_empty_value_falls_back(jbeam_path, monkeypatch):
+    monkeypatch.setattr(core.templates, "fill_plan", None)
+    values = dict(_jbeam_values("Red"), author="")
+    assert render_template_file(jbeam_path, JBEAM, **values) == _regex_jbeam(jbeam_path, values)
+
+def test_template_containing_sentinel_text_is_not_compiled():
+    assert compile_plan(JBEAM, '{"name": "@@BSS_author@@"}') is None
+
+def test_plan_is_reused_from_disk(jbeam_path, monkeypatch):
+    plan, _ = get_plan(jbeam_path, JBEAM)
+    clear_plans()
+    monkeypatch.setattr(core.templates, "compile_plan", None)
+
+    reloaded, content = get_plan(jbeam_path, JBEAM)
+    assert reloaded == plan
+    assert content == _read(jbeam_path)
+
+def test_edited_template_gets_a_new_plan(jbeam_path):
+    get_plan(jbeam_path, JBEAM)
+    with open(jbeam_path, "a", encoding="utf-8") as f:
+        f.write("\n// edited\n")
+
+    values = _jbeam_values("Red")
+    assert render_template_file(jbeam_path, JBEAM, **values).endswith("// edited\n")
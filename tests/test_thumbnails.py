@@ -0,0 +1,23 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from conftest import REPO_ROOT
+
+pytest.importorskip("PIL")
+
+def test_import_creates_no_cache_dir(tmp_path, cache_home):
+    cache_root = tmp_path / "xdg-cache"
+    subprocess.run(
+        [sys.executable, "-c", "import core.thumbnails"],
+        cwd=REPO_ROOT, env=dict(os.environ), check=True
+    )
+    assert not cache_root.exists()
+
+    subprocess.run(
+        [sys.executable, "-c", "from core.thumbnails import get_thumbnail_cache; get_thumbnail_cache()"],
+        cwd=REPO_ROOT, env=dict(os.environ), check=True
+    )
+    assert (cache_root / "BeamSkinStudio" / "thumbnails").is_dir()
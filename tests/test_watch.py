@@ -0,0 +1,49 @@
+import os
+import time
+import threading
+
+import pytest
+
+from core.build import build_project
+from core.cancel import CancelToken, BuildCancelled
+from core.watch import FileWatcher
+
+def test_stop_cancels_the_running_rebuild_and_waits_for_it(tmp_path):
+    watched = tmp_path / "skin.dds"
+    watched.write_bytes(b"1")
+    started = threading.Event()
+    finished = threading.Event()
+    tokens = []
+
+    def rebuild(changed_paths, cancel_token):
+        tokens.append(cancel_token)
+        started.set()
+        # A build checking its token between entries
+        while not cancel_token.cancelled:
+            time.sleep(0.01)
+        finished.set()
+
+    watcher = FileWatcher(lambda: [str(watched)], rebuild, interval=0.02, debounce=0.02)
+    watcher.start()
+    try:
+        time.sleep(0.1)
+        watched.write_bytes(b"22")
+        assert started.wait(5)
+    finally:
+        watcher.stop()
+
+    assert finished.is_set()
+    assert tokens[0].cancelled
+    assert not watcher.is_running
+
+def test_cancelled_rebuild_leaves_no_archive(tmp_path, project, vehicles_root):
+    cancel_token = CancelToken()
+    cancel_token.cancel()
+    output_dir = tmp_path / "mods"
+
+    with pytest.raises(BuildCancelled):
+        build_project(
+            project, output_dir=str(output_dir), vehicles_root=vehicles_root, overwrite=True,
+            cache_dir=str(tmp_path / "cache"), cancel_token=cancel_token
+        )
+    assert not [name for name in os.listdir(output_dir) if name.endswith(".zip")]
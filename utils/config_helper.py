@@ -200,4 +200,35 @@ def get_beamng_mods_default_paths():
     if not existing_paths and paths:
         return [paths[0]]
 
-    return existing_paths if existing_paths else [os.path.join(home, "Documents")]
\ No newline at end of file
+    return existing_paths if existing_paths else [os.path.join(home, "Documents")]
+
+def get_cache_dir(name=None):
+    """
+    Get the per-user cache directory for BeamSkin Studio.
+    Cross-platform implementation; the folder is created if needed.
+
+    Args:
+        name: Optional subfolder inside the cache directory
+
+    Returns:
+        Path to the cache directory
+    """
+    system = platform.system()
+    home = os.path.expanduser("~")
+
+    if system == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local")
+        cache_dir = os.path.join(base, "BeamSkinStudio", "cache")
+
+    elif system == "Darwin":
+        cache_dir = os.path.join(home, "Library", "Caches", "BeamSkinStudio")
+
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+        cache_dir = os.path.join(base, "BeamSkinStudio")
+
+    if name:
+        cache_dir = os.path.join(cache_dir, name)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
@@ -26,6 +26,10 @@ def setup_universal_scroll_handler(app):
             if isinstance(current, ctk.CTkScrollableFrame):
                 scrollable_frame = current
                 break
+            if hasattr(current, "scroll_by_wheel"):
+                # Virtual lists scroll themselves
+                current.scroll_by_wheel(-1 if event.num == 4 or event.delta > 0 else 1)
+                return "break"
             try:
                 current = current.master
             except:
@@ -9,6 +9,9 @@ import getpass
 import re
 import json
 
+from core import jbeam
+from core.compression import DEFAULT_PRESET, choose_file_compression
+
 VEHICLE_FOLDER = "vehicles"
 ADDED_VEHICLES_JSON = os.path.join("vehicles", "added_vehicles.json")
 
@@ -37,7 +40,7 @@ def get_beamng_mods_path():
         "mods"
     )
 
-def zip_folder(source_dir, zip_path):
+def zip_folder(source_dir, zip_path, compression_preset=DEFAULT_PRESET):
 
     print(f"[DEBUG] zip_folder called")
     with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
@@ -45,7 +48,8 @@ def zip_folder(source_dir, zip_path):
             for file in files:
                 full_path = os.path.join(root_dir, file)
                 relative_path = os.path.relpath(full_path, source_dir)
-                zipf.write(full_path, relative_path)
+                compress_type, compresslevel = choose_file_compression(full_path, compression_preset)
+                zipf.write(full_path, relative_path, compress_type=compress_type, compresslevel=compresslevel)
 
 def create_vehicle_folders(carid):
     print(f"[DEBUG] create_vehicle_folders called for: {carid}")
@@ -197,35 +201,16 @@ def edit_material_json(source_json_path, target_folder, carid):
 
         target_path = os.path.join(target_folder, output_name)
 
-        with open(source_json_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         try:
-            data = json.loads(content)
-            print(f"[DEBUG] Parsed JSON successfully (standard format)")
-        except json.JSONDecodeError as e:
-            print(f"[DEBUG] Standard JSON parse failed: {e}")
-            print(f"[DEBUG] Attempting to fix JSON5 format (trailing commas, comments)...")
-
-            content = re.sub(r'//[^\n]*', '', content)
-
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
-
-            try:
-                data = json.loads(content)
-                print(f"[DEBUG] Successfully parsed after JSON5 fixes")
-            except json.JSONDecodeError as e2:
-                print(f"[ERROR] Still cannot parse JSON after fixes: {e2}")
-                print(f"[DEBUG] Falling back to direct copy without validation...")
-
-                with open(source_json_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"[DEBUG] Copied file directly (BeamNG will parse it)")
-                return True
+            data = jbeam.load_file(source_json_path)
+            print(f"[DEBUG] Parsed material file successfully")
+        except jbeam.JBeamDecodeError as e:
+            print(f"[ERROR] Cannot parse material file: {e}")
+            print(f"[DEBUG] Falling back to direct copy without validation...")
+
+            shutil.copyfile(source_json_path, target_path)
+            print(f"[DEBUG] Copied file directly (BeamNG will parse it)")
+            return True
 
         skin_pattern_prefixes = [
             f"{carid}",
@@ -737,7 +722,8 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
             try:
 
                 with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                    document = jbeam.JBeamDocument(f.read())
+                data = document.data
 
                 for material_key, material_data in data.items():
                     if not isinstance(material_data, dict):
@@ -784,7 +770,7 @@ def process_json_files(folder_path, vehicle_id, skin_folder_name, dds_filename,
                                 print(f"[DEBUG]     Added Stage 2 baseColorMap: {new_path}")
 
                 with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.write(document.dumps())
 
                 print(f"[DEBUG]   Successfully processed: {file_path}")
 